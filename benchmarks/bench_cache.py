@@ -0,0 +1,49 @@
+# bench_cache.py
+
+# Time per submission when the same programs are compiled over and over:
+# without a cache, with the in-memory tier, and from the disk tier alone
+# (a fresh memory tier, as after a service restart).
+# Usage: python benchmarks/bench_cache.py [submissions]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.cache import CompileCache
+from easypysie.compiler import Compiler
+from programs import mixed_program
+
+def run(compiler, sources, submissions):
+    """
+    Compile and run `submissions` programs cycling through sources; return elapsed seconds.
+    """
+    start = time.perf_counter()
+    for i in range(submissions):
+        result = compiler.compile_code(sources[i % len(sources)])
+        if not result.startswith("Compilation succeeded"):
+            raise RuntimeError(result)
+    return time.perf_counter() - start
+
+def main():
+    submissions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    # A handful of distinct submissions, each resubmitted many times.
+    sources = [mixed_program(40 + i) for i in range(8)]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        rows = [("no cache", Compiler())]
+        warm = Compiler(CompileCache(cache_dir=cache_dir))
+        rows.append(("memory LRU", warm))
+        for name, compiler in rows:
+            elapsed = run(compiler, sources, submissions)
+            print(f"{name:>10}: {elapsed * 1000:8.1f} ms  {elapsed / submissions * 1e6:8.1f} us/submission")
+        print(f"{'':>10}  {warm.cache.stats()}")
+
+        cold = Compiler(CompileCache(cache_dir=cache_dir))
+        elapsed = run(cold, sources, len(sources))
+        print(f"{'disk tier':>10}: {elapsed * 1000:8.1f} ms  {elapsed / len(sources) * 1e6:8.1f} us/submission")
+        print(f"{'':>10}  {cold.cache.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# bench_cold_start.py
+
+# Cold start of a fresh interpreter, as paid by every short-lived worker
+# process: time to import the compiler package, time for the first compile
+# and run, and whole-process wall time. Also checks that importing wrote
+# nothing into the package directory (no parsetab.py, lextab.py or parser.out).
+# Usage: python benchmarks/bench_cold_start.py [processes]
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import time
+start = time.perf_counter()
+import easypysie.compiler as compiler
+imported = time.perf_counter()
+output = compiler.compile_code('x is 0; repeat 10 { x is x + 1; } say(x);')
+compiled = time.perf_counter()
+import json, sys
+assert output.endswith("10\\n"), output
+print(json.dumps({"import": imported - start, "first_compile": compiled - imported,
+                  "tkinter": "tkinter" in sys.modules}), file=sys.stderr)
+"""
+
+def package_files():
+    directory = os.path.join(ROOT, "easypysie")
+    return {name: os.stat(os.path.join(directory, name)).st_mtime_ns
+            for name in os.listdir(directory) if not name.startswith("__pycache__")}
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    before = package_files()
+    samples = []
+    for _ in range(processes):
+        start = time.perf_counter()
+        child = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - start
+        sample = json.loads(child.stderr.strip().splitlines()[-1])
+        sample["wall"] = wall
+        samples.append(sample)
+    for key in ("import", "first_compile", "wall"):
+        values = [sample[key] for sample in samples]
+        print(f"{key:14s} median {statistics.median(values) * 1000:7.1f} ms  min {min(values) * 1000:7.1f} ms")
+    print(f"tkinter imported: {any(sample['tkinter'] for sample in samples)}")
+    print(f"files written into the package: {sorted(set(package_files().items()) - set(before.items())) or 'none'}")
+
+if __name__ == "__main__":
+    main()
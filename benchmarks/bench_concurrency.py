@@ -0,0 +1,50 @@
+# bench_concurrency.py
+
+# Compile throughput of independent Compiler sessions across thread and process pools.
+# Threads share the GIL, so they show correctness under concurrency rather than speedup;
+# the process pool is where throughput scales with the number of CPUs.
+# Usage: python benchmarks/bench_concurrency.py [jobs] [statements]
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.compiler import Compiler
+from programs import mixed_program
+
+def compile_one(source_code):
+    """
+    Compile and run one program in its own session.
+    """
+    return Compiler().compile_code(source_code)
+
+def run_pool(executor_cls, workers, sources):
+    """
+    Compile every source on a pool and return (elapsed seconds, outputs).
+    """
+    start = time.perf_counter()
+    with executor_cls(max_workers=workers) as pool:
+        outputs = list(pool.map(compile_one, sources))
+    return time.perf_counter() - start, outputs
+
+def main():
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    statements = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    sources = [mixed_program(statements + i % 7) for i in range(jobs)]
+    _, expected = run_pool(ThreadPoolExecutor, 1, sources)
+
+    print(f"{jobs} programs of ~{statements} statements, {os.cpu_count()} CPUs")
+    for name, executor_cls in (("threads", ThreadPoolExecutor), ("processes", ProcessPoolExecutor)):
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            elapsed, outputs = run_pool(executor_cls, workers, sources)
+            if outputs != expected:
+                raise SystemExit(f"{name} x{workers}: outputs differ from the sequential run")
+            baseline = baseline or elapsed
+            print(f"{name:>9} x{workers}: {jobs / elapsed:8.1f} programs/s  speedup {baseline / elapsed:4.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# bench_emulator.py
+
+# Emulated cycles of the assembly backend's stages (every value in memory,
+# after register allocation, after the peephole pass) for loop- and call-heavy
+# programs, checked against the output of the Python backend. Also reports the
+# emulator's own speed.
+# Usage: python benchmarks/bench_emulator.py [iterations] [registers]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from easypysie.assembly import select, peephole
+from easypysie.emulator import run_assembly
+from easypysie.runtime_io import OutputSink
+from programs import arithmetic_loop, numeric_loops
+from bench_vm import call_loop
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    registers = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    parser = new_parser()
+    programs = (("keep loop", arithmetic_loop(iterations)),
+                ("repeat+keep", numeric_loops(iterations)),
+                ("calls", call_loop(iterations)))
+    for program_name, source in programs:
+        ast = parser.parse(tokenfunc=tokenize(source).token)
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        _, ir_code = generate_ir(ast, analyzer.node_types, analyzer.frames)
+        ir_code, _ = optimize(ir_code, 1)
+        sink = OutputSink()
+        exec(compile(generate_code(ir_code, True), "<easypysie>", "exec"), {"print": sink.print})
+        expected = sink.getvalue()
+
+        allocated = select(ir_code, registers - 1, registers - 1)
+        stages = (("in memory", select(ir_code, 0, registers - 1)),
+                  (f"{registers} registers", allocated),
+                  ("peephole", peephole(list(allocated))))
+        print(f"== {program_name} x{iterations}")
+        for stage_name, code in stages:
+            start = time.perf_counter()
+            report = run_assembly(code, max_steps=10 ** 9, print_function=lambda value: None)
+            elapsed = time.perf_counter() - start
+            status = "ok" if report.output == expected else f"MISMATCH {report.output!r} != {expected!r}"
+            print(f"  {stage_name:>12}: {report.cycles:9d} cycles  {report.steps:8d} instructions  "
+                  f"CPI {report.cycles / report.steps:4.2f}  emulated in {elapsed * 1000:7.1f} ms  {status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# bench_fast_locals.py
+
+# Runtime of tight keep/repeat loops with the generated program run as module
+# code (every variable is a global dictionary entry) and wrapped in __main__()
+# (variables and temporaries are fast locals).
+# Usage: python benchmarks/bench_fast_locals.py [iterations]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from programs import arithmetic_loop, numeric_loops
+
+def build(ast, node_types, wrap_main):
+    """
+    Compile the AST to a Python code object with or without the __main__ wrapper.
+    """
+    _, ir_code = generate_ir(ast, node_types)
+    ir_code, _ = optimize(ir_code, 1)
+    return compile(generate_code(ir_code, wrap_main), "<easypysie>", "exec")
+
+def run(code):
+    """
+    Execute a compiled program and return (elapsed seconds, printed output).
+    """
+    output = []
+    start = time.perf_counter()
+    exec(code, {"print": output.append})
+    return time.perf_counter() - start, output
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    parser = new_parser()
+    for program_name, source in (("keep loop", arithmetic_loop(iterations)), ("repeat+keep", numeric_loops(iterations))):
+        ast = parser.parse(tokenfunc=tokenize(source).token)
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        timings = {}
+        for mode, wrap_main in (("globals", False), ("__main__", True)):
+            elapsed, output = run(build(ast, analyzer.node_types, wrap_main))
+            timings[mode] = elapsed
+            print(f"{program_name:>11} {mode:>8} x{iterations}: {elapsed * 1000:8.1f} ms  "
+                  f"{elapsed / iterations * 1e9:7.1f} ns/iter  result {output}")
+        print(f"{program_name:>11} speedup: {timings['globals'] / timings['__main__']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# bench_input.py
+
+# Auto-grading one program that calls ask() against many input vectors with
+# scripted input, headless: runs per second and cost per prompt. With a
+# display, also times the dialog provider's shared hidden root against
+# creating and destroying a Tk root per prompt (dialogs themselves are not shown).
+# Usage: python benchmarks/bench_input.py [vectors]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.compiler import Compiler, default_cache
+from easypysie.runtime_io import ScriptedInput
+
+PROGRAM = """
+name is ask("Name?");
+age is ask("Age?");
+check (age == "10") { say("Hi " + name + ", you are ten!"); } otherwise { say("Hi " + name); }
+"""
+
+def grade(vectors):
+    compiler = Compiler(default_cache)
+    outputs = []
+    for answers in vectors:
+        outputs.append(compiler.compile_code(PROGRAM, input_function=ScriptedInput(answers)))
+    return outputs
+
+def root_costs(prompts):
+    """
+    Time creating a hidden Tk root per prompt against reusing one, or None without a display.
+    """
+    try:
+        import tkinter as tk
+        start = time.perf_counter()
+        for _ in range(prompts):
+            root = tk.Tk()
+            root.withdraw()
+            root.destroy()
+        per_prompt = (time.perf_counter() - start) / prompts
+    except Exception:
+        return None
+    start = time.perf_counter()
+    root = tk.Tk()
+    root.withdraw()
+    for _ in range(prompts):
+        root.update_idletasks()
+    root.destroy()
+    return per_prompt, (time.perf_counter() - start) / prompts
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    vectors = [(f"kid{i}", str(i % 12)) for i in range(count)]
+    grade(vectors[:1])  # Warm the compile cache.
+    start = time.perf_counter()
+    outputs = grade(vectors)
+    elapsed = time.perf_counter() - start
+    ten = sum(1 for output in outputs if "you are ten" in output)
+    print(f"scripted input: {count} input vectors in {elapsed * 1000:.1f} ms, {count / elapsed:,.0f} runs/s, "
+          f"{elapsed / (2 * count) * 1e6:.1f} us per prompt ({ten} matched the ten-year-old branch)")
+    costs = root_costs(50)
+    if costs is None:
+        print("dialog provider: skipped, no display")
+    else:
+        print(f"dialog provider: new Tk root per prompt {costs[0] * 1000:.2f} ms, shared root {costs[1] * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    main()
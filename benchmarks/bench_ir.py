@@ -0,0 +1,46 @@
+# bench_ir.py
+
+# IR emission cost per statement for flat programs and deeply nested loops.
+# With a single builder buffer the per-statement cost should stay flat as programs grow.
+# Usage: python benchmarks/bench_ir.py [max_statements]
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.ir_generator import generate_ir
+from programs import flat_program, nested_loops
+
+def time_ir(parser, source_code, statements):
+    """
+    Parse the source, then time IR generation alone.
+    """
+    ast = parser.parse(tokenfunc=tokenize(source_code).token)
+    # Keep the cyclic collector's scans of the large AST out of the measurement.
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    _, ir_code = generate_ir(ast)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return f"{statements:7d} stmts {len(ir_code):8d} instrs {elapsed * 1000:9.2f} ms  {elapsed / statements * 1e6:6.2f} us/stmt"
+
+def main():
+    max_statements = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    parser = new_parser()
+    print("flat:")
+    statements = 1000
+    while statements <= max_statements:
+        print("  " + time_ir(parser, flat_program(statements), statements))
+        statements *= 10
+    print("nested (10 statements per level):")
+    for depth in (10, 50, 200, 400):
+        print(f"  depth {depth:3d} " + time_ir(parser, nested_loops(depth, 10), depth * 10))
+
+if __name__ == "__main__":
+    main()
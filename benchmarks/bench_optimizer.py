@@ -0,0 +1,48 @@
+# bench_optimizer.py
+
+# Runtime of the generated Python for an arithmetic loop at each optimization level.
+# Usage: python benchmarks/bench_optimizer.py [iterations]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from programs import arithmetic_loop
+
+def build(source_code, level):
+    """
+    Compile the source to Python at the given optimization level.
+    Returns (python code object, pass statistics).
+    """
+    ast = new_parser().parse(tokenfunc=tokenize(source_code).token)
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    _, ir_code = generate_ir(ast, analyzer.node_types)
+    ir_code, stats = optimize(ir_code, level)
+    return compile(generate_code(ir_code), "<easypysie>", "exec"), stats
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    source_code = arithmetic_loop(iterations)
+    baseline = None
+    for level in (0, 1, 2):
+        code, stats = build(source_code, level)
+        output = []
+        start = time.perf_counter()
+        exec(code, {"print": output.append})
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        removed = sum(entry.removed for entry in stats)
+        print(f"O{level}: {elapsed * 1000:8.1f} ms  speedup {baseline / elapsed:4.2f}  "
+              f"{removed:3d} instructions removed  output {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# bench_output.py
+
+# Throughput, in lines per second, and peak memory of a chatty program's
+# output: the old capture (print() redirected into an unbounded StringIO)
+# against an OutputSink, alone and streaming to a file or a GUI-style queue.
+# Usage: python benchmarks/bench_output.py [lines]
+
+import io
+import os
+import queue
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from easypysie.runtime_io import OutputSink, file_consumer
+
+def build(source):
+    """
+    Compile EasyPysie source to a Python code object.
+    """
+    ast = new_parser().parse(tokenfunc=tokenize(source).token)
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    _, ir_code = generate_ir(ast, analyzer.node_types, analyzer.frames)
+    ir_code, _ = optimize(ir_code, 1)
+    return compile(generate_code(ir_code, True), "<easypysie>", "exec")
+
+def string_io_print():
+    """
+    The previous capture: every print() goes through the builtin into a StringIO.
+    """
+    captured_output = io.StringIO()
+
+    def program_print(*args, **kwargs):
+        kwargs.setdefault("file", captured_output)
+        print(*args, **kwargs)
+    return program_print, captured_output.getvalue
+
+def sink_print(*consumers):
+    sink = OutputSink(consumers=consumers)
+    return sink.print, sink.getvalue
+
+def measure(code, make_print, trace):
+    program_print, getvalue = make_print()
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    exec(code, {"print": program_print})
+    text = getvalue()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, len(text), peak
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    code = build(f'i is 0; repeat {lines} {{ say("line number " + i); i is i + 1; }}')
+    devnull = open(os.devnull, "w")
+    gui_queue = queue.Queue()
+    variants = [
+        ("StringIO (old)", string_io_print),
+        ("OutputSink", sink_print),
+        ("OutputSink -> file", lambda: sink_print(file_consumer(devnull))),
+        ("OutputSink -> GUI queue", lambda: sink_print(gui_queue.put)),
+    ]
+    for name, make_print in variants:
+        elapsed, kept, _ = measure(code, make_print, False)
+        _, _, peak = measure(code, make_print, True)
+        print(f"{name:24s} {lines / elapsed:12,.0f} lines/s  kept {kept:>10,} chars  peak {peak / 1e6:7.1f} MB")
+        while not gui_queue.empty():
+            gui_queue.get()
+    devnull.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# bench_profiler.py
+
+# Overhead of the line profiler: run time of loop-heavy and call-heavy
+# programs without the profiler, and under each profiler back end available
+# on this interpreter (sys.monitoring on Python 3.12+, sys.settrace everywhere).
+# Usage: python benchmarks/bench_profiler.py [iterations] [rounds]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.compiler import Compiler, execute_code
+from easypysie.profiler import Profiler
+from easypysie.runtime_io import OutputSink
+from programs import numeric_loops, helper_chain
+
+def best_time(code, source_map, backend, rounds):
+    best = None
+    for _ in range(rounds):
+        profiler = None if backend is None else Profiler(source_map, use_monitoring=backend == "monitoring")
+        start = time.perf_counter()
+        output = execute_code(code, lambda prompt="": "", OutputSink(), source_map, profiler)
+        elapsed = time.perf_counter() - start
+        assert output.startswith("Compilation succeeded!"), output
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    backends = [None, "settrace"] + (["monitoring"] if hasattr(sys, "monitoring") else [])
+    programs = [
+        ("loops", numeric_loops(iterations)),
+        ("calls", helper_chain(14)),
+    ]
+    for name, source in programs:
+        result = Compiler().compile(source)
+        assert result.ok, result.diagnostics
+        base = None
+        for backend in backends:
+            seconds = best_time(result.code_object, result.source_map, backend, rounds)
+            base = base or seconds
+            print(f"{name:6s} {backend or 'off':11s} {seconds * 1000:9.1f} ms  {seconds / base:5.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# bench_regalloc.py
+
+# Static instruction and memory-traffic counts of the assembly backend for
+# the benchmark programs: every value in memory (before allocation), after
+# linear-scan allocation with different register file sizes, and after the
+# peephole pass. Also times the backend itself.
+# Usage: python benchmarks/bench_regalloc.py [statements]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.assembly import compile_assembly
+from programs import mixed_program, arithmetic_loop, helper_chain
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    parser = new_parser()
+    programs = (("mixed", mixed_program(statements)),
+                ("keep loop", arithmetic_loop(1000)),
+                ("calls", helper_chain(20)))
+    for program_name, source in programs:
+        ast = parser.parse(tokenfunc=tokenize(source).token)
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        _, ir_code = generate_ir(ast, analyzer.node_types, analyzer.frames)
+        ir_code, _ = optimize(ir_code, 1)
+        print(f"== {program_name} ({len(ir_code)} IR instructions)")
+        for registers in (2, 4, 8):
+            start = time.perf_counter()
+            program = compile_assembly(ir_code, registers)
+            elapsed = time.perf_counter() - start
+            if registers == 2:
+                print(f"  {program.stats[0]}")
+            for stats in program.stats[1:]:
+                print(f"  {stats}")
+            print(f"  backend time: {elapsed * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
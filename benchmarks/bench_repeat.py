@@ -0,0 +1,92 @@
+# bench_repeat.py
+
+# Runtime of nested repeat loops lowered the old way (a counter temp compared,
+# incremented and jumped on every iteration, generated as a Python while loop)
+# and as REPEAT/LOOP counted loops generated as `for _ in range(count)`.
+# Usage: python benchmarks/bench_repeat.py [iterations]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir import Op, Const
+from easypysie.ir_generator import IRGenerator
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+
+class CounterRepeatGenerator(IRGenerator):
+    """
+    IR generator that lowers repeat loops to an explicit counter, as before REPEAT/LOOP existed.
+    """
+    def generate(self, node):
+        if node[0] != 'repeat':
+            return super().generate(node)
+        emit = self.builder.emit
+        count_result = self.generate(node[1])
+        loop_counter = self.new_temp()
+        emit(Op.COPY, loop_counter, Const(0))
+        start_label = self.new_label()
+        end_label = self.new_label()
+        condition_temp = self.new_temp()
+        emit(Op.LABEL, a=start_label)
+        emit(Op.LT, condition_temp, loop_counter, count_result)
+        emit(Op.IF_FALSE, a=condition_temp, b=end_label)
+        self.generate_block(node[2])
+        emit(Op.ADD, loop_counter, loop_counter, Const(1))
+        emit(Op.GOTO, a=start_label)
+        emit(Op.LABEL, a=end_label)
+        return None
+
+def repeat_program(iterations):
+    """
+    Build two nested repeat loops running the innermost body `iterations` times.
+    """
+    outer = max(1, iterations // 100)
+    return f"""
+total is 0;
+repeat {outer} {{
+    repeat 100 {{
+        total is total + 1;
+    }}
+}}
+say(total);
+"""
+
+def build(generator_class, ast, node_types):
+    """
+    Compile the AST to a Python code object with the given IR generator.
+    """
+    generator = generator_class(node_types=node_types)
+    generator.generate(ast)
+    ir_code, _ = optimize(generator.builder.code, 1)
+    return compile(generate_code(ir_code), "<easypysie>", "exec")
+
+def run(code):
+    """
+    Execute a compiled program and return (elapsed seconds, printed output).
+    """
+    output = []
+    start = time.perf_counter()
+    exec(code, {"print": output.append})
+    return time.perf_counter() - start, output
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    iterations = max(100, iterations // 100 * 100)
+    ast = new_parser().parse(tokenfunc=tokenize(repeat_program(iterations)).token)
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    timings = {}
+    for name, generator_class in (("counter while", CounterRepeatGenerator), ("range for", IRGenerator)):
+        elapsed, output = run(build(generator_class, ast, analyzer.node_types))
+        timings[name] = elapsed
+        print(f"{name:>13} x{iterations}: {elapsed * 1000:8.1f} ms  {elapsed / iterations * 1e9:7.1f} ns/iter  result {output}")
+    print(f"speedup: {timings['counter while'] / timings['range for']:.2f}x")
+
+if __name__ == "__main__":
+    main()
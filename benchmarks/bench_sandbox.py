@@ -0,0 +1,58 @@
+# bench_sandbox.py
+
+# Throughput of grading a batch of compiled submissions in the sandbox pool
+# with different numbers of workers, when a few submissions never terminate.
+# Also shows the per-job overhead against running in-process with exec.
+# Usage: python benchmarks/bench_sandbox.py [submissions] [runaway]
+
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from easypysie.sandbox import SandboxPool
+from programs import mixed_program, numeric_loops
+
+def build(source):
+    """
+    Compile EasyPysie source to a Python code object.
+    """
+    ast = new_parser().parse(tokenfunc=tokenize(source).token)
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    _, ir_code = generate_ir(ast, analyzer.node_types, analyzer.frames)
+    ir_code, _ = optimize(ir_code, 1)
+    return compile(generate_code(ir_code, True), "<easypysie>", "exec")
+
+def main():
+    submissions = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    runaway = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    good = [build(mixed_program(60)), build(numeric_loops(20000))]
+    bad = build("x is 0; keep (1 > 0) { x is x + 1; }")
+    batch = [good[i % len(good)] for i in range(submissions - runaway)] + [bad] * runaway
+
+    start = time.perf_counter()
+    for code in batch[:submissions - runaway]:
+        exec(code, {"print": lambda *args: None})
+    in_process = time.perf_counter() - start
+    print(f"in-process exec, {submissions - runaway} terminating jobs: {in_process * 1000:8.1f} ms "
+          f"(the {runaway} runaway jobs would never finish)")
+
+    for workers in (1, 2, 4, 8):
+        with SandboxPool(workers=workers, cpu_seconds=1, wall_seconds=3) as pool:
+            start = time.perf_counter()
+            results = pool.map(batch)
+            elapsed = time.perf_counter() - start
+        statuses = Counter(result.status for result in results)
+        print(f"pool of {workers}: {elapsed * 1000:8.1f} ms  {submissions / elapsed:7.1f} jobs/s  {dict(statuses)}")
+
+if __name__ == "__main__":
+    main()
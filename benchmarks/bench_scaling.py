@@ -0,0 +1,186 @@
+# bench_scaling.py
+
+# Scaling benchmark: grows synthetic programs along one axis at a time
+# (statement count, expression depth, loop nesting, functions, call-chain
+# depth, say volume), times every phase of the pipeline plus execution, and
+# estimates how each phase grows with the axis. Results can be written as
+# JSON and compared against a stored baseline to flag regressions.
+# Usage:
+#   python benchmarks/bench_scaling.py [--axis NAME ...] [--rounds N] [--max-seconds S] [--json results.json]
+#   python benchmarks/bench_scaling.py --compare baseline.json [--threshold 1.25]
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.compiler import Compiler
+from easypysie.result import PHASES
+from programs import scalable_program
+
+# Sizes swept along each axis; the other axes keep scalable_program()'s defaults.
+# Every axis is also measured at zero, the base that growth() subtracts.
+# Statements reach 10k so that quadratic phases stand out from the constant costs.
+AXES = {
+    "statements": [100, 400, 1600, 5000, 10000],
+    "expression_depth": [4, 8, 16, 32],
+    "loop_nesting": [2, 4, 6, 8],
+    "functions": [10, 20, 40, 80],
+    "call_depth": [5, 10, 20, 40],
+    "says": [1000, 2000, 4000, 8000],
+}
+
+# Growth exponents above this are reported as superlinear.
+SUPERLINEAR = 1.3
+
+# Times (and differences of times) below this many seconds are too noisy to compare.
+MIN_COMPARE_SECONDS = 0.0005
+
+# Default wall-clock cap on measuring one point of an axis (see run()).
+MAX_POINT_SECONDS = 30.0
+
+def measure(source, rounds, target, max_seconds=None):
+    """
+    Compile and run a program `rounds` times without a cache, or fewer once
+    max_seconds have passed (it always runs once).
+    Returns the fastest time of every phase and the token count.
+    """
+    best = {}
+    tokens = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if best and max_seconds is not None and time.perf_counter() - start > max_seconds:
+            break
+        result = Compiler().compile(source, target, input_function=lambda prompt="": "")
+        if not result.ok:
+            raise RuntimeError(f"Benchmark program failed: {result.diagnostics}")
+        tokens = len(result.tokens)
+        for name, stats in result.phases.items():
+            best[name] = min(best.get(name, stats.seconds), stats.seconds)
+    best["total"] = sum(best.values())
+    return best, tokens
+
+def growth(base, points):
+    """
+    Estimate k in time = base + b * size**k by a least-squares fit of log(time - base)
+    against log(size), where base is the time with the axis at zero: about 1 for linear
+    growth, 2 for quadratic. Points whose size-dependent part is too small to measure
+    are skipped; returns None when fewer than two remain.
+    """
+    points = [(math.log(size), math.log(seconds - base)) for size, seconds in points
+              if seconds - base >= MIN_COMPARE_SECONDS]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+def run(axes, rounds, target, max_seconds=MAX_POINT_SECONDS):
+    """
+    Sweep every axis. A point whose measurement takes longer than max_seconds
+    ends its axis: the larger sizes are skipped and listed under "skipped".
+    """
+    results = {"python": platform.python_version(), "target": target, "rounds": rounds,
+               "max_seconds": max_seconds, "axes": {}}
+    for axis in axes:
+        samples = []
+        skipped = []
+        base, _ = measure(scalable_program(**{axis: 0}), rounds, target, max_seconds)
+        for size in AXES[axis]:
+            if skipped or (samples and samples[-1]["seconds"] > max_seconds):
+                skipped.append(size)
+                continue
+            source = scalable_program(**{axis: size})
+            start = time.perf_counter()
+            phases, tokens = measure(source, rounds, target, max_seconds)
+            seconds = time.perf_counter() - start
+            samples.append({"size": size, "chars": len(source), "tokens": tokens, "phases": phases, "seconds": seconds})
+            print(f"{axis:16s} {size:6d}  {tokens:7d} tokens  total {phases['total'] * 1000:9.2f} ms  "
+                  f"(measured in {seconds:.1f} s)", file=sys.stderr)
+        if skipped:
+            print(f"{axis:16s} skipped {skipped}: the last point took over {max_seconds:g} s", file=sys.stderr)
+        exponents = {}
+        for phase in [*PHASES, "total"]:
+            points = [(sample["size"], sample["phases"][phase]) for sample in samples if phase in sample["phases"]]
+            exponents[phase] = growth(base.get(phase, 0.0), points)
+        results["axes"][axis] = {"base": base, "samples": samples, "growth": exponents, "skipped": skipped}
+    return results
+
+def report(results):
+    for axis, data in results["axes"].items():
+        samples = data["samples"]
+        phases = [phase for phase in [*PHASES, "total"] if phase in samples[0]["phases"]]
+        print(f"\n{axis}")
+        print(f"{'size':>8s}" + "".join(f"{phase:>11s}" for phase in phases))
+        for sample in samples:
+            print(f"{sample['size']:8d}" + "".join(f"{sample['phases'][phase] * 1000:9.2f}ms" for phase in phases))
+        row = []
+        for phase in phases:
+            exponent = data["growth"][phase]
+            row.append(f"{'-' if exponent is None else f'{exponent:.2f}':>10s}{'!' if exponent and exponent > SUPERLINEAR else ' '}")
+        print(f"{'growth':>8s}" + "".join(row))
+        if data.get("skipped"):
+            print(f"{'skipped':>8s}  sizes {', '.join(map(str, data['skipped']))} (over the time cap)")
+    flagged = [(axis, phase, exponent) for axis, data in results["axes"].items()
+               for phase, exponent in data["growth"].items()
+               if phase != "total" and exponent is not None and exponent > SUPERLINEAR]
+    if flagged:
+        print(f"\nSuperlinear phases (growth exponent > {SUPERLINEAR}):")
+        for axis, phase, exponent in flagged:
+            print(f"  {phase} along {axis}: ~size^{exponent:.2f}")
+
+def compare(results, baseline, threshold):
+    """
+    Print every phase that got slower than the baseline by more than `threshold` times.
+    Returns the number of regressions.
+    """
+    regressions = 0
+    for axis, data in results["axes"].items():
+        base_samples = {sample["size"]: sample for sample in baseline.get("axes", {}).get(axis, {}).get("samples", [])}
+        for sample in data["samples"]:
+            base = base_samples.get(sample["size"])
+            if base is None:
+                continue
+            for phase, seconds in sample["phases"].items():
+                base_seconds = base["phases"].get(phase)
+                if base_seconds is None or max(seconds, base_seconds) < MIN_COMPARE_SECONDS:
+                    continue
+                ratio = seconds / base_seconds
+                if ratio > threshold:
+                    regressions += 1
+                    print(f"REGRESSION {axis}={sample['size']} {phase}: "
+                          f"{base_seconds * 1000:.2f} ms -> {seconds * 1000:.2f} ms ({ratio:.2f}x)")
+    print(f"\n{regressions} regression(s) beyond {threshold:.2f}x against the baseline")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the EasyPysie pipeline.")
+    parser.add_argument("--axis", action="append", choices=sorted(AXES), help="axis to sweep (default: all)")
+    parser.add_argument("--rounds", type=int, default=3, help="runs per program; the fastest counts")
+    parser.add_argument("--target", default="python", choices=["python", "assembly", "vm"])
+    parser.add_argument("--max-seconds", type=float, default=MAX_POINT_SECONDS,
+                        help="time cap per point; an axis stops at the first point that exceeds it")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = run(args.axis or list(AXES), args.rounds, args.target, args.max_seconds)
+    report(results)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# bench_semantic.py
+
+# Semantic analysis time for helper chains where every function calls the previous one twice.
+# Without call memoization the work doubles with each level of the chain.
+# Usage: python benchmarks/bench_semantic.py [max_depth]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from programs import helper_chain
+
+def main():
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    parser = new_parser()
+    depth = 25
+    while depth <= max_depth:
+        stream = tokenize(helper_chain(depth))
+        ast = parser.parse(tokenfunc=stream.token)
+        start = time.perf_counter()
+        SemanticAnalyzer().analyze(ast)
+        elapsed = time.perf_counter() - start
+        print(f"depth {depth:5d}: {elapsed * 1000:8.2f} ms  ({elapsed / depth * 1e6:6.1f} us per function)")
+        depth *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# bench_ui_latency.py
+
+# Responsiveness of the GUI thread while a background CompileJob runs a
+# 10-million-iteration repeat. The main thread plays the Tk event loop: it
+# wakes every frame and records how late each wake-up is. The job is then
+# stopped, and the time until its thread has actually exited is reported.
+# Usage: python benchmarks/bench_ui_latency.py [iterations] [seconds]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.jobs import CompileJob, CANCELLED
+
+# Target frame interval of the simulated event loop.
+FRAME_SECONDS = 0.016
+
+def frame_latencies(job, seconds):
+    """
+    Wake every frame for up to `seconds` while the job runs and return how late each wake-up was.
+    """
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while job.thread.is_alive() and time.perf_counter() < deadline:
+        expected = time.perf_counter() + FRAME_SECONDS
+        time.sleep(FRAME_SECONDS)
+        latencies.append(time.perf_counter() - expected)
+    return latencies
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    source = (f"total is 0; repeat {iterations} {{ x is total * 3 - 1; "
+              f"check (x > total) {{ total is total + 1; }} otherwise {{ total is total - 1; }} }} say(total);")
+
+    job = CompileJob(source).start()
+    latencies = sorted(frame_latencies(job, seconds))
+    stop_start = time.perf_counter()
+    job.cancel()
+    job.thread.join()
+    stopped = time.perf_counter() - stop_start
+    status, output = job.events.get()
+
+    if latencies:
+        print(f"{len(latencies)} frames while running: median {latencies[len(latencies) // 2] * 1000:6.2f} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.2f} ms  max {latencies[-1] * 1000:6.2f} ms late")
+    if status == CANCELLED:
+        print(f"stopped after {job.elapsed:.2f} s; the job thread exited {stopped * 1000:.2f} ms after cancel()")
+    else:
+        print(f"the job finished in {job.elapsed:.2f} s before it could be stopped: {output.splitlines()[-1]!r}")
+
+if __name__ == "__main__":
+    main()
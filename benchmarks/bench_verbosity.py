@@ -0,0 +1,42 @@
+# bench_verbosity.py
+
+# Cost of the pipeline dumps: compile time of a large program when quiet
+# (the default), with the phase summary only, and with every artifact dumped
+# to a file. Also prints the quiet compile's per-phase breakdown.
+# Usage: python benchmarks/bench_verbosity.py [statements] [rounds]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.compiler import Compiler
+from easypysie.result import console_trace
+from programs import mixed_program
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    source = mixed_program(statements)
+    compiler = Compiler()
+    with open(os.devnull, "w") as devnull:
+        traces = [
+            ("quiet", None),
+            ("verbosity 1", console_trace(1, file=devnull)),
+            ("verbosity 2", console_trace(2, file=devnull)),
+        ]
+        for name, trace in traces:
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter()
+                result = compiler.compile(source, trace=trace)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            assert result.ok, result.diagnostics
+            print(f"{name:12s} {best * 1000:9.1f} ms")
+    print(f"\nphases of a quiet compile of {statements} statements:")
+    print(compiler.compile(source).summary())
+
+if __name__ == "__main__":
+    main()
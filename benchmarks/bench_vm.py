@@ -0,0 +1,83 @@
+# bench_vm.py
+
+# Runtime of loop-heavy and call-heavy programs on the two execution engines:
+# generated Python source run with exec, and the IR virtual machine.
+# Load/compile time is reported separately from run time.
+# Usage: python benchmarks/bench_vm.py [iterations]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easypysie.lexer import tokenize
+from easypysie.parser import new_parser
+from easypysie.semantic import SemanticAnalyzer
+from easypysie.ir_generator import generate_ir
+from easypysie.optimizer import optimize
+from easypysie.code_generator import generate_code
+from easypysie.vm import load_program, VirtualMachine
+from programs import arithmetic_loop, numeric_loops
+
+def call_loop(iterations):
+    """
+    Build a loop that calls small functions on every iteration.
+    """
+    return f"""
+create square(v) {{
+    give v * v;
+}}
+create step(v, k) {{
+    give square(v) - square(k) + 1;
+}}
+total is 0;
+i is 0;
+repeat {iterations} {{
+    total is total + step(i, 2);
+    i is i + 1;
+}}
+say(total);
+"""
+
+def exec_engine(ir_code):
+    """
+    Return (load seconds, run seconds, output) for the exec backend.
+    """
+    start = time.perf_counter()
+    code = compile(generate_code(ir_code, True), "<easypysie>", "exec")
+    loaded = time.perf_counter()
+    output = []
+    exec(code, {"print": output.append})
+    return loaded - start, time.perf_counter() - loaded, output
+
+def vm_engine(ir_code):
+    """
+    Return (load seconds, run seconds, output) for the IR virtual machine.
+    """
+    start = time.perf_counter()
+    program = load_program(ir_code)
+    loaded = time.perf_counter()
+    output = []
+    VirtualMachine(program, budget=10 ** 9, print_function=output.append).run()
+    return loaded - start, time.perf_counter() - loaded, output
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    parser = new_parser()
+    programs = (("keep loop", arithmetic_loop(iterations)),
+                ("repeat+keep", numeric_loops(iterations)),
+                ("calls", call_loop(iterations)))
+    for program_name, source in programs:
+        ast = parser.parse(tokenfunc=tokenize(source).token)
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        _, ir_code = generate_ir(ast, analyzer.node_types)
+        ir_code, _ = optimize(ir_code, 1)
+        for engine_name, engine in (("exec", exec_engine), ("vm", vm_engine)):
+            load, run, output = engine(ir_code)
+            print(f"{program_name:>11} {engine_name:>4} x{iterations}: load {load * 1000:6.2f} ms  "
+                  f"run {run * 1000:8.1f} ms  {run / iterations * 1e9:8.1f} ns/iter  result {output}")
+
+if __name__ == "__main__":
+    main()
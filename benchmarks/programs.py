@@ -0,0 +1,161 @@
+# programs.py
+
+# Small generators for synthetic EasyPysie programs used by the benchmarks.
+
+def mixed_program(statements):
+    """
+    Build a program with roughly the given number of statements, mixing
+    assignments, arithmetic, a function, loops and checks.
+    """
+    lines = [
+        "create scale(v, k) {",
+        "    give v * k + 1;",
+        "}",
+        "total is 0;",
+    ]
+    for i in range(statements):
+        kind = i % 4
+        if kind == 0:
+            lines.append(f"v{i} is {i} * 2 + 3 - 1;")
+        elif kind == 1:
+            lines.append(f"v{i} is scale({i}, 3);")
+        elif kind == 2:
+            lines.append(f"check (total < {i}) {{ total is total + 1; }} otherwise {{ total is total - 1; }}")
+        else:
+            lines.append("repeat 3 { total is total + 2; }")
+    lines.append('say("total: " + total);')
+    return "\n".join(lines) + "\n"
+
+def helper_chain(depth):
+    """
+    Build a chain of functions where each one calls the previous one twice.
+    """
+    lines = [
+        "create f0(x) {",
+        "    give x + 1;",
+        "}",
+    ]
+    for level in range(1, depth + 1):
+        lines.append(f"create f{level}(x) {{")
+        lines.append(f"    give f{level - 1}(x) + f{level - 1}(x + 1);")
+        lines.append("}")
+    lines.append(f"say(f{depth}(1));")
+    return "\n".join(lines) + "\n"
+
+def flat_program(statements):
+    """
+    Build a straight-line program of simple arithmetic assignments.
+    """
+    lines = ["x is 1;"]
+    for i in range(statements):
+        lines.append(f"x is x * 3 + {i} - 2;")
+    return "\n".join(lines) + "\n"
+
+def nested_loops(depth, statements):
+    """
+    Build repeat loops nested to the given depth, with statements at every level.
+    """
+    lines = ["x is 0;"]
+    for level in range(depth):
+        lines.append("repeat 1 {")
+        for i in range(statements):
+            lines.append(f"x is x + {level + i};")
+    lines.extend("}" for _ in range(depth))
+    return "\n".join(lines) + "\n"
+
+def arithmetic_loop(iterations):
+    """
+    Build a keep loop full of constant subexpressions and repeated computations.
+    """
+    return f"""
+total is 0;
+i is {iterations};
+keep (i > 0) {{
+    a is 2 * 3 - 1;
+    b is i * 2 - a;
+    c is i * 2 - a;
+    total is total - b * 1 - c;
+    i is i - 1;
+}}
+say(total);
+"""
+
+def numeric_loops(iterations):
+    """
+    Build numeric repeat and keep loops that add integers on every iteration.
+    """
+    return f"""
+total is 0;
+i is 0;
+repeat {iterations} {{
+    total is total + i + 1;
+    i is i + 1;
+}}
+keep (i > 0) {{
+    total is total + 2;
+    i is i - 1;
+}}
+say(total);
+"""
+
+def nested_expression(depth, operand):
+    """
+    Build an arithmetic expression nested `depth` parentheses deep around `operand`.
+    Multiplications are by 1, so values stay small however deep the nesting goes.
+    """
+    expression = operand
+    for level in range(depth):
+        if level % 3 == 0:
+            expression = f"({expression} + {level + 1})"
+        elif level % 3 == 1:
+            expression = f"({expression} - {level})"
+        else:
+            expression = f"({expression} * 1)"
+    return expression
+
+def scalable_program(statements=50, expression_depth=3, loop_nesting=2, functions=4, call_depth=4, says=10):
+    """
+    Build a program whose size grows independently along several axes:
+    statements   top-level statements (assignments, calls and checks),
+    expression_depth   nesting of every arithmetic expression,
+    loop_nesting   repeat loops nested around one small body (2 iterations each),
+    functions    `create` helpers called from the statements,
+    call_depth   length of a chain of functions that each call the previous one,
+    says         say() calls executed by a final loop.
+    """
+    lines = []
+    for i in range(functions):
+        lines.append(f"create helper{i}(v) {{")
+        lines.append(f"    give {nested_expression(expression_depth, 'v')};")
+        lines.append("}")
+    lines.append("create chain0(x) {")
+    lines.append("    give x + 1;")
+    lines.append("}")
+    for level in range(1, call_depth + 1):
+        lines.append(f"create chain{level}(x) {{")
+        lines.append(f"    give chain{level - 1}(x) + 1;")
+        lines.append("}")
+
+    lines.append("total is 0;")
+    for i in range(statements):
+        kind = i % 4
+        if kind == 0:
+            lines.append(f"v{i} is {nested_expression(expression_depth, 'total')};")
+        elif kind == 1 and functions:
+            lines.append(f"v{i} is helper{i % functions}({i});")
+        elif kind == 2:
+            lines.append(f"check (total < {i}) {{ total is total + 1; }} otherwise {{ total is total - 1; }}")
+        else:
+            lines.append(f"total is total + chain{call_depth}({i % 7});")
+
+    for _ in range(loop_nesting):
+        lines.append("repeat 2 {")
+    lines.append(f"    total is {nested_expression(expression_depth, 'total')};")
+    lines.extend("}" for _ in range(loop_nesting))
+
+    lines.append("line is 0;")
+    lines.append(f"repeat {says} {{")
+    lines.append('    say("line " + line + ": " + total);')
+    lines.append("    line is line + 1;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
@@ -1,19 +1,117 @@
 # Import necessary modules and components.
+import queue
 import tkinter as tk
-from tkinter import scrolledtext
-from compiler import compile_code  # Import the updated compiler
+from tkinter import scrolledtext, ttk
+from easypysie.jobs import CompileJob, INPUT, OUTPUT, STOPPING, CANCELLED  # Compile and run off the Tk thread
+from easypysie.runtime_io import DialogInput, DEFAULT_MAX_CHARS
+
+# How often the main thread checks the running job for input requests, output and results.
+POLL_INTERVAL_MS = 20
+
+# Characters of streamed output the output box keeps while a program runs.
+OUTPUT_MAX_CHARS = DEFAULT_MAX_CHARS
+
+# Background colours of the profile heat map, from cold to hot.
+HEAT_COLORS = ("#fff8e1", "#ffe0b2", "#ffb74d", "#ff8a65", "#e57373")
+
+# The job currently compiling or running, if any.
+job = None
 
 def run_compiler():
     """
-    Compile the source code entered in the UI and display the output.
+    Compile the source code entered in the UI on a background job.
+    The window stays responsive; poll_job() displays the output when it is ready.
+    """
+    global job
+    if job is not None:
+        return
+    # Only trailing whitespace is dropped, so line numbers in errors and profiles match the editor.
+    source_code = source_text.get("1.0", tk.END).rstrip()
+    clear_heat_map()
+    job = CompileJob(source_code, target="python", profile=profile_var.get()).start()
+    run_button.config(state="disabled")
+    stop_button.config(state="normal")
+    progress_bar.start(POLL_INTERVAL_MS)
+    show_output("")
+    root.after(POLL_INTERVAL_MS, poll_job)
+
+def stop_compiler():
+    """
+    Cancel the running job.
+    """
+    if job is not None:
+        job.cancel()
+        stop_button.config(state="disabled")
+
+def poll_job():
+    """
+    Answer the job's input requests and pick up its result. Runs on the Tk thread.
+    """
+    global job
+    while True:
+        try:
+            kind, value = job.events.get_nowait()
+        except queue.Empty:
+            break
+        if kind == INPUT:
+            job.answer(ask_dialog(value))
+            continue
+        if kind == OUTPUT:
+            append_output(value)
+            continue
+        status_label.config(text=f"{'Stopped' if kind == CANCELLED else 'Finished'} after {job.elapsed:.1f} s")
+        show_output(value)
+        if kind != CANCELLED and job.result is not None and job.result.profile is not None:
+            show_profile(job.result.profile)
+        progress_bar.stop()
+        run_button.config(state="normal")
+        stop_button.config(state="disabled")
+        job = None
+        return
+    status_label.config(text=f"{'Stopping' if job.status == STOPPING else 'Running'}... {job.elapsed:.1f} s")
+    root.after(POLL_INTERVAL_MS, poll_job)
+
+def show_output(output):
+    """
+    Replace the contents of the output box.
     """
-    source_code = source_text.get("1.0", tk.END).strip()
-    output = compile_code(source_code, target="python") 
     output_text.config(state="normal")
     output_text.delete("1.0", tk.END)
     output_text.insert(tk.END, output)
     output_text.config(state="disabled")
 
+def append_output(chunk):
+    """
+    Add streamed program output to the output box, dropping its oldest text beyond OUTPUT_MAX_CHARS.
+    """
+    output_text.config(state="normal")
+    output_text.insert(tk.END, chunk)
+    excess = output_text.count("1.0", tk.END, "chars")[0] - OUTPUT_MAX_CHARS
+    if excess > 0:
+        output_text.delete("1.0", f"1.0 + {excess} chars")
+    output_text.config(state="disabled")
+    output_text.see(tk.END)
+
+def show_profile(profile):
+    """
+    Colour every profiled line of the source by its share of the run time and
+    add the profile report below the program output.
+    """
+    source_code = source_text.get("1.0", tk.END).rstrip()
+    # The profile only matches the source if it has not been edited since the run.
+    if source_code == job.source_code:
+        for line, heat in profile.heat().items():
+            tag = f"heat{min(int(heat * len(HEAT_COLORS)), len(HEAT_COLORS) - 1)}"
+            source_text.tag_add(tag, f"{line}.0", f"{line}.end + 1 chars")
+    append_output(f"\n🔥 Profile:\n{profile.report(job.source_code)}\n")
+
+def clear_heat_map():
+    """
+    Remove the profile colours from the source box.
+    """
+    for index in range(len(HEAT_COLORS)):
+        source_text.tag_remove(f"heat{index}", "1.0", tk.END)
+
 def show_commands():
     """
     Display a window with a list of kid-friendly commands.
@@ -69,6 +167,9 @@ root.title("EasyPysie Compiler - Kid Edition")
 root.configure(bg="#e0f7fa")
 root.state("zoomed")  # Make the window full screen
 
+# Answers the running program's ask() calls with dialogs on this window.
+ask_dialog = DialogInput(root)
+
 input_frame = tk.Frame(root, bg="#e0f7fa")
 input_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
@@ -88,6 +189,8 @@ source_text = scrolledtext.ScrolledText(
     bg="#ffffff"
 )
 source_text.pack(fill=tk.BOTH, expand=True)
+for index, color in enumerate(HEAT_COLORS):
+    source_text.tag_configure(f"heat{index}", background=color)
 
 button_frame = tk.Frame(root, bg="#e0f7fa")
 button_frame.pack(pady=10)
@@ -112,7 +215,40 @@ commands_button = tk.Button(
     fg="white",
     width=12
 )
-commands_button.grid(row=0, column=1, padx=10)
+commands_button.grid(row=0, column=2, padx=10)
+
+stop_button = tk.Button(
+    button_frame,
+    text="Stop",
+    command=stop_compiler,
+    font=("Comic Sans MS", 12, "bold"),
+    bg="#f44336",
+    fg="white",
+    width=12,
+    state="disabled"
+)
+stop_button.grid(row=0, column=1, padx=10)
+
+profile_var = tk.BooleanVar(value=False)
+profile_check = tk.Checkbutton(
+    button_frame,
+    text="Profile",
+    variable=profile_var,
+    bg="#e0f7fa",
+    font=("Comic Sans MS", 12)
+)
+profile_check.grid(row=0, column=3, padx=10)
+
+progress_bar = ttk.Progressbar(button_frame, mode="indeterminate", length=200)
+progress_bar.grid(row=1, column=0, columnspan=2, pady=(10, 0))
+
+status_label = tk.Label(
+    button_frame,
+    text="Ready",
+    bg="#e0f7fa",
+    font=("Comic Sans MS", 12)
+)
+status_label.grid(row=1, column=2, pady=(10, 0))
 
 output_frame = tk.Frame(root, bg="#e0f7fa")
 output_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
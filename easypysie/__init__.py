@@ -0,0 +1,14 @@
+# easypysie/__init__.py
+
+# The headless EasyPysie compiler core: lexer, parser, semantic analysis, IR,
+# optimizer, the Python, assembly and VM back ends, and the runtime I/O they
+# share. Nothing in this package imports tkinter; the GUI lives in compiler_ui.py
+# and the dialog input provider loads Tk only when it is first asked.
+
+from .compiler import Compiler, compile_code, execute_code
+from .cache import CompileCache
+from .result import CompileResult, PhaseStats, console_trace
+from .source_map import SourceMap
+from .profiler import Profiler
+from .runtime_io import (OutputSink, InputProvider, DialogInput, StdinInput,
+                         ScriptedInput, CallbackInput)
@@ -0,0 +1,8 @@
+# __main__.py
+
+# Entry point of `python -m easypysie`; see cli.py.
+
+import sys
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,531 @@
+# assembly.py
+
+# Assembly backend: liveness analysis over the IR, linear-scan register
+# allocation over a configurable register file, instruction selection with
+# spill code, calls and branches, and a peephole pass over the result.
+#
+# The target is a small two-address, x86-like machine:
+#   registers R0 .. R{n-1}; R0 carries return values and the last register
+#   is reserved as a scratch register for spill code
+#   operands  R1 (register), [x] (memory slot of the current frame, reads
+#             fall back to the global frame), #5 (immediate)
+#   MOV d, s          d = s (at most one memory operand)
+#   ADD/SUB/MUL/DIV/CAT/ADDX/AND/OR r, s
+#                     r = r op s (CAT: string concatenation, ADDX: '+' checked at runtime)
+#   NOT r             r = not r
+#   INC d             d = d + 1
+#   CMP a, b          compare a with b; SETcc r stores the result, Jcc jumps on it
+#   SETE/SETNE/SETL/SETG/SETLE/SETGE r
+#   JMP L, JZ s, L, JE/JNE/JL/JG/JLE/JGE L
+#   PUSH s, POP d     the value stack, used for arguments and saved registers
+#   CALL f            call function f in a fresh memory frame; RET returns to the caller
+#   OUT s, IN d, s    print s; read a line into d with prompt s
+#   HALT              end of the program
+
+from .ir import Op, Const, LABEL_B_OPS, temp_name, uses, count_temp_uses
+
+# Default size of the register file.
+DEFAULT_REGISTERS = 6
+
+# Mnemonics for the two-address arithmetic opcodes.
+ARITHMETIC = {
+    Op.ADD: "ADD", Op.SUB: "SUB", Op.MUL: "MUL", Op.DIV: "DIV",
+    Op.CONCAT: "CAT", Op.ADD_ANY: "ADDX", Op.AND: "AND", Op.OR: "OR",
+}
+
+# Operations whose operands can be swapped.
+COMMUTATIVE = frozenset({Op.ADD, Op.MUL, Op.AND, Op.OR})
+
+# Condition code of each comparison opcode and the jump that is taken when it is false.
+CONDITIONS = {Op.EQ: "E", Op.NE: "NE", Op.LT: "L", Op.GT: "G", Op.LE: "LE", Op.GE: "GE"}
+INVERSE = {"E": "NE", "NE": "E", "L": "GE", "GE": "L", "G": "LE", "LE": "G"}
+
+# Mnemonics that write their first operand, and those that also read it.
+WRITES_FIRST = frozenset({"MOV", "ADD", "SUB", "MUL", "DIV", "CAT", "ADDX", "AND", "OR", "NOT", "INC",
+                          "SETE", "SETNE", "SETL", "SETG", "SETLE", "SETGE", "POP", "IN"})
+READS_FIRST = frozenset({"ADD", "SUB", "MUL", "DIV", "CAT", "ADDX", "AND", "OR", "NOT", "INC",
+                         "CMP", "JZ", "PUSH", "OUT"})
+
+# Instructions after which control never falls through.
+UNCONDITIONAL = frozenset({"JMP", "RET", "HALT"})
+
+def reg(number):
+    return ('reg', number)
+
+def mem(name):
+    return ('mem', name)
+
+def imm(value):
+    return ('imm', value)
+
+def format_operand(operand):
+    """
+    Format an assembly operand.
+    """
+    kind, value = operand
+    if kind == 'reg':
+        return f"R{value}"
+    elif kind == 'mem':
+        return f"[{value}]"
+    elif kind == 'imm':
+        return f"#{value!r}"
+    return str(value)  # A label.
+
+class AsmInstr:
+    """
+    One assembly instruction: a mnemonic and its operands.
+    LABEL pseudo-instructions carry the label name as their only operand.
+    """
+    __slots__ = ('op', 'args')
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = args
+
+    def __eq__(self, other):
+        return type(other) is AsmInstr and other.op == self.op and other.args == self.args
+
+    def __repr__(self):
+        return f"<AsmInstr {self}>"
+
+    def __str__(self):
+        if self.op == "LABEL":
+            return f"{self.args[0]}:"
+        operands = ", ".join(format_operand(arg) if type(arg) is tuple else str(arg) for arg in self.args)
+        return f"    {self.op} {operands}" if operands else f"    {self.op}"
+
+class AsmStats:
+    """
+    Instruction count and memory traffic of an assembly listing.
+    Stack pushes and pops count as memory stores and loads.
+    """
+    __slots__ = ('name', 'instructions', 'loads', 'stores')
+
+    def __init__(self, name, code):
+        self.name = name
+        self.instructions = 0
+        self.loads = 0
+        self.stores = 0
+        for instr in code:
+            if instr.op == "LABEL":
+                continue
+            self.instructions += 1
+            for position, operand in enumerate(instr.args):
+                if type(operand) is not tuple or operand[0] != 'mem':
+                    continue
+                if position == 0 and instr.op in WRITES_FIRST:
+                    self.stores += 1
+                    if instr.op in READS_FIRST:
+                        self.loads += 1
+                else:
+                    self.loads += 1
+            if instr.op in ("PUSH", "CALL"):
+                self.stores += 1
+            elif instr.op in ("POP", "RET"):
+                self.loads += 1
+
+    @property
+    def memory_traffic(self):
+        return self.loads + self.stores
+
+    def __str__(self):
+        return (f"{self.name}: {self.instructions} instructions, {self.loads} loads, "
+                f"{self.stores} stores ({self.memory_traffic} memory accesses)")
+
+class AsmProgram:
+    """
+    The result of the assembly backend: the final listing and the statistics
+    before allocation (every value in memory), after allocation and after the peephole pass.
+    """
+    def __init__(self, code, stats):
+        self.code = code
+        self.stats = stats
+
+    def __str__(self):
+        return "\n".join(str(instr) for instr in self.code)
+
+def split_regions(ir_code):
+    """
+    Split the IR into the top-level code and one instruction list per function.
+    Returns [(function FUNC instruction or None, instructions)], top level first.
+    """
+    regions = {None: (None, [])}
+    owners = [None]
+    for instr in ir_code:
+        if instr.op == Op.FUNC:
+            owners.append(instr.a)
+            regions[instr.a] = (instr, [])
+            continue
+        if instr.op == Op.END_FUNC:
+            owners.pop()
+        else:
+            regions[owners[-1]][1].append(instr)
+    return list(regions.values())
+
+def global_reads(header, instrs):
+    """
+    Return the names a function reads from the global frame: names it reads
+    that are neither parameters nor assigned in the function.
+    """
+    local_names = set(header.args)
+    local_names.update(instr.dest for instr in instrs if type(instr.dest) is str)
+    return {operand for instr in instrs for operand in uses(instr)
+            if type(operand) is str and operand not in local_names}
+
+def shared_globals(regions):
+    """
+    Return the names functions read from the global frame. These stay in memory
+    everywhere so that functions always see the current value.
+    """
+    names = set()
+    for header, instrs in regions[1:]:
+        names |= global_reads(header, instrs)
+    return names
+
+def reads(instr):
+    """
+    Return the variables and temporaries an instruction reads.
+    """
+    operands = [operand for operand in uses(instr) if operand is not None and type(operand) is not Const]
+    if instr.op == Op.LOOP:
+        operands.append(instr.dest)
+    return operands
+
+def liveness(instrs):
+    """
+    Compute the variables live into and out of every instruction of a region
+    with the usual backward dataflow iteration.
+    """
+    count = len(instrs)
+    labels = {instr.a: index for index, instr in enumerate(instrs) if instr.op == Op.LABEL}
+    successors = []
+    for index, instr in enumerate(instrs):
+        op = instr.op
+        if op == Op.GOTO:
+            successors.append((labels[instr.a],))
+        elif op in LABEL_B_OPS:
+            successors.append((index + 1, labels[instr.b]) if index + 1 < count else (labels[instr.b],))
+        elif op == Op.RETURN or index + 1 == count:
+            successors.append(())
+        else:
+            successors.append((index + 1,))
+    gen = [set(reads(instr)) for instr in instrs]
+    kill = [{instr.dest} if instr.dest is not None else set() for instr in instrs]
+    live_in = [set() for _ in instrs]
+    live_out = [set() for _ in instrs]
+    changed = True
+    while changed:
+        changed = False
+        for index in range(count - 1, -1, -1):
+            out = set()
+            for succ in successors[index]:
+                out |= live_in[succ]
+            new_in = gen[index] | (out - kill[index])
+            if new_in != live_in[index] or out != live_out[index]:
+                live_in[index] = new_in
+                live_out[index] = out
+                changed = True
+    return live_in, live_out
+
+def live_intervals(instrs, params, in_memory):
+    """
+    Return the live interval [start, end] of every allocatable value of a region.
+    Parameters are defined on entry, at position -1, so they are live across a call at position 0.
+    """
+    live_in, live_out = liveness(instrs)
+    intervals = {param: [-1, -1] for param in params if param not in in_memory}
+    for index, instr in enumerate(instrs):
+        values = live_in[index] | live_out[index]
+        if instr.dest is not None:
+            values.add(instr.dest)
+        for value in values:
+            if value in in_memory:
+                continue
+            interval = intervals.get(value)
+            if interval is None:
+                intervals[value] = [index, index]
+            else:
+                interval[0] = min(interval[0], index)
+                interval[1] = max(interval[1], index)
+    return intervals
+
+def linear_scan(intervals, registers):
+    """
+    Assign registers R0 .. R{registers - 1} to live intervals with linear scan.
+    When no register is free, the interval that ends last is spilled to memory.
+    Returns the location of every value.
+    """
+    locations = {}
+    free = [reg(number) for number in range(registers)]
+    active = []  # (end, value) pairs of intervals holding a register, sorted by end.
+    for value, (start, end) in sorted(intervals.items(), key=lambda item: (item[1][0], item[1][1])):
+        while active and active[0][0] < start:
+            _, expired = active.pop(0)
+            free.append(locations[expired])
+        if free:
+            locations[value] = free.pop(0)
+        elif active and active[-1][0] > end:
+            spilled_end, spilled = active.pop()
+            locations[value] = locations[spilled]
+            locations[spilled] = mem(operand_name(spilled))
+        else:
+            locations[value] = mem(operand_name(value))
+            continue
+        active.append((end, value))
+        active.sort(key=lambda item: item[0])
+    return locations
+
+def operand_name(value):
+    """
+    Name of the memory slot of a variable or temporary.
+    """
+    return temp_name(value) if type(value) is int else value
+
+class Emitter:
+    """
+    Instruction selection for one region, given the location of every value.
+    """
+    def __init__(self, locations, intervals, scratch, temp_uses):
+        self.locations = locations
+        self.intervals = intervals
+        self.scratch = reg(scratch)
+        self.temp_uses = temp_uses
+        self.code = []
+
+    def emit(self, op, *args):
+        self.code.append(AsmInstr(op, *args))
+
+    def loc(self, operand):
+        if type(operand) is Const:
+            return imm(operand.value)
+        return self.locations.get(operand) or mem(operand_name(operand))
+
+    def move(self, dest, source):
+        """
+        Emit dest = source, going through the scratch register for memory-to-memory moves.
+        """
+        if dest == source:
+            return
+        if dest[0] == 'mem' and source[0] == 'mem':
+            self.emit("MOV", self.scratch, source)
+            source = self.scratch
+        self.emit("MOV", dest, source)
+
+    def compare(self, a, b):
+        """
+        Emit CMP a, b. The first operand must not be an immediate and at most one may be in memory.
+        """
+        if a[0] == 'imm' or (a[0] == 'mem' and b[0] == 'mem'):
+            self.emit("MOV", self.scratch, a)
+            a = self.scratch
+        self.emit("CMP", a, b)
+
+    def binary(self, op, instr):
+        """
+        Emit a two-address operation dest = a op b.
+        """
+        dest, a, b = self.loc(instr.dest), self.loc(instr.a), self.loc(instr.b)
+        if dest == b and dest != a and op in COMMUTATIVE:
+            a, b = b, a
+        if dest[0] == 'reg' and dest != b:
+            self.move(dest, a)
+            self.emit(ARITHMETIC[op], dest, b)
+        else:
+            self.move(self.scratch, a)
+            self.emit(ARITHMETIC[op], self.scratch, b)
+            self.move(dest, self.scratch)
+
+    def saved_registers(self, index, dest):
+        """
+        Registers holding values that live across the call at the given position.
+        """
+        saved = []
+        for value, (start, end) in self.intervals.items():
+            location = self.locations.get(value)
+            if location is not None and location[0] == 'reg' and start < index < end and value != dest:
+                if location not in saved:
+                    saved.append(location)
+        return sorted(saved)
+
+    def region(self, header, instrs):
+        """
+        Emit a function (or the top-level code when header is None).
+        """
+        if header is not None:
+            self.emit("LABEL", header.a)
+            # Arguments were pushed in order, so they are popped in reverse.
+            for param in reversed(header.args):
+                self.emit("POP", self.loc(param))
+        skip = False
+        for index, instr in enumerate(instrs):
+            if skip:
+                skip = False
+                continue
+            following = instrs[index + 1] if index + 1 < len(instrs) else None
+            skip = self.instruction(index, instr, following)
+        if header is None:
+            self.emit("HALT")
+        else:
+            self.move(reg(0), imm(None))
+            self.emit("RET")
+
+    def instruction(self, index, instr, following):
+        """
+        Emit one IR instruction. Returns True if the following instruction was consumed.
+        """
+        op = instr.op
+        if op == Op.COPY:
+            self.move(self.loc(instr.dest), self.loc(instr.a))
+        elif op in ARITHMETIC:
+            self.binary(op, instr)
+        elif op in CONDITIONS:
+            condition = CONDITIONS[op]
+            if (following is not None and following.op == Op.IF_FALSE and following.a == instr.dest
+                    and self.temp_uses.get(instr.dest) == 1):
+                # Fuse the comparison with the branch that consumes it.
+                self.compare(self.loc(instr.a), self.loc(instr.b))
+                self.emit(f"J{INVERSE[condition]}", f".L{following.b}")
+                return True
+            dest = self.loc(instr.dest)
+            target = dest if dest[0] == 'reg' else self.scratch
+            self.move(target, self.loc(instr.a))
+            self.emit("CMP", target, self.loc(instr.b))
+            self.emit(f"SET{condition}", target)
+            self.move(dest, target)
+        elif op == Op.NOT:
+            dest = self.loc(instr.dest)
+            target = dest if dest[0] == 'reg' else self.scratch
+            self.move(target, self.loc(instr.a))
+            self.emit("NOT", target)
+            self.move(dest, target)
+        elif op == Op.INPUT:
+            dest = self.loc(instr.dest)
+            self.emit("IN", dest, self.loc(instr.a))
+        elif op == Op.PRINT:
+            self.emit("OUT", self.loc(instr.a))
+        elif op == Op.LABEL:
+            self.emit("LABEL", f".L{instr.a}")
+        elif op == Op.GOTO:
+            self.emit("JMP", f".L{instr.a}")
+        elif op == Op.IF_FALSE:
+            self.emit("JZ", self.loc(instr.a), f".L{instr.b}")
+        elif op == Op.REPEAT:
+            counter = self.loc(instr.dest)
+            self.move(counter, imm(0))
+            self.compare(counter, self.loc(instr.a))
+            self.emit("JGE", f".L{instr.b}")
+        elif op == Op.LOOP:
+            counter = self.loc(instr.dest)
+            self.emit("INC", counter)
+            self.compare(counter, self.loc(instr.a))
+            self.emit("JL", f".L{instr.b}")
+        elif op == Op.CALL:
+            saved = self.saved_registers(index, instr.dest)
+            for register in saved:
+                self.emit("PUSH", register)
+            for arg in instr.args:
+                self.emit("PUSH", self.loc(arg))
+            self.emit("CALL", instr.a)
+            self.move(self.loc(instr.dest), reg(0))
+            for register in reversed(saved):
+                self.emit("POP", register)
+        elif op == Op.RETURN:
+            self.move(reg(0), self.loc(instr.a))
+            self.emit("RET")
+        else:
+            raise ValueError(f"The assembly backend cannot translate IR opcode: {op}")
+        return False
+
+def select(ir_code, registers, scratch):
+    """
+    Allocate `registers` registers and select instructions for the whole program.
+    With registers=0 every value lives in memory and only the scratch register is used.
+    """
+    regions = split_regions(ir_code)
+    shared = shared_globals(regions)
+    temp_uses = count_temp_uses(ir_code)
+    code = []
+    # Main program first; functions follow its HALT.
+    for header, instrs in regions:
+        if header is None:
+            params, in_memory = (), shared
+        else:
+            params, in_memory = header.args, global_reads(header, instrs)
+        intervals = live_intervals(instrs, params, in_memory)
+        locations = linear_scan(intervals, registers)
+        emitter = Emitter(locations, intervals, scratch, temp_uses)
+        emitter.region(header, instrs)
+        code.extend(emitter.code)
+    return code
+
+def peephole(code):
+    """
+    Remove redundant moves and jumps:
+      MOV x, x                          -> (removed)
+      MOV [m], R ; MOV R2, [m]          -> MOV [m], R ; MOV R2, R
+      MOV a, b ; MOV b, a               -> MOV a, b
+      MOV R, a ; MOV R, b               -> MOV R, b
+      JMP L ; L:                        -> L:
+      code after JMP/RET/HALT up to the next label -> (removed)
+    Repeats until nothing changes.
+    """
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        unreachable = False
+        for instr in code:
+            op = instr.op
+            if op == "LABEL":
+                unreachable = False
+                if result and result[-1].op == "JMP" and result[-1].args[0] == instr.args[0]:
+                    result.pop()
+                    changed = True
+                result.append(instr)
+                continue
+            if unreachable:
+                changed = True
+                continue
+            if op == "MOV":
+                dest, source = instr.args
+                if dest == source:
+                    changed = True
+                    continue
+                previous = result[-1] if result else None
+                if previous is not None and previous.op == "MOV":
+                    previous_dest, previous_source = previous.args
+                    if previous_dest == source and previous_source == dest:
+                        changed = True
+                        continue
+                    if previous_dest == source and source[0] == 'mem' and previous_source[0] == 'reg':
+                        # Forward the stored register instead of reloading the slot.
+                        instr = AsmInstr("MOV", dest, previous_source)
+                        changed = True
+                        if dest == previous_source:
+                            continue
+                    elif previous_dest == dest and dest[0] == 'reg' and source != dest:
+                        result.pop()
+                        changed = True
+            result.append(instr)
+            if op in UNCONDITIONAL:
+                unreachable = True
+        code = result
+    return code
+
+def compile_assembly(ir_code, registers=DEFAULT_REGISTERS):
+    """
+    Translate IR to assembly for a machine with the given number of registers
+    (at least 2: one to allocate and the scratch register). Returns an AsmProgram.
+    """
+    if registers < 2:
+        raise ValueError(f"The assembly backend needs at least 2 registers, got {registers}")
+    scratch = registers - 1
+    unallocated = select(ir_code, 0, scratch)
+    allocated = select(ir_code, registers - 1, scratch)
+    final = peephole(list(allocated))
+    stats = [
+        AsmStats("before allocation", unallocated),
+        AsmStats(f"after allocation ({registers} registers)", allocated),
+        AsmStats("after peephole", final),
+    ]
+    return AsmProgram(final, stats)
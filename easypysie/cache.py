@@ -0,0 +1,165 @@
+# cache.py
+
+# Content-addressed cache for compiled programs. Entries are keyed by a hash
+# of the source, the target, the compile options and the compiler version, and
+# hold the generated code plus, for the Python target, the compiled code
+# object and its source map. A bounded in-memory LRU tier sits in front of an
+# optional on-disk tier that stores marshalled entries the way __pycache__
+# stores .pyc files.
+
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from collections import OrderedDict
+from .source_map import SourceMap
+
+# Bump whenever a compiler change alters the generated code, so stale entries are never reused.
+COMPILER_VERSION = "0.15"
+
+class CacheEntry:
+    """
+    A cached compilation: the generated code text and, for Python, its code object
+    and the SourceMap from its lines back to the source. tokens is the number of
+    tokens in the source, so a hit still reports the size of the program.
+    """
+    __slots__ = ('target', 'final_code', 'code_object', 'source_map', 'tokens')
+
+    def __init__(self, target, final_code, code_object=None, source_map=None, tokens=None):
+        self.target = target
+        self.final_code = final_code
+        self.code_object = code_object
+        self.source_map = source_map
+        self.tokens = tokens
+
+class CompileCache:
+    """
+    LRU cache of compiled programs with an optional on-disk tier.
+    max_entries bounds the in-memory tier; cache_dir enables the disk tier.
+    Safe to share between Compiler sessions on different threads.
+    """
+    def __init__(self, max_entries=256, cache_dir=None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(source_code, target, opt_level, wrap_main=True):
+        """
+        Return the cache key for a compilation. Marshalled code objects are only
+        valid for the running interpreter, so its cache tag is part of the key.
+        """
+        digest = hashlib.sha256()
+        stamp = f"{COMPILER_VERSION}\0{sys.implementation.cache_tag}\0{target}\0{opt_level}\0{int(wrap_main)}\0"
+        digest.update(stamp.encode("utf-8"))
+        digest.update(source_code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Return the entry for a key, or None. Disk hits are promoted to the memory tier.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._load(key)
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        """
+        Store an entry in the memory tier and, when enabled, on disk.
+        """
+        with self.lock:
+            self._insert(key, entry)
+        self._store(key, entry)
+
+    def clear(self):
+        """
+        Drop the memory tier and reset the counters. Files on disk are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Return the hit/miss counters and the current size of the memory tier.
+        """
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def _insert(self, key, entry):
+        """
+        Insert into the memory tier, evicting the least recently used entries. Caller holds the lock.
+        """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def _load(self, key):
+        """
+        Read an entry from disk. Missing or unreadable files count as a miss.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                target, final_code, code_object, source_map, tokens = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if source_map is not None:
+            source_map = SourceMap.from_bytes(source_map)
+        return CacheEntry(target, final_code, code_object, source_map, tokens)
+
+    def _store(self, key, entry):
+        """
+        Write an entry to disk through a temporary file so readers never see a partial file.
+        """
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                source_map = entry.source_map.to_bytes() if entry.source_map is not None else None
+                marshal.dump((entry.target, entry.final_code, entry.code_object, source_map, entry.tokens), f)
+            os.replace(temp_path, path)
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the entry.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
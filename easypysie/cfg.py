@@ -0,0 +1,309 @@
+# cfg.py
+
+# Control-flow graph over the typed IR: basic blocks with explicit successor
+# edges, dominators, post-dominators and natural loops. Building the graph is
+# a single linear scan, so backends and optimizer passes can rely on it
+# instead of pattern-matching instruction sequences.
+
+from .ir import Op, LABEL_B_OPS
+
+# Opcodes that end a basic block.
+TERMINATORS = frozenset({Op.GOTO, Op.IF_FALSE, Op.REPEAT, Op.LOOP, Op.RETURN, Op.END_FUNC})
+
+class BasicBlock:
+    """
+    A straight-line run of instructions ir_code[start:end].
+    A block holding a whole nested function has `function` set to that function's CFG.
+    """
+    __slots__ = ('index', 'start', 'end', 'succs', 'preds', 'function')
+
+    def __init__(self, index, start, end):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.succs = []
+        self.preds = []
+        self.function = None
+
+    def __repr__(self):
+        return f"<BasicBlock {self.index} [{self.start}:{self.end}] -> {self.succs}>"
+
+class Loop:
+    """
+    A natural loop: its header block, the blocks in its body and the blocks it exits to.
+    A canonical counted loop (REPEAT ... LOOP) also records its counter and trip count operand.
+    """
+    __slots__ = ('header', 'body', 'latches', 'exits', 'counter', 'count')
+
+    def __init__(self, header, body, latches, exits):
+        self.header = header
+        self.body = body
+        self.latches = latches
+        self.exits = exits
+        self.counter = None
+        self.count = None
+
+    @property
+    def counted(self):
+        return self.counter is not None
+
+    def __repr__(self):
+        kind = f" counted({self.count})" if self.counted else ""
+        return f"<Loop header={self.header} body={sorted(self.body)} exits={self.exits}{kind}>"
+
+class CFG:
+    """
+    Control-flow graph for one region of IR: the top-level program or one function.
+    """
+    def __init__(self, ir_code, start, end, blocks, label_blocks):
+        self.ir_code = ir_code
+        self.start = start
+        self.end = end
+        self.blocks = blocks
+        self.label_blocks = label_blocks
+        self.idom = compute_dominators(blocks, [0] if blocks else [], lambda block: block.preds, lambda block: block.succs)
+        # Preorder and postorder numbers of every block in the dominator tree (see dominates()).
+        self.dom_pre, self.dom_post = number_tree(self.idom)
+        # Post-dominators: the same computation on the reversed graph, entered from every exit block.
+        exits = [block.index for block in blocks if not block.succs]
+        self.ipdom = compute_dominators(blocks, exits, lambda block: block.succs, lambda block: block.preds)
+        self.loops = find_loops(self)
+
+    def instructions(self, block):
+        """
+        Return the instructions of a block.
+        """
+        return self.ir_code[block.start:block.end]
+
+    def dominates(self, a, b):
+        """
+        Return True if block a dominates block b: b lies in a's subtree of the
+        dominator tree, so its preorder and postorder numbers nest in a's.
+        """
+        if a == b:
+            return True
+        pre, post = self.dom_pre, self.dom_post
+        if pre[a] is None or pre[b] is None:
+            return False  # Unreachable blocks are dominated by nothing else.
+        return pre[a] < pre[b] and post[b] < post[a]
+
+    def leaf_blocks(self):
+        """
+        Yield every block that holds instructions directly, descending into nested functions.
+        Together they cover the whole region in order.
+        """
+        for block in self.blocks:
+            if block.function is not None:
+                yield from block.function.leaf_blocks()
+            else:
+                yield block
+
+def match_functions(ir_code):
+    """
+    Map the index of every FUNC instruction to the index of its END_FUNC.
+    """
+    match = {}
+    stack = []
+    for i, instr in enumerate(ir_code):
+        if instr.op == Op.FUNC:
+            stack.append(i)
+        elif instr.op == Op.END_FUNC:
+            match[stack.pop()] = i
+    return match
+
+def build_cfg(ir_code, start=0, end=None, function_ends=None, is_function=False):
+    """
+    Build the CFG for ir_code[start:end].
+    With is_function the region is one function, from its FUNC to its END_FUNC.
+    """
+    if end is None:
+        end = len(ir_code)
+    if function_ends is None:
+        function_ends = match_functions(ir_code)
+
+    blocks = []
+    label_blocks = {}
+    block_start = start
+    i = start
+    while i < end:
+        instr = ir_code[i]
+        op = instr.op
+        if op == Op.FUNC and not (is_function and i == start):
+            # A nested function becomes one opaque block with its own CFG.
+            if i > block_start:
+                blocks.append(BasicBlock(len(blocks), block_start, i))
+            func_end = function_ends[i] + 1
+            block = BasicBlock(len(blocks), i, func_end)
+            block.function = build_cfg(ir_code, i, func_end, function_ends, True)
+            blocks.append(block)
+            block_start = i = func_end
+            continue
+        if op == Op.LABEL:
+            if i > block_start:
+                blocks.append(BasicBlock(len(blocks), block_start, i))
+                block_start = i
+            label_blocks[instr.a] = len(blocks)
+        if op in TERMINATORS:
+            blocks.append(BasicBlock(len(blocks), block_start, i + 1))
+            block_start = i + 1
+        i += 1
+    if block_start < end:
+        blocks.append(BasicBlock(len(blocks), block_start, end))
+
+    # Connect the blocks.
+    for block in blocks:
+        last = ir_code[block.end - 1]
+        fallthrough = block.index + 1 if block.index + 1 < len(blocks) else None
+        if block.function is not None or last.op not in TERMINATORS:
+            # Straight-line code and nested functions fall through to the next block.
+            if fallthrough is not None:
+                block.succs.append(fallthrough)
+        elif last.op == Op.GOTO:
+            block.succs.append(label_blocks[last.a])
+        elif last.op in LABEL_B_OPS:
+            if fallthrough is not None:
+                block.succs.append(fallthrough)
+            target = label_blocks[last.b]
+            if target not in block.succs:
+                block.succs.append(target)
+        for succ in block.succs:
+            blocks[succ].preds.append(block.index)
+
+    return CFG(ir_code, start, end, blocks, label_blocks)
+
+def reverse_postorder(blocks, roots, edges):
+    """
+    Return the blocks reachable from the roots in reverse postorder (iterative DFS).
+    """
+    order = []
+    visited = set()
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(edges(blocks[root])))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(edges(blocks[child]))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    order.reverse()
+    return order
+
+def compute_dominators(blocks, roots, preds, succs):
+    """
+    Compute immediate dominators with the Cooper-Harvey-Kennedy algorithm.
+    Returns a list mapping each block to its immediate dominator; roots map to
+    themselves when there is one root, and to None when several roots share a
+    virtual entry. Unreachable blocks map to None.
+    """
+    idom = [None] * len(blocks)
+    if not roots:
+        return idom
+    order = reverse_postorder(blocks, roots, succs)
+    position = {node: index for index, node in enumerate(order)}
+    virtual = -1
+    root_set = set(roots)
+    doms = {root: virtual for root in roots}
+    doms[virtual] = virtual
+    position[virtual] = -1
+
+    def intersect(a, b):
+        while a != b:
+            while position[a] > position[b]:
+                a = doms[a]
+            while position[b] > position[a]:
+                b = doms[b]
+        return a
+
+    changed = True
+    while changed:
+        changed = False
+        for node in order:
+            if node in root_set:
+                continue
+            new_idom = None
+            for pred in preds(blocks[node]):
+                if pred in doms:
+                    new_idom = pred if new_idom is None else intersect(pred, new_idom)
+            if new_idom is not None and doms.get(node) != new_idom:
+                doms[node] = new_idom
+                changed = True
+
+    for node, dom in doms.items():
+        if node == virtual:
+            continue
+        if dom == virtual:
+            idom[node] = node if len(roots) == 1 else None
+        else:
+            idom[node] = dom
+    return idom
+
+def number_tree(parents):
+    """
+    Number the nodes of a tree given as a list of parents (a root is its own
+    parent, None marks a node outside the tree) in preorder and postorder.
+    Returns the two lists; nodes outside the tree get None.
+    """
+    children = [[] for _ in parents]
+    roots = []
+    for node, parent in enumerate(parents):
+        if parent == node:
+            roots.append(node)
+        elif parent is not None:
+            children[parent].append(node)
+    pre = [None] * len(parents)
+    post = [None] * len(parents)
+    counter = 0
+    for root in roots:
+        pre[root] = counter
+        counter += 1
+        stack = [(root, iter(children[root]))]
+        while stack:
+            node, remaining = stack[-1]
+            for child in remaining:
+                pre[child] = counter
+                counter += 1
+                stack.append((child, iter(children[child])))
+                break
+            else:
+                stack.pop()
+                post[node] = counter
+                counter += 1
+    return pre, post
+
+def find_loops(cfg):
+    """
+    Find natural loops: an edge to a block that dominates its source is a back edge.
+    Each edge is tested in constant time with the dominator tree numbering.
+    Returns a dict mapping each header block index to its Loop.
+    """
+    loops = {}
+    for block in cfg.blocks:
+        for succ in block.succs:
+            if cfg.dominates(succ, block.index):
+                loop = loops.get(succ)
+                if loop is None:
+                    loop = loops[succ] = Loop(succ, {succ}, [], [])
+                loop.latches.append(block.index)
+                latch = cfg.ir_code[block.end - 1]
+                if latch.op == Op.LOOP:
+                    loop.counter, loop.count = latch.dest, latch.a
+                # Walk backwards from the latch to collect the loop body.
+                stack = [block.index]
+                while stack:
+                    node = stack.pop()
+                    if node not in loop.body:
+                        loop.body.add(node)
+                        stack.extend(cfg.blocks[node].preds)
+    for loop in loops.values():
+        for node in loop.body:
+            for succ in cfg.blocks[node].succs:
+                if succ not in loop.body and succ not in loop.exits:
+                    loop.exits.append(succ)
+    return loops
@@ -0,0 +1,238 @@
+# cli.py
+
+# Command-line driver for batches of EasyPysie programs:
+#   python -m easypysie check|build|run <paths, directories or globs> [options]
+# check stops after semantic analysis, build also generates the target code
+# (and can write it to a directory), and run also executes every program with
+# its ask() answers read from a file. Python programs run in a sandbox
+# process under CPU, wall-clock, memory and output limits; the vm and
+# assembly targets run in-process, bounded by their instruction budgets.
+# Files are spread over a pool of worker processes, each with its own
+# Compiler session, and read through a read-only memory map. One JSON line per file goes to stdout (or --jsonl),
+# in the order the files were given, and the aggregate throughput to stderr.
+
+import argparse
+import glob
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .compiler import Compiler
+from .cache import CompileCache
+from .sandbox import SandboxPool, OK, ERROR
+from .runtime_io import OutputSink, ScriptedInput, DEFAULT_MAX_CHARS
+
+# Extension of EasyPysie programs, searched for in directories.
+SOURCE_SUFFIX = ".pysie"
+
+# Extension of the answers file next to a program: hello.pysie reads hello.answers.
+ANSWERS_SUFFIX = ".answers"
+
+# Extension of the files build writes for each target.
+OUTPUT_SUFFIXES = {"python": ".py", "assembly": ".asm"}
+
+# Where each command ends the pipeline (see Compiler.compile()).
+STOP_AFTER = {"check": "semantic", "build": "codegen", "run": None}
+
+def find_sources(patterns):
+    """
+    Expand files, directories (searched recursively for .pysie files) and glob patterns.
+    Returns the files, without duplicates, in the order given, and the patterns that matched nothing.
+    """
+    files = []
+    seen = set()
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(glob.escape(pattern), "**", f"*{SOURCE_SUFFIX}"), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        matches = [path for path in sorted(matches) if os.path.isfile(path)]
+        if not matches:
+            unmatched.append(pattern)
+        for path in matches:
+            if path not in seen:
+                seen.add(path)
+                files.append(path)
+    return files, unmatched
+
+def read_source(path):
+    """
+    Read a program through a read-only memory map and decode it straight from the
+    mapping. A UTF-8 byte order mark is dropped and line endings become \\n.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            source = str(mapped, "utf-8-sig")
+    return source.replace("\r\n", "\n") if "\r" in source else source
+
+def answers_for(path, answers_path=None):
+    """
+    Return the ScriptedInput that answers a program's ask() calls: the shared answers
+    file if one was given, else the program's own .answers file, else no answers
+    (every ask() then returns an empty string).
+    """
+    if answers_path is None:
+        answers_path = os.path.splitext(path)[0] + ANSWERS_SUFFIX
+        if not os.path.isfile(answers_path):
+            return ScriptedInput(())
+    return ScriptedInput.from_file(answers_path)
+
+def output_path(out_dir, path, target):
+    """
+    Return where build writes the code generated from path: the same relative
+    path under out_dir, with the target's extension.
+    """
+    relative = os.path.relpath(path)
+    if relative.startswith(os.pardir):
+        relative = os.path.splitdrive(os.path.abspath(path))[1].lstrip(os.sep)
+    return os.path.join(out_dir, os.path.splitext(relative)[0] + OUTPUT_SUFFIXES[target])
+
+# The Compiler session and options of this worker process.
+_session = None
+
+def init_worker(options):
+    """
+    Create the worker's Compiler session; with a cache directory, workers share its disk tier.
+    run with the python target also gets a one-process SandboxPool to execute the programs in.
+    """
+    global _session
+    cache = CompileCache(cache_dir=options["cache_dir"]) if options["cache_dir"] else None
+    sandbox = None
+    if options["command"] == "run" and options["target"] == "python":
+        sandbox = SandboxPool(workers=1, cpu_seconds=options["cpu_seconds"], wall_seconds=options["timeout"],
+                              memory_bytes=options["memory_mb"] * 1024 * 1024, output_chars=options["max_output"])
+    _session = (Compiler(cache, sandbox, input_function=ScriptedInput(())), options)
+
+def close_worker():
+    """
+    Stop the session's sandbox, if it has one.
+    """
+    if _session is not None and _session[0].sandbox is not None:
+        _session[0].sandbox.close()
+
+def process_file(path):
+    """
+    Check, build or run one file in the worker's session. Returns its JSON-serializable record.
+    """
+    compiler, options = _session
+    command = options["command"]
+    try:
+        source_code = read_source(path)
+        input_function = answers_for(path, options["answers"])
+    except (OSError, ValueError) as e:
+        # ValueError covers undecodable files (UnicodeDecodeError).
+        return {"path": path, "command": command, "ok": False, "diagnostics": [f"Read Error: {e}"]}
+    output = OutputSink(options["max_output"])
+    result = compiler.compile(source_code, options["target"], options["opt_level"], output=output,
+                              input_function=input_function, stop_after=STOP_AFTER[command])
+    record = {"path": path, "command": command, **result.as_dict()}
+    if command == "run":
+        record["output"] = output.getvalue()
+        record["asked"] = len(result.run.prompts if result.run is not None else input_function.prompts)
+    elif command == "build" and options["out_dir"] and result.ok and result.code is not None:
+        destination = output_path(options["out_dir"], path, options["target"])
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        with open(destination, "w", encoding="utf-8") as file:
+            file.write(result.code)
+        record["written"] = destination
+    return record
+
+def run_batch(files, options, jobs):
+    """
+    Yield the record of every file, in order. jobs=1 runs in this process.
+    """
+    if jobs == 1:
+        init_worker(options)
+        try:
+            yield from map(process_file, files)
+        finally:
+            close_worker()
+        return
+    # Hand each worker several files per round trip, while keeping every worker busy to the end.
+    chunksize = max(1, min(64, len(files) // (jobs * 8)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(options,)) as executor:
+        yield from executor.map(process_file, files, chunksize=chunksize)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m easypysie",
+                                     description="Check, build or run EasyPysie programs in parallel.")
+    parser.add_argument("command", choices=list(STOP_AFTER),
+                        help="check: lex, parse and analyse; build: also generate code; run: also execute")
+    parser.add_argument("paths", nargs="+", help=f"files, directories (searched for *{SOURCE_SUFFIX}) or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    parser.add_argument("--target", default="python", choices=["python", "assembly", "vm"])
+    parser.add_argument("-O", "--opt-level", type=int, default=1, choices=[0, 1, 2])
+    parser.add_argument("--answers", help=f"answers for every program's ask(), one per line "
+                                          f"(default: each program's own {ANSWERS_SUFFIX} file)")
+    parser.add_argument("--out", help="directory build writes the generated code to")
+    parser.add_argument("--jsonl", help="write the per-file JSON lines here instead of stdout")
+    parser.add_argument("--cache-dir", help="on-disk compile cache shared by the workers")
+    parser.add_argument("--max-output", type=int, default=DEFAULT_MAX_CHARS,
+                        help="characters of program output kept per file")
+    parser.add_argument("--timeout", type=float, default=10,
+                        help="wall-clock seconds a python program may run (default: 10)")
+    parser.add_argument("--cpu-seconds", type=float, default=5,
+                        help="CPU seconds a python program may use (default: 5)")
+    parser.add_argument("--memory-mb", type=int, default=512,
+                        help="address space of the process a python program runs in, in MB (default: 512)")
+    return parser
+
+def main(argv=None):
+    """
+    Run the command line. Returns the exit status: 0 if every file succeeded,
+    1 if any failed, 2 if a path matched no files.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.out and (args.command != "build" or args.target == "vm"):
+        parser.error("--out only applies to build with the python or assembly target")
+    files, unmatched = find_sources(args.paths)
+    for pattern in unmatched:
+        print(f"easypysie: no files match {pattern!r}", file=sys.stderr)
+    options = {
+        "command": args.command,
+        "target": args.target,
+        "opt_level": args.opt_level,
+        "answers": args.answers,
+        "out_dir": args.out,
+        "cache_dir": args.cache_dir,
+        "max_output": args.max_output,
+        "timeout": args.timeout,
+        "cpu_seconds": args.cpu_seconds,
+        "memory_mb": args.memory_mb,
+    }
+    jobs = max(1, min(args.jobs, len(files)))
+
+    stream = open(args.jsonl, "w", encoding="utf-8") if args.jsonl else sys.stdout
+    succeeded = failed = stopped = tokens = 0
+    start = time.perf_counter()
+    try:
+        for record in run_batch(files, options, jobs):
+            stream.write(json.dumps(record) + "\n")
+            if record["ok"]:
+                succeeded += 1
+            else:
+                failed += 1
+            tokens += record.get("tokens") or 0
+            if record.get("run_status") not in (None, OK, ERROR):
+                stopped += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    elapsed = time.perf_counter() - start
+
+    rate = 1 / elapsed if elapsed > 0 else 0.0
+    limits = f" ({stopped} stopped by a limit)" if stopped else ""
+    print(f"{args.command}: {len(files)} files, {succeeded} ok, {failed} failed{limits} in {elapsed:.2f} s "
+          f"with {jobs} worker(s): {len(files) * rate:.1f} files/s, {tokens * rate:.0f} tokens/s",
+          file=sys.stderr)
+    if failed:
+        return 1
+    return 2 if unmatched else 0
@@ -0,0 +1,247 @@
+#code_generator.py
+
+from .ir import Op, OP_SYMBOLS, Const, is_temp, temp_name, uses, count_temp_uses
+from .source_map import SourceMap
+from .cfg import build_cfg
+from .assembly import compile_assembly, DEFAULT_REGISTERS
+
+# Python spelling of IR operators that differ from the source language.
+PYTHON_SYMBOLS = dict(OP_SYMBOLS)
+PYTHON_SYMBOLS[Op.AND] = 'and'
+PYTHON_SYMBOLS[Op.OR] = 'or'
+
+def python_operand(operand):
+    """
+    Render an IR operand as a Python expression.
+    """
+    if type(operand) is int:
+        return temp_name(operand)
+    return repr(operand.value) if type(operand) is Const else operand
+
+def python_expr(instr, operand=python_operand):
+    """
+    Render the right-hand side of a value-producing instruction as Python.
+    `operand` renders each operand; it defaults to python_operand.
+    """
+    op = instr.op
+    if op == Op.COPY:
+        return operand(instr.a)
+    elif op == Op.CONCAT:
+        return f"str({operand(instr.a)}) + str({operand(instr.b)})"
+    elif op == Op.ADD_ANY:
+        a, b = operand(instr.a), operand(instr.b)
+        return f"(str({a}) + str({b}) if isinstance({a}, str) or isinstance({b}, str) else {a} + {b})"
+    elif op in PYTHON_SYMBOLS:
+        return f"{operand(instr.a)} {PYTHON_SYMBOLS[op]} {operand(instr.b)}"
+    elif op == Op.NOT:
+        return f"not {operand(instr.a)}"
+    elif op == Op.INPUT:
+        return f"input({operand(instr.a)})"
+    elif op == Op.CALL:
+        return f"{instr.a}({', '.join(operand(arg) for arg in instr.args)})"
+    raise ValueError(f"Instruction does not produce a value: {instr}")
+
+def inline_condition(instrs, cond, temp_uses):
+    """
+    Render a loop condition computed by `instrs` as a single Python expression.
+    Returns None unless every instruction feeds a single-use temporary into the condition.
+    """
+    producers = {}
+    for instr in instrs:
+        if not is_temp(instr.dest) or temp_uses.get(instr.dest) != 1 or instr.op in (Op.CALL, Op.INPUT, Op.ADD_ANY):
+            return None
+        producers[instr.dest] = instr
+    consumed = []
+
+    def operand(value):
+        producer = producers.get(value) if is_temp(value) else None
+        if producer is None:
+            return python_operand(value)
+        consumed.append(value)
+        return f"({python_expr(producer, operand)})"
+
+    expression = operand(cond)
+    if len(consumed) != len(producers):
+        return None
+    # The outermost instruction needs no parentheses.
+    return expression[1:-1] if consumed else expression
+
+class PythonLines(list):
+    """
+    Generated Python lines. append() also records the source line of the
+    instruction each line came from, which becomes the SourceMap.
+    """
+    def __init__(self):
+        super().__init__()
+        self.source_map = SourceMap()
+
+    def append(self, text, instr=None):
+        super().append(text)
+        self.source_map.lines.append(instr.line if instr is not None else 0)
+
+def generate_code(ir_code, wrap_main=False):
+    """
+    Generate Python code from Intermediate Representation (IR).
+    Loops and branches are recovered from the control-flow graph.
+    With wrap_main the top-level code runs inside a generated __main__() function,
+    so program variables and temporaries are fast locals instead of globals.
+    """
+    return generate_mapped_code(ir_code, wrap_main)[0]
+
+def generate_mapped_code(ir_code, wrap_main=False):
+    """
+    Like generate_code(), but returns a (Python code, SourceMap) pair.
+    """
+    cfg = build_cfg(ir_code)
+    python_code = PythonLines()
+    if not cfg.blocks:
+        return "", python_code.source_map
+    temp_uses = count_temp_uses(ir_code)
+    if wrap_main:
+        emit_main(cfg, python_code, temp_uses)
+    else:
+        emit_region(cfg, 0, None, "", python_code, temp_uses)
+    return "\n".join(python_code), python_code.source_map
+
+def function_globals(cfg):
+    """
+    Return the names that functions read from the top-level scope: names they
+    read that are neither parameters nor assigned inside the function.
+    """
+    ir_code = cfg.ir_code
+    names = set()
+    for block in cfg.blocks:
+        if block.function is None:
+            continue
+        instrs = ir_code[block.start:block.end]
+        local_names = set(instrs[0].args)
+        local_names.update(instr.dest for instr in instrs if type(instr.dest) is str)
+        for instr in instrs:
+            names.update(operand for operand in uses(instr) if type(operand) is str and operand not in local_names)
+    return names
+
+def emit_main(cfg, python_code, temp_uses):
+    """
+    Emit every top-level function first, then the remaining top-level code as
+    the body of __main__() and a call to it. Variables that functions read stay
+    module globals through a `global` declaration.
+    """
+    ir_code = cfg.ir_code
+    top_level = set()
+    for block in cfg.blocks:
+        if block.function is not None:
+            emit_function(block, "", python_code, temp_uses)
+        else:
+            top_level.update(instr.dest for instr in ir_code[block.start:block.end] if type(instr.dest) is str)
+    python_code.append("def __main__():")
+    shared = function_globals(cfg) & top_level
+    if shared:
+        python_code.append(f"    global {', '.join(sorted(shared))}")
+    emit_block_body(cfg, 0, None, "    ", python_code, temp_uses, hoisted=True)
+    python_code.append("__main__()")
+
+def emit_function(block, indent, python_code, temp_uses):
+    """
+    Emit a function definition from a block that holds a whole function.
+    """
+    header = block.function.ir_code[block.start]
+    python_code.append(f"{indent}def {header.a}({', '.join(header.args)}):", header)
+    emit_block_body(block.function, 0, None, indent + "    ", python_code, temp_uses)
+
+def emit_straight_line(instrs, indent, python_code):
+    """
+    Emit Python for instructions that do not transfer control.
+    """
+    for instr in instrs:
+        op = instr.op
+        if op == Op.PRINT:
+            python_code.append(f"{indent}print({python_operand(instr.a)})", instr)
+        elif op == Op.RETURN:
+            python_code.append(f"{indent}return {python_operand(instr.a)}", instr)
+        elif instr.dest is not None:
+            python_code.append(f"{indent}{python_operand(instr.dest)} = {python_expr(instr)}", instr)
+
+def emit_block_body(cfg, start, stop, indent, python_code, temp_uses, hoisted=False):
+    """
+    Emit an indented region, falling back to `pass` when it produces no statements.
+    """
+    body_start = len(python_code)
+    if start is not None and start != stop:
+        emit_region(cfg, start, stop, indent, python_code, temp_uses, hoisted)
+    if len(python_code) == body_start:
+        python_code.append(f"{indent}pass")
+
+def emit_region(cfg, start, stop, indent, python_code, temp_uses, hoisted=False):
+    """
+    Emit Python for the blocks reached from `start`, stopping at the `stop` block
+    (the join point of an enclosing branch or the header of an enclosing loop).
+    With hoisted, function definitions have already been emitted and are skipped.
+    """
+    ir_code = cfg.ir_code
+    inner = indent + "    "
+    b = start
+    while b is not None and b != stop:
+        block = cfg.blocks[b]
+
+        # Handle function definitions.
+        if block.function is not None:
+            if not hoisted:
+                emit_function(block, indent, python_code, temp_uses)
+            b = block.succs[0] if block.succs else None
+            continue
+
+        instrs = ir_code[block.start:block.end]
+        last = instrs[-1]
+        body = [instr for instr in instrs if instr.op not in (Op.LABEL, Op.GOTO, Op.IF_FALSE, Op.LOOP, Op.FUNC, Op.END_FUNC)]
+
+        # Handle counted loops: REPEAT enters the body, LOOP closes it.
+        if last.op == Op.REPEAT:
+            emit_straight_line(body[:-1], indent, python_code)
+            end = cfg.label_blocks[last.b]
+            python_code.append(f"{indent}for {temp_name(last.dest)} in range({python_operand(last.a)}):", last)
+            emit_block_body(cfg, b + 1, end, inner, python_code, temp_uses, hoisted)
+            b = end
+            continue
+
+        # Handle loops: the header computes the condition and exits the loop when it is false.
+        if b in cfg.loops and not cfg.loops[b].counted:
+            if last.op != Op.IF_FALSE or cfg.label_blocks[last.b] in cfg.loops[b].body:
+                raise SyntaxError(f"Unsupported loop shape at block {b}")
+            cond = last.a
+            condition_expr = inline_condition(body, cond, temp_uses)
+            if condition_expr is not None:
+                python_code.append(f"{indent}while {condition_expr}:", last)
+            else:
+                # The condition needs several instructions: evaluate them at the top of each iteration.
+                python_code.append(f"{indent}while True:", last)
+                emit_straight_line(body, inner, python_code)
+                python_code.append(f"{inner}if not {python_operand(cond)}:", last)
+                python_code.append(f"{inner}    break", last)
+            emit_block_body(cfg, b + 1, b, inner, python_code, temp_uses, hoisted)
+            b = cfg.label_blocks[last.b]
+            continue
+
+        emit_straight_line(body, indent, python_code)
+
+        # Handle if-else branching: both branches run until their immediate post-dominator.
+        if last.op == Op.IF_FALSE:
+            join = cfg.ipdom[b]
+            branch_stop = join if join is not None else stop
+            else_start = cfg.label_blocks[last.b]
+            python_code.append(f"{indent}if {python_operand(last.a)}:", last)
+            emit_block_body(cfg, b + 1, branch_stop, inner, python_code, temp_uses, hoisted)
+            if else_start != branch_stop:
+                python_code.append(f"{indent}else:")
+                emit_block_body(cfg, else_start, branch_stop, inner, python_code, temp_uses, hoisted)
+            b = join
+        elif last.op == Op.GOTO:
+            b = cfg.label_blocks[last.a]
+        else:
+            b = block.succs[0] if block.succs else None
+
+def generate_assembly(ir_code, registers=DEFAULT_REGISTERS):
+    """
+    Generate x86-like assembly code from Intermediate Representation (IR),
+    with registers allocated by linear scan and a peephole pass.
+    """
+    return str(compile_assembly(ir_code, registers))
@@ -0,0 +1,329 @@
+#compiler.py
+
+# Import necessary modules and components.
+from contextlib import nullcontext
+from .lexer import lexer, tokenize, illegal_character_message
+from .parser import new_parser, syntax_error_message
+from .semantic import SemanticAnalyzer
+from .ir_generator import generate_ir
+from .optimizer import optimize
+from .code_generator import generate_mapped_code
+from .assembly import compile_assembly
+from .emulator import Emulator
+from .cache import CompileCache, CacheEntry
+from .vm import load_program, VirtualMachine, DEFAULT_BUDGET
+from .runtime_io import OutputSink, DialogInput, ScriptedInput
+from .result import CompileResult, console_trace, SUCCESS_PREFIX
+from .source_map import GENERATED_FILENAME, error_location
+from .profiler import Profiler
+
+# Default input provider: a GUI dialog on one shared hidden Tk root, created on the first ask().
+my_input = DialogInput()
+
+class Compiler:
+    """
+    A compilation session that owns its own lexer and parser.
+    Every compile also gets fresh semantic and IR state, so separate
+    Compiler objects can run on different threads at the same time.
+    With a CompileCache, repeated submissions skip straight to execution.
+    With a SandboxPool, Python programs run in its worker processes instead of in-process.
+    input_function (an InputProvider or any input()-like callable) answers the program's
+    ask() calls; it defaults to a GUI dialog and can be overridden per compile.
+    trace receives the artifacts of every compile (see compile()), and metrics is
+    called with the CompileResult at the end of every compile, e.g. to forward it to monitoring.
+    """
+    def __init__(self, cache=None, sandbox=None, input_function=None, trace=None, metrics=None):
+        self.lexer = lexer.clone()
+        self.parser = new_parser()
+        self.cache = cache
+        self.sandbox = sandbox
+        self.input_function = input_function or my_input
+        self.trace = trace
+        self.metrics = metrics
+        # Lexer and parser errors are collected into the current result instead of printed.
+        self.diagnostics = []
+        self.lexer.lexerrorf = self.lex_error
+        self.parser.errorfunc = self.syntax_error
+
+    def lex_error(self, t):
+        self.diagnostics.append(illegal_character_message(t))
+        t.lexer.skip(1)
+
+    def syntax_error(self, p):
+        self.diagnostics.append(syntax_error_message(p))
+
+    def compile(self, source_code, target="python", opt_level=1, wrap_main=True,
+                output=None, input_function=None, trace=None, profile=False, stop_after=None):
+        """
+        Full compilation pipeline: Lexing, Parsing, Semantic Analysis, IR, Optimization and Code Generation,
+        followed by execution. Returns a CompileResult with every artifact, the diagnostics and per-phase stats.
+        target is "python", "assembly" or "vm" (run the IR on the virtual machine).
+        opt_level selects the optimizations (0-2).
+        wrap_main runs the top-level Python code inside a function so its variables are fast locals.
+        output is the OutputSink the program prints to; by default a new one with the standard cap.
+        input_function answers the program's ask() calls for this compile only.
+        trace, if given (or set on the session), is called as trace(event, artifact) as the pipeline
+        produces each artifact; nothing is printed without one.
+        profile runs a Python program in-process under the line profiler; the Profiler is kept
+        in result.profile (sandboxed runs and the other targets are not profiled).
+        stop_after ends a successful compile early: "semantic" only checks the program,
+        "codegen" builds it without running it.
+        """
+        input_function = input_function or self.input_function
+        trace = trace or self.trace or (lambda event, artifact: None)
+        result = CompileResult(source_code, target, opt_level)
+        self.diagnostics = result.diagnostics
+        try:
+            result.output = self.run_pipeline(result, wrap_main, output, input_function, trace, profile, stop_after)
+        except Exception as e:
+            result.output = f"Compilation Error: {e}"
+        if not result.ok:
+            result.diagnostics.append(result.output.splitlines()[0] if result.output else "No output")
+            trace("diagnostic", result.diagnostics[-1])
+        if result.profile is not None:
+            trace("profile", result.profile.report(source_code))
+        trace("result", result)
+        if self.metrics is not None:
+            self.metrics(result)
+        return result
+
+    def run_pipeline(self, result, wrap_main, output, input_function, trace, profile=False, stop_after=None):
+        """
+        Run the phases of one compile, filling in result. Returns the text shown to the user.
+        """
+        source_code, target, opt_level = result.source_code, result.target, result.opt_level
+
+        # 🔹 Step 0: Compile cache
+        # A submission seen before skips the whole front end and code generation.
+        cache_key = None
+        if self.cache is not None and target in ("python", "assembly"):
+            with result.phase("cache"):
+                cache_key = self.cache.key(source_code, target, opt_level, wrap_main)
+                entry = self.cache.get(cache_key)
+            if entry is not None:
+                result.cache_hit = True
+                result.code, result.code_object, result.source_map = entry.final_code, entry.code_object, entry.source_map
+                result.token_count = entry.tokens
+                trace("cache", entry.final_code)
+                if stop_after is not None:
+                    return f"{SUCCESS_PREFIX}\n\n"
+                return self.finish(entry, output, input_function, result, trace, profile)
+
+        # 🔹 Step 1: Lexical Analysis
+        # Tokenize the source code once into a shared token buffer.
+        with result.phase("lex"):
+            result.tokens = tokenize(source_code, self.lexer)
+        result.token_count = len(result.tokens)
+        trace("tokens", result.tokens)
+
+        # 🔹 Step 2: Parsing
+        # Replay the buffered tokens to the parser to build the Abstract Syntax Tree (AST).
+        # The grammar actions record the source span of every node into a fresh spans table.
+        with result.phase("parse"):
+            result.spans = self.parser.spans = {}
+            result.ast = self.parser.parse(lexer=self.lexer, tokenfunc=result.tokens.token)
+        if not result.ast:
+            return "Parsing failed!"
+        trace("ast", result.ast)
+
+        # 🔹 Step 3: Semantic Analysis
+        # Perform semantic checks on the AST to ensure correctness.
+        try:
+            with result.phase("semantic"):
+                analyzer = SemanticAnalyzer()
+                analyzer.analyze(result.ast)
+        except Exception as e:
+            return f"Semantic Analysis Error: {e}"
+        trace("semantic", None)
+        if stop_after == "semantic":
+            return f"{SUCCESS_PREFIX}\n\n"
+
+        # 🔹 Step 4: Intermediate Representation (IR)
+        # Generate an intermediate representation of the code.
+        # The types recorded by the semantic pass select numeric or string '+'.
+        with result.phase("ir"):
+            _, ir_code = generate_ir(result.ast, analyzer.node_types, analyzer.frames, result.spans)
+        result.frames = analyzer.frames
+        trace("ir", ir_code)
+        # Frame sizes: resolved variable slots plus the temporaries generated for each scope.
+        trace("frames", list(analyzer.frames.values()))
+
+        # 🔹 Step 5: Optimization
+        # Run the IR passes selected by the optimization level.
+        with result.phase("optimize"):
+            result.ir, result.pass_stats = optimize(ir_code, opt_level)
+        if result.pass_stats:
+            trace("optimize", result.pass_stats)
+
+        # 🔹 Step 6: Code Generation
+        # Generate target code (Python or Assembly) from the IR, or run it on the VM.
+        if target == "python":
+            with result.phase("codegen"):
+                result.code, result.source_map = generate_mapped_code(result.ir, wrap_main)
+                # Compile the Python once; the code object is what gets cached and executed.
+                result.code_object = compile(result.code, GENERATED_FILENAME, "exec")
+        elif target == "assembly":
+            with result.phase("codegen"):
+                assembly = compile_assembly(result.ir)
+                result.code = str(assembly)
+            result.allocation_stats = assembly.stats
+            trace("allocation", assembly.stats)
+        elif target == "vm":
+            # The VM runs the IR directly: resolve labels and slots, then execute.
+            with result.phase("codegen"):
+                result.program = load_program(result.ir, analyzer.frames)
+            trace("vm", [result.program.main, *result.program.functions.values()])
+            if stop_after == "codegen":
+                return f"{SUCCESS_PREFIX}\n\n"
+            with result.phase("exec"):
+                return execute_vm(result.program, input_function=input_function, output=output)
+        else:
+            return "Unsupported target language!"
+        trace(target, result.code)
+
+        entry = CacheEntry(target, result.code, result.code_object, result.source_map, result.token_count)
+        if cache_key is not None:
+            self.cache.put(cache_key, entry)
+        if stop_after == "codegen":
+            return f"{SUCCESS_PREFIX}\n\n"
+
+        # 🔹 Step 7: Execute the Python code or emulate the assembly, and capture the output
+        return self.finish(entry, output, input_function, result, trace, profile)
+
+    def finish(self, entry, output=None, input_function=None, result=None, trace=None, profile=False):
+        """
+        Run the generated Python code, or emulate the generated assembly, and capture its output.
+        With a result, the run is timed as its exec phase and keeps the profile, if one was asked for.
+        """
+        input_function = input_function or self.input_function
+        profiler = None
+        if profile and entry.target == "python" and self.sandbox is None:
+            profiler = Profiler(entry.source_map)
+            if result is not None:
+                result.profile = profiler
+        with result.phase("exec") if result is not None else nullcontext():
+            if entry.target == "python" and self.sandbox is not None:
+                # Sandboxed programs cannot ask interactively: only scripted answers reach them.
+                inputs = input_function.answers[input_function.position:] if isinstance(input_function, ScriptedInput) else ()
+                return execute_sandboxed(self.sandbox, entry.code_object, output, inputs, entry.source_map, result)
+            elif entry.target == "python":
+                return execute_code(entry.code_object, input_function, output, entry.source_map, profiler)
+            else:
+                return execute_assembly(entry.final_code, input_function, output, trace)
+
+    def compile_code(self, source_code, target="python", show_tokens=True, opt_level=1, wrap_main=True,
+                     output=None, input_function=None, verbosity=0, profile=False):
+        """
+        Compile and run the source code and return only the text shown to the user.
+        Quiet unless verbosity is set: 1 prints diagnostics and phase timings (and the profile,
+        with profile), 2 also dumps every artifact (tokens only with show_tokens). See compile() for the rest.
+        """
+        trace = console_trace(verbosity, show_tokens) if verbosity else None
+        return self.compile(source_code, target, opt_level, wrap_main, output, input_function, trace, profile).output
+
+# Compile cache shared by the module-level compile_code().
+default_cache = CompileCache()
+
+def compile_code(source_code, target="python", show_tokens=True, opt_level=1, wrap_main=True, output=None,
+                 input_function=None, verbosity=0, profile=False):
+    """
+    Compile and run the source code in a new Compiler session backed by the shared cache.
+    """
+    return Compiler(default_cache).compile_code(source_code, target, show_tokens, opt_level, wrap_main, output,
+                                                input_function, verbosity, profile)
+
+def execute_code(code, input_function=my_input, output=None, source_map=None, profiler=None):
+    """
+    Execute the generated Python code (source text or code object) and capture its output.
+    The program's print() writes into an OutputSink instead of sys.stdout.
+    With the code's SourceMap, an error names the source line it came from.
+    With a Profiler, the program runs under it.
+    """
+    output = output if output is not None else OutputSink()
+    try:
+        # Provide our custom input() and print() functions in the execution environment.
+        # Capturing through print() instead of sys.stdout keeps concurrent runs apart.
+        exec_env = {"input": input_function, "print": output.print}
+
+        if profiler is not None:
+            profiler.runctx(code, exec_env)
+        else:
+            exec(code, exec_env)
+
+        return f"{SUCCESS_PREFIX}\n\n{output.getvalue()}"
+    except Exception as e:
+        line = source_map.error_line(e) if source_map is not None else None
+        return f"Execution Error{error_location(line)}: {e}"
+    finally:
+        output.close()
+
+def execute_sandboxed(sandbox, code, output=None, inputs=(), source_map=None, result=None):
+    """
+    Execute the generated Python code in a SandboxPool worker under its CPU, wall-clock,
+    memory and output limits. Input comes from the scripted answers in inputs, not a dialog.
+    The worker's output is passed on through the OutputSink when the job ends.
+    With the code's SourceMap, a failed or stopped job names the source line it was running.
+    With a CompileResult, the job's RunResult is kept in result.run.
+    """
+    output = output if output is not None else OutputSink()
+    run = sandbox.run(code, inputs)
+    if result is not None:
+        result.run = run
+    output.write(run.stdout)
+    output.close()
+    if run.ok:
+        return f"{SUCCESS_PREFIX}\n\n{output.getvalue()}"
+    line = source_map.source_line(run.line) if source_map is not None and run.line else None
+    status = f"{run.status}, line {line}" if line else run.status
+    return f"Execution Error ({status}): {run.error}\n\n{output.getvalue()}"
+
+def execute_vm(program, budget=DEFAULT_BUDGET, input_function=my_input, output=None):
+    """
+    Run a loaded program on the IR virtual machine and capture its output.
+    budget is the number of instructions the program may execute.
+    """
+    output = output if output is not None else OutputSink()
+    machine = VirtualMachine(program, budget, output.print, input_function)
+    try:
+        machine.run()
+
+        return f"{SUCCESS_PREFIX}\n\n{output.getvalue()}"
+    except Exception as e:
+        return f"Execution Error{error_location(machine.error_line)}: {e}"
+    finally:
+        output.close()
+
+def execute_assembly(listing, input_function=my_input, output=None, trace=None):
+    """
+    Run an assembly listing on the cycle-counting emulator and capture its output.
+    The cycle report goes to the trace hook, if there is one.
+    """
+    output = output if output is not None else OutputSink()
+    try:
+        report = Emulator(listing, print_function=output.print, input_function=input_function).run()
+        if trace is not None:
+            trace("emulator", report)
+
+        return f"{SUCCESS_PREFIX}\n\n{output.getvalue()}"
+    except Exception as e:
+        return f"Execution Error: {e}"
+    finally:
+        output.close()
+
+# Test the compiler with sample input.
+if __name__ == "__main__":
+    # Sample source code to test the compiler.
+    source_code = """
+    count is 3;
+    
+    keep (count > 0) { 
+        say("Count is: " + count);
+        count is count - 1;
+    }
+    
+    name is ask();  
+    say("Hello, " + name + "!");
+    """
+    output = compile_code(source_code, target="python", verbosity=2)
+    print("\n=== Execution Output ===")
+    print(output)
@@ -0,0 +1,286 @@
+# emulator.py
+
+# Cycle-counting emulator for the assembly produced by assembly.py. It models
+# the register file, a memory map of named slots per call frame (reads fall
+# back to the global frame), the value stack and the call stack, and charges
+# every executed instruction a cycle cost. The report gives total cycles,
+# the instruction mix and the hottest addresses, so backend changes can be
+# measured offline and their output checked against the Python backend.
+
+from ast import literal_eval
+from collections import Counter
+from .assembly import AsmInstr, AsmProgram, format_operand
+from .runtime_io import OutputSink, DEFAULT_MAX_CHARS
+
+# Default number of instructions a program may execute.
+DEFAULT_MAX_STEPS = 10_000_000
+
+# Base cycle cost of each mnemonic.
+CYCLES = {
+    "MOV": 1, "ADD": 1, "SUB": 1, "INC": 1, "AND": 1, "OR": 1, "NOT": 1,
+    "MUL": 3, "DIV": 20, "CAT": 8, "ADDX": 4,
+    "CMP": 1, "SETE": 1, "SETNE": 1, "SETL": 1, "SETG": 1, "SETLE": 1, "SETGE": 1,
+    "JMP": 1, "JZ": 1, "JE": 1, "JNE": 1, "JL": 1, "JG": 1, "JLE": 1, "JGE": 1,
+    "PUSH": 2, "POP": 2, "CALL": 5, "RET": 5,
+    "OUT": 20, "IN": 20, "HALT": 1,
+}
+
+# Extra cycles for every memory operand, and for a taken branch.
+MEMORY_CYCLES = 3
+TAKEN_BRANCH_CYCLES = 2
+
+# Comparison behind each condition code.
+CONDITION_TESTS = {
+    "E": lambda a, b: a == b,
+    "NE": lambda a, b: a != b,
+    "L": lambda a, b: a < b,
+    "G": lambda a, b: a > b,
+    "LE": lambda a, b: a <= b,
+    "GE": lambda a, b: a >= b,
+}
+
+# Two-address arithmetic: the Python operation behind each mnemonic.
+ALU = {
+    "ADD": lambda a, b: a + b,
+    "SUB": lambda a, b: a - b,
+    "MUL": lambda a, b: a * b,
+    "DIV": lambda a, b: a / b,
+    "CAT": lambda a, b: str(a) + str(b),
+    "ADDX": lambda a, b: str(a) + str(b) if isinstance(a, str) or isinstance(b, str) else a + b,
+    "AND": lambda a, b: a and b,
+    "OR": lambda a, b: a or b,
+}
+
+class EmulatorError(RuntimeError):
+    """
+    Raised for invalid programs and for programs that exceed their step budget.
+    """
+
+class EmulatorReport:
+    """
+    The result of an emulated run: output (the printed text, capped like any
+    OutputSink), total cycles, instructions executed, the instruction mix and
+    execution counts per address.
+    """
+    def __init__(self, code, output, cycles, steps, mix, address_counts):
+        self.code = code
+        self.output = output
+        self.cycles = cycles
+        self.steps = steps
+        self.mix = mix
+        self.address_counts = address_counts
+
+    def hot_addresses(self, count=5):
+        """
+        Return (address, executions, instruction) for the most executed addresses.
+        """
+        return [(address, executions, self.code[address])
+                for address, executions in self.address_counts.most_common(count)]
+
+    def __str__(self):
+        lines = [f"cycles: {self.cycles}  instructions: {self.steps}  "
+                 f"CPI: {self.cycles / self.steps if self.steps else 0:.2f}"]
+        lines.append("mix: " + ", ".join(f"{op} {count}" for op, count in self.mix.most_common()))
+        lines.append("hot addresses:")
+        for address, executions, instr in self.hot_addresses():
+            lines.append(f"  {address:4d} x{executions:<8d} {str(instr).strip()}")
+        return "\n".join(lines)
+
+def parse_operand(text):
+    """
+    Parse one operand of an assembly listing.
+    """
+    if text.startswith("[") and text.endswith("]"):
+        return ('mem', text[1:-1])
+    if text.startswith("#"):
+        return ('imm', literal_eval(text[1:]))
+    if text[:1] == "R" and text[1:].isdigit():
+        return ('reg', int(text[1:]))
+    return text  # A label.
+
+def split_operands(text):
+    """
+    Split an operand list on commas that are not inside a string immediate.
+    """
+    operands = []
+    current = []
+    quote = None
+    escaped = False
+    for char in text:
+        if quote is not None:
+            current.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+            current.append(char)
+        elif char == ",":
+            operands.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if current and "".join(current).strip():
+        operands.append("".join(current).strip())
+    return operands
+
+def parse_assembly(text):
+    """
+    Parse an assembly listing (as printed by AsmProgram) back into instructions.
+    """
+    code = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.endswith(":") and " " not in line:
+            code.append(AsmInstr("LABEL", line[:-1]))
+            continue
+        op, _, rest = line.partition(" ")
+        code.append(AsmInstr(op, *(parse_operand(operand) for operand in split_operands(rest))))
+    return code
+
+class Emulator:
+    """
+    Runs an assembly program. print_function and input_function implement OUT and IN.
+    The report keeps the last max_output characters of the output.
+    """
+    def __init__(self, program, registers=None, max_steps=DEFAULT_MAX_STEPS,
+                 print_function=print, input_function=input, max_output=DEFAULT_MAX_CHARS):
+        if isinstance(program, AsmProgram):
+            program = program.code
+        elif isinstance(program, str):
+            program = parse_assembly(program)
+        # Drop the labels and resolve them to addresses.
+        self.code = []
+        labels = {}
+        for instr in program:
+            if instr.op == "LABEL":
+                labels[instr.args[0]] = len(self.code)
+            else:
+                self.code.append(instr)
+        self.decoded = []
+        highest_register = 0
+        for instr in self.code:
+            args = []
+            for arg in instr.args:
+                if type(arg) is str:
+                    if arg not in labels:
+                        raise EmulatorError(f"Undefined label: {arg}")
+                    arg = labels[arg]
+                elif arg[0] == 'reg':
+                    highest_register = max(highest_register, arg[1])
+                args.append(arg)
+            if instr.op not in CYCLES:
+                raise EmulatorError(f"Unknown instruction: {instr}")
+            memory_operands = sum(1 for arg in args if type(arg) is tuple and arg[0] == 'mem')
+            self.decoded.append((instr.op, args, CYCLES[instr.op] + MEMORY_CYCLES * memory_operands))
+        self.registers = [None] * max(registers or 0, highest_register + 1)
+        self.max_steps = max_steps
+        self.print_function = print_function
+        self.input_function = input_function
+        self.max_output = max_output
+
+    def read(self, operand):
+        kind, value = operand
+        if kind == 'reg':
+            return self.registers[value]
+        elif kind == 'imm':
+            return value
+        frame = self.frames[-1]
+        if value in frame:
+            return frame[value]
+        if value in self.frames[0]:
+            return self.frames[0][value]
+        raise EmulatorError(f"Read of uninitialized memory slot [{value}]")
+
+    def write(self, operand, value):
+        kind, name = operand
+        if kind == 'reg':
+            self.registers[name] = value
+        elif kind == 'mem':
+            self.frames[-1][name] = value
+        else:
+            raise EmulatorError(f"Cannot write to {format_operand(operand)}")
+
+    def run(self):
+        """
+        Run the program from address 0 until HALT. Returns an EmulatorReport.
+        """
+        self.frames = [{}]
+        stack = []
+        calls = []
+        output = OutputSink(self.max_output)
+        flags = (None, None)
+        cycles = 0
+        steps = 0
+        counts = [0] * len(self.decoded)
+        decoded = self.decoded
+        read, write = self.read, self.write
+        pc = 0
+        while True:
+            if steps >= self.max_steps:
+                raise EmulatorError(f"Program exceeded {self.max_steps} steps")
+            if pc >= len(decoded):
+                raise EmulatorError(f"Execution ran past the end of the program at address {pc}")
+            op, args, cost = decoded[pc]
+            counts[pc] += 1
+            steps += 1
+            cycles += cost
+            pc += 1
+            if op == "MOV":
+                write(args[0], read(args[1]))
+            elif op in ALU:
+                write(args[0], ALU[op](read(args[0]), read(args[1])))
+            elif op == "CMP":
+                flags = (read(args[0]), read(args[1]))
+            elif op[0] == "J":
+                if op == "JMP":
+                    taken = True
+                elif op == "JZ":
+                    taken = not read(args[0])
+                else:
+                    taken = CONDITION_TESTS[op[1:]](*flags)
+                if taken:
+                    pc = args[-1]
+                    cycles += TAKEN_BRANCH_CYCLES
+            elif op == "INC":
+                write(args[0], read(args[0]) + 1)
+            elif op.startswith("SET"):
+                write(args[0], CONDITION_TESTS[op[3:]](*flags))
+            elif op == "NOT":
+                write(args[0], not read(args[0]))
+            elif op == "PUSH":
+                stack.append(read(args[0]))
+            elif op == "POP":
+                write(args[0], stack.pop())
+            elif op == "CALL":
+                calls.append(pc)
+                self.frames.append({})
+                pc = args[0]
+            elif op == "RET":
+                self.frames.pop()
+                pc = calls.pop()
+            elif op == "OUT":
+                value = read(args[0])
+                output.print(value)
+                self.print_function(value)
+            elif op == "IN":
+                write(args[0], self.input_function(read(args[1])))
+            elif op == "HALT":
+                break
+        address_counts = Counter({address: count for address, count in enumerate(counts) if count})
+        mix = Counter()
+        for address, count in address_counts.items():
+            mix[decoded[address][0]] += count
+        return EmulatorReport(self.code, output.getvalue(), cycles, steps, mix, address_counts)
+
+def run_assembly(program, max_steps=DEFAULT_MAX_STEPS, print_function=print, input_function=input):
+    """
+    Emulate an assembly program (AsmProgram, instruction list or listing text). Returns an EmulatorReport.
+    """
+    return Emulator(program, max_steps=max_steps, print_function=print_function,
+                    input_function=input_function).run()
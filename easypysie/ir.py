@@ -0,0 +1,239 @@
+# ir.py
+
+# Typed Intermediate Representation (IR) instructions.
+#
+# Operands use three kinds of values:
+#   int   -> a compiler temporary (printed as _t1, _t2, ...)
+#   str   -> a program variable or function name
+#   Const -> a literal value (number, float or string)
+# Label operands are ints in their own numbering (printed as L1, L2, ...).
+
+from enum import IntEnum
+
+class Op(IntEnum):
+    """
+    IR opcodes.
+    """
+    COPY = 0       # dest = a
+    ADD = 1        # dest = a + b (numbers)
+    SUB = 2        # dest = a - b
+    MUL = 3        # dest = a * b
+    DIV = 4        # dest = a / b
+    CONCAT = 5     # dest = str(a) + str(b)
+    EQ = 6         # dest = a == b
+    NE = 7         # dest = a != b
+    LT = 8         # dest = a < b
+    GT = 9         # dest = a > b
+    LE = 10        # dest = a <= b
+    GE = 11        # dest = a >= b
+    AND = 12       # dest = a && b
+    OR = 13        # dest = a || b
+    NOT = 14       # dest = !a
+    INPUT = 15     # dest = input(a)
+    PRINT = 16     # print(a)
+    LABEL = 17     # a: label id
+    GOTO = 18      # jump to label a
+    IF_FALSE = 19  # jump to label b when a is false
+    CALL = 20      # dest = a(*args)
+    RETURN = 21    # return a
+    FUNC = 22      # start of function a with parameters args
+    END_FUNC = 23  # end of function a
+    ADD_ANY = 24   # dest = a + b, as string concatenation if either side is a string
+    REPEAT = 25    # counted loop entry: dest = 0, jump to label b unless dest < a
+    LOOP = 26      # counted loop latch: dest += 1, jump back to label b while dest < a
+
+# Opcodes whose b operand is a label rather than a value.
+LABEL_B_OPS = frozenset({Op.IF_FALSE, Op.REPEAT, Op.LOOP})
+
+# Source operators for binary opcodes.
+BINARY_OPS = {
+    '+': Op.ADD, '-': Op.SUB, '*': Op.MUL, '/': Op.DIV,
+    '==': Op.EQ, '!=': Op.NE, '<': Op.LT, '>': Op.GT, '<=': Op.LE, '>=': Op.GE,
+    '&&': Op.AND, '||': Op.OR,
+}
+
+# Operator symbol for each binary opcode, used by the printer and the backends.
+OP_SYMBOLS = {op: symbol for symbol, op in BINARY_OPS.items()}
+OP_SYMBOLS[Op.CONCAT] = '+'
+OP_SYMBOLS[Op.ADD_ANY] = '+'
+
+class Const:
+    """
+    A literal operand.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return type(other) is Const and type(other.value) is type(self.value) and other.value == self.value
+
+    def __hash__(self):
+        return hash((type(self.value), self.value))
+
+    def __repr__(self):
+        return repr(self.value)
+
+class Instr:
+    """
+    A single IR instruction: an opcode plus operand slots.
+    span is the (line, column, end line) of the source statement it was generated from, if known.
+    """
+    __slots__ = ('op', 'dest', 'a', 'b', 'args', 'span')
+
+    def __init__(self, op, dest=None, a=None, b=None, args=None, span=None):
+        self.op = op
+        self.dest = dest
+        self.a = a
+        self.b = b
+        self.args = args
+        self.span = span
+
+    @property
+    def line(self):
+        """
+        The source line of the instruction, or 0 if unknown.
+        """
+        return self.span[0] if self.span is not None else 0
+
+    def __repr__(self):
+        return f"<Instr {format_instr(self)}>"
+
+    def __str__(self):
+        return format_instr(self)
+
+class IRBuilder:
+    """
+    Appends instructions to one growable buffer.
+    Every statement is given the [start, end) range of the instructions it produced.
+    """
+    def __init__(self):
+        self.code = []
+        # (statement node, start index, end index) for each generated statement.
+        self.ranges = []
+        # Source span given to the instructions emitted next.
+        self.span = None
+
+    def __len__(self):
+        return len(self.code)
+
+    def emit(self, op, dest=None, a=None, b=None, args=None):
+        """
+        Append a new instruction to the buffer.
+        """
+        self.code.append(Instr(op, dest, a, b, args, self.span))
+
+    def mark(self, node, start):
+        """
+        Record that the given statement produced the instructions from start to the current end.
+        """
+        self.ranges.append((node, start, len(self.code)))
+
+def is_temp(operand):
+    """
+    Return True if the operand is a compiler temporary.
+    """
+    return type(operand) is int
+
+# Temporaries are named with this prefix and their number in generated code and
+# listings. Program names of the same form are rejected by the semantic analyzer,
+# so a temporary never shadows a variable or function.
+TEMP_PREFIX = "_t"
+
+def temp_name(temp):
+    """
+    Return the name of a compiler temporary in generated code.
+    """
+    return f"{TEMP_PREFIX}{temp}"
+
+def is_temp_name(name):
+    """
+    Return True if a name has the form reserved for compiler temporaries.
+    """
+    return name.startswith(TEMP_PREFIX) and name[len(TEMP_PREFIX):].isdigit()
+
+def uses(instr):
+    """
+    Return the operands an instruction reads.
+    """
+    op = instr.op
+    if op == Op.CALL:
+        return instr.args
+    if op in (Op.LABEL, Op.GOTO, Op.FUNC, Op.END_FUNC):
+        return ()
+    if instr.b is not None and op not in LABEL_B_OPS:
+        return (instr.a, instr.b)
+    return (instr.a,)
+
+def replace_uses(instr, mapping):
+    """
+    Rewrite the operands an instruction reads using the given mapping.
+    """
+    op = instr.op
+    if op == Op.CALL:
+        instr.args = [mapping.get(arg, arg) if type(arg) is not Const else arg for arg in instr.args]
+    elif op not in (Op.LABEL, Op.GOTO, Op.FUNC, Op.END_FUNC):
+        if instr.a is not None and type(instr.a) is not Const:
+            instr.a = mapping.get(instr.a, instr.a)
+        if op not in LABEL_B_OPS and instr.b is not None and type(instr.b) is not Const:
+            instr.b = mapping.get(instr.b, instr.b)
+
+def count_temp_uses(ir_code):
+    """
+    Count how many times each temporary is read across the whole program.
+    """
+    counts = {}
+    for instr in ir_code:
+        for operand in uses(instr):
+            if type(operand) is int:
+                counts[operand] = counts.get(operand, 0) + 1
+    return counts
+
+def format_operand(operand):
+    """
+    Format an operand for debugging output.
+    """
+    if type(operand) is int:
+        return temp_name(operand)
+    return repr(operand) if type(operand) is Const else str(operand)
+
+def format_instr(instr):
+    """
+    Format an instruction in the textual IR notation (debugging only).
+    """
+    op = instr.op
+    dest = format_operand(instr.dest) if instr.dest is not None else None
+    a = format_operand(instr.a) if instr.a is not None else None
+    b = format_operand(instr.b) if instr.b is not None else None
+    if op == Op.COPY:
+        return f"{dest} = {a}"
+    elif op == Op.CONCAT:
+        return f"{dest} = str({a}) + str({b})"
+    elif op in OP_SYMBOLS:
+        return f"{dest} = {a} {OP_SYMBOLS[op]} {b}"
+    elif op == Op.NOT:
+        return f"{dest} = ! {a}"
+    elif op == Op.INPUT:
+        return f"{dest} = input({a})"
+    elif op == Op.PRINT:
+        return f"PRINT {a}"
+    elif op == Op.LABEL:
+        return f"LABEL L{instr.a}"
+    elif op == Op.GOTO:
+        return f"GOTO L{instr.a}"
+    elif op == Op.IF_FALSE:
+        return f"IF_FALSE {a} GOTO L{instr.b}"
+    elif op == Op.REPEAT:
+        return f"REPEAT {dest} IN range({a}) ELSE GOTO L{instr.b}"
+    elif op == Op.LOOP:
+        return f"LOOP {dest} IN range({a}) GOTO L{instr.b}"
+    elif op == Op.CALL:
+        return f"{dest} = {instr.a}({', '.join(format_operand(arg) for arg in instr.args)})"
+    elif op == Op.RETURN:
+        return f"return {a}"
+    elif op == Op.FUNC:
+        return f"FUNC {instr.a}({', '.join(instr.args)})"
+    elif op == Op.END_FUNC:
+        return f"END_FUNC {instr.a}"
+    raise ValueError(f"Unknown IR opcode: {op}")
@@ -0,0 +1,235 @@
+# ir_generator.py
+
+from ast import literal_eval
+from .ir import Op, Const, IRBuilder, BINARY_OPS
+
+class IRGenerator:
+    """
+    Generates IR for one compilation.
+    Owns its own temporary counter, so concurrent compiles never share names.
+    All instructions are appended to a single IRBuilder buffer, so emission
+    is linear in the size of the program.
+    """
+    def __init__(self, builder=None, node_types=None, frames=None, spans=None):
+        self.builder = builder or IRBuilder()
+        # Types inferred by the semantic pass, keyed by id() of the AST node.
+        self.node_types = node_types if node_types is not None else {}
+        # Source spans recorded by the parser, keyed by id() of the AST node.
+        self.spans = spans if spans is not None else {}
+        # Frames resolved by the semantic pass; every temporary gets a slot in the frame it belongs to.
+        self.frames = frames
+        self.frame = frames.get(None) if frames is not None else None
+        # Counter for generating unique temporary variables.
+        self.temp_counter = 0
+        # Counter for generating unique labels.
+        self.label_counter = 0
+
+    def new_temp(self):
+        """
+        Generate a new temporary variable.
+        """
+        self.temp_counter += 1
+        if self.frame is not None:
+            self.frame.add_temp(self.temp_counter)
+        return self.temp_counter
+
+    def new_label(self):
+        """
+        Generate a new label id.
+        """
+        self.label_counter += 1
+        return self.label_counter
+
+    def generate_block(self, statements):
+        """
+        Generate IR for a list of statements, recording each statement's instruction range.
+        Instructions carry the span of the statement they belong to; the enclosing
+        statement's span is restored afterwards for the jumps and labels that close it.
+        """
+        builder = self.builder
+        spans = self.spans
+        outer_span = builder.span
+        for stmt in statements:
+            start = len(builder.code)
+            builder.span = spans.get(id(stmt), outer_span)
+            self.generate(stmt)
+            builder.mark(stmt, start)
+        builder.span = outer_span
+
+    def generate(self, node):
+        """
+        Generate Intermediate Representation (IR) for the given AST node.
+        Instructions are appended to the builder; the result operand is returned.
+        """
+        emit = self.builder.emit
+        node_type = node[0]
+
+        # Handle number literals.
+        if node_type == 'number':
+            return Const(node[1])
+
+        # Handle input statements.
+        elif node_type == 'input':
+            var_name = node[1]
+            prompt_result = self.generate(node[2]) if node[2] else Const("")
+            emit(Op.INPUT, var_name, prompt_result)
+            return var_name
+
+        # Handle float literals.
+        elif node_type == 'float':
+            return Const(node[1])
+
+        # Handle variable usage.
+        elif node_type == 'var':
+            return node[1]
+
+        # Handle string literals.
+        elif node_type == 'string':
+            # The lexer keeps escape sequences as written; decode them like a Python literal.
+            return Const(literal_eval(f'"{node[1]}"'))
+
+        # Handle binary operations.
+        elif node_type == 'binop':
+            op = node[1]
+            left_result = self.generate(node[2])
+            right_result = self.generate(node[3])
+
+            temp = self.new_temp()
+            if op == '+':
+                # Use the inferred type: numeric add, string concatenation,
+                # or a runtime check when the type is not fixed for the whole
+                # program ('mixed', see SemanticAnalyzer.fix_types()) or unknown.
+                result_type = self.node_types.get(id(node))
+                if result_type in ('int', 'float'):
+                    emit(Op.ADD, temp, left_result, right_result)
+                elif result_type == 'string':
+                    emit(Op.CONCAT, temp, left_result, right_result)
+                else:
+                    emit(Op.ADD_ANY, temp, left_result, right_result)
+            else:
+                emit(BINARY_OPS[op], temp, left_result, right_result)
+            return temp
+
+        # Handle variable assignment.
+        elif node_type == 'assign':
+            var_name = node[1]
+            expr_result = self.generate(node[2])
+            emit(Op.COPY, var_name, expr_result)
+            return var_name
+
+        # Handle logical operations.
+        elif node_type == 'logic':
+            op = node[1]
+            left_result = self.generate(node[2])
+            right_result = self.generate(node[3])
+
+            temp = self.new_temp()
+            emit(BINARY_OPS[op], temp, left_result, right_result)
+            return temp
+
+        # Handle NOT logical operation.
+        elif node_type == 'not':
+            expr_result = self.generate(node[1])
+            temp = self.new_temp()
+            emit(Op.NOT, temp, expr_result)
+            return temp
+
+        # Handle program node (list of statements).
+        elif node_type == 'program':
+            self.generate_block(node[1])
+            return None
+
+        # Handle print statements.
+        elif node_type == 'print':
+            expr_result = self.generate(node[1])
+            emit(Op.PRINT, a=expr_result)
+            return None
+
+        # Handle if-else statements.
+        elif node_type == 'ifelse':
+            # Generate labels for branching
+            else_label = self.new_label()
+            end_label = self.new_label()
+
+            condition_result = self.generate(node[1])  # Generate IR for the condition
+            emit(Op.IF_FALSE, a=condition_result, b=else_label)
+            self.generate_block(node[2])  # Generate IR for the 'if' block
+            emit(Op.GOTO, a=end_label)
+            emit(Op.LABEL, a=else_label)
+            if len(node) > 3:  # If there's an 'otherwise' block
+                self.generate_block(node[3])
+            emit(Op.LABEL, a=end_label)
+            return None
+
+        # Handle while loops.
+        elif node_type == 'while':
+            start_label = self.new_label()
+            end_label = self.new_label()
+
+            emit(Op.LABEL, a=start_label)
+            condition_result = self.generate(node[1])
+            emit(Op.IF_FALSE, a=condition_result, b=end_label)
+            self.generate_block(node[2])
+            emit(Op.GOTO, a=start_label)
+            emit(Op.LABEL, a=end_label)
+            return None
+
+        # Handle function declarations.
+        elif node_type == 'function':
+            func_name = node[1]
+            outer_frame = self.frame
+            if self.frames is not None:
+                self.frame = self.frames[func_name]
+            emit(Op.FUNC, a=func_name, args=list(node[2]))
+            self.generate_block(node[3])
+            emit(Op.END_FUNC, a=func_name)
+            self.frame = outer_frame
+            return None
+
+        # Handle return statements.
+        elif node_type == 'return':
+            expr_result = self.generate(node[1])
+            emit(Op.RETURN, a=expr_result)
+            return None
+
+        # Handle function calls.
+        elif node_type == 'call':
+            arg_results = [self.generate(arg) for arg in node[2]]
+            temp = self.new_temp()
+            emit(Op.CALL, temp, node[1], args=arg_results)
+            return temp
+
+        # Handle repeat loops.
+        elif node_type == 'repeat':
+            count_result = self.generate(node[1])
+            if type(count_result) is str:
+                # The count is evaluated once, even if the body reassigns the variable.
+                count_temp = self.new_temp()
+                emit(Op.COPY, count_temp, count_result)
+                count_result = count_temp
+            loop_counter = self.new_temp()
+
+            body_label = self.new_label()
+            end_label = self.new_label()
+
+            emit(Op.REPEAT, loop_counter, count_result, end_label)
+            emit(Op.LABEL, a=body_label)
+            self.generate_block(node[2])
+            emit(Op.LOOP, loop_counter, count_result, body_label)
+            emit(Op.LABEL, a=end_label)
+            return None
+
+        # Raise an error for unsupported node types.
+        else:
+            raise NotImplementedError(f"IR generation not implemented for node type: {node_type}")
+
+def generate_ir(node, node_types=None, frames=None, spans=None):
+    """
+    Generate Intermediate Representation (IR) for the given AST node with a fresh generator.
+    node_types and frames hold the types and slot layouts recorded by SemanticAnalyzer;
+    spans holds the source spans recorded by the parser.
+    Returns a (result operand, instruction list) pair.
+    """
+    generator = IRGenerator(node_types=node_types, frames=frames, spans=spans)
+    result = generator.generate(node)
+    return (result, generator.builder.code)
@@ -0,0 +1,127 @@
+# jobs.py
+
+# Background compile-and-run jobs for the GUI. A CompileJob runs the whole
+# pipeline on a worker thread and never touches Tk itself: its result, and
+# every ask() and every chunk of output of the program, are posted to an
+# event queue that the main thread polls. A job can be stopped at any time by raising JobCancelled
+# inside its thread.
+
+import ctypes
+import queue
+import threading
+import time
+from .compiler import Compiler, default_cache
+from .runtime_io import OutputSink, DEFAULT_MAX_CHARS
+
+# Job states.
+RUNNING = "running"
+STOPPING = "stopping"
+DONE = "done"
+CANCELLED = "cancelled"
+
+# Kinds of the events that ask the main thread for input and stream the program's output;
+# the other events are job results.
+INPUT = "input"
+OUTPUT = "output"
+
+STOPPED_MESSAGE = "⏹ Program stopped."
+
+class JobCancelled(BaseException):
+    """
+    Raised inside a job's thread to stop it. It derives from BaseException so the
+    `except Exception` handlers of the compiler and of the running program cannot swallow it.
+    """
+
+class CompileJob:
+    """
+    Compiles and runs one program on a daemon thread.
+    events receives (INPUT, prompt) whenever the program calls ask(), to be answered
+    with answer(), (OUTPUT, text) for every chunk the program prints, and finally
+    (DONE, output) or (CANCELLED, message). Once done, result holds the CompileResult
+    (e.g. its profile, when the job was started with profile=True).
+    """
+    def __init__(self, source_code, target="python", cache=default_cache, max_output=DEFAULT_MAX_CHARS, **options):
+        self.source_code = source_code
+        self.target = target
+        self.options = options
+        self.compiler = Compiler(cache, input_function=self.ask, metrics=self._record)
+        self.result = None
+        self.events = queue.Queue()
+        self.output = OutputSink(max_output, [lambda chunk: self.events.put((OUTPUT, chunk))])
+        self.answers = queue.Queue()
+        self.status = RUNNING
+        self.started = None
+        self.finished = None
+        # Held while a cancellation is delivered, so none can arrive after the job has finished.
+        self.lock = threading.Lock()
+        self.cancellable = True
+        self.thread = threading.Thread(target=self._run, name="easypysie-job", daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.thread.start()
+        return self
+
+    def _run(self):
+        try:
+            output = self.compiler.compile_code(self.source_code, self.target, output=self.output, **self.options)
+            status = DONE
+        except JobCancelled:
+            status, output = CANCELLED, STOPPED_MESSAGE
+        # A cancellation requested just as the compiler returned may still be pending.
+        while True:
+            try:
+                with self.lock:
+                    self.cancellable = False
+                break
+            except JobCancelled:
+                status, output = CANCELLED, STOPPED_MESSAGE
+        self.finished = time.perf_counter()
+        self.status = status
+        self.events.put((status, output))
+
+    def _record(self, result):
+        self.result = result
+
+    def ask(self, prompt=""):
+        """
+        The program's input function: post the prompt to the main thread and wait for its answer.
+        """
+        self.events.put((INPUT, prompt))
+        return self.answers.get()
+
+    def answer(self, text):
+        """
+        Answer the pending ask() from the main thread.
+        """
+        self.answers.put(text if text is not None else "")
+
+    def cancel(self):
+        """
+        Stop the job. Python code in the job's thread is interrupted at its next
+        bytecode; a job blocked inside a C call stops as soon as that call returns.
+        Returns False when the job has already finished.
+        """
+        with self.lock:
+            if self.thread.ident is None or not self.cancellable:
+                return False
+            if self.status == STOPPING:
+                return True
+            self.status = STOPPING
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self.thread.ident),
+                                                       ctypes.py_object(JobCancelled))
+        # Wake an ask() that is waiting for an answer so the cancellation is raised there.
+        self.answers.put("")
+        return True
+
+    @property
+    def elapsed(self):
+        """
+        Seconds since the job started, up to when it finished.
+        """
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def __repr__(self):
+        return f"<CompileJob {self.target} {self.status} {self.elapsed:.2f} s>"
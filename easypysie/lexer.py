@@ -0,0 +1,216 @@
+#lexer.py
+
+# Import the PLY library for lexical analysis.
+from array import array
+import ply.lex as lex
+
+# List of token names used in the language.
+tokens = [
+    # Basic tokens for numbers, strings, and identifiers.
+    'NUMBER', 'FLOAT', 'STRING', 'IDENTIFIER',
+    # Arithmetic operators.
+    'PLUS', 'MINUS', 'TIMES', 'DIVIDE',
+    # Comparison operators.
+    'EQ', 'NEQ', 'LT', 'GT', 'LEQ', 'GEQ',
+    # Logical operators.
+    'AND', 'OR', 'NOT',
+    # Assignment operator.
+    'ASSIGN',
+    # Parentheses and braces.
+    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE',
+    # Punctuation.
+    'SEMICOLON', 'COMMA'
+]
+
+# Reserved keywords with kid-friendly syntax.
+reserved = {
+    'check': 'CHECK',        # if → check
+    'otherwise': 'OTHERWISE',# else → otherwise
+    'keep': 'KEEP',          # while → keep
+    'repeat': 'REPEAT',      # for → repeat
+    'create': 'CREATE',      # function → create
+    'say': 'SAY',            # print → say
+    'ask': 'ASK',            # input → ask
+    'give': 'GIVE',          # return → give
+    'is': 'IS'               # assignment → is
+}
+
+# Combine tokens and reserved keywords.
+tokens = tokens + list(reserved.values())
+
+# Regular expression rules for simple tokens.
+t_PLUS      = r'\+'
+t_MINUS     = r'-'
+t_TIMES     = r'\*'
+t_DIVIDE    = r'/'
+t_ASSIGN    = r'='
+t_LPAREN    = r'\('
+t_RPAREN    = r'\)'
+t_LBRACE    = r'\{'
+t_RBRACE    = r'\}'
+t_SEMICOLON = r';'
+t_COMMA     = r','
+
+# Multi-character operators.
+t_EQ        = r'=='
+t_NEQ       = r'!='
+t_LEQ       = r'<='
+t_GEQ       = r'>='
+t_LT        = r'<'
+t_GT        = r'>'
+t_AND       = r'&&'
+t_OR        = r'\|\|'
+t_NOT       = r'!'
+
+# Rule for floating-point numbers.
+def t_FLOAT(t):
+    r'\d+\.\d+'
+    t.value = float(t.value)  # Convert to float.
+    return t
+
+# Rule for integer numbers.
+def t_NUMBER(t):
+    r'\d+'
+    t.value = int(t.value)  # Convert to integer.
+    return t
+
+# Rule for string literals.
+def t_STRING(t):
+    r'\"([^\\\n]|(\\.))*?\"'
+    t.value = t.value[1:-1]  # Remove quotes.
+    return t
+
+# Rule for identifiers and reserved words.
+def t_IDENTIFIER(t):
+    r'[a-zA-Z_][a-zA-Z_0-9]*'
+    t.type = reserved.get(t.value, 'IDENTIFIER')  # Check if it's a reserved word.
+    return t
+
+# Rule for handling newlines.
+def t_newline(t):
+    r'\n+'
+    t.lexer.lineno += len(t.value)  # Update line number.
+
+# Characters to ignore (spaces and tabs).
+t_ignore = ' \t'
+
+# Error handling rule for illegal characters.
+def t_error(t):
+    print(illegal_character_message(t))
+    t.lexer.skip(1)
+
+def illegal_character_message(t):
+    return f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}"
+
+# Build the lexer from the prebuilt lextab.py in this package, which skips
+# validating the rules and assembling the master regex on every import.
+# lextab.py is not checked against the rules above: regenerate it with
+# easypysie.parser.build_tables() after changing a token.
+lexer = lex.lex(optimize=True, lextab="lextab")
+
+# Numeric codes for token types, used by the compact token buffer.
+token_codes = {name: code for code, name in enumerate(tokens)}
+
+class TokenStream:
+    """
+    Token buffer produced by a single pass of the lexer.
+    Tokens are stored column-wise in compact arrays (type code, value, line,
+    column) and replayed to the parser through PLY's tokenfunc hook.
+    """
+    def __init__(self):
+        self.types = array('B')
+        self.values = []
+        self.lines = array('I')
+        self.columns = array('I')
+        self.positions = array('I')
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self.types)
+
+    def append(self, tok, column):
+        """
+        Store a token produced by the lexer.
+        """
+        self.types.append(token_codes[tok.type])
+        self.values.append(tok.value)
+        self.lines.append(tok.lineno)
+        self.columns.append(column)
+        self.positions.append(tok.lexpos)
+
+    def _make_token(self, index):
+        """
+        Rebuild a PLY token object for the buffered token at the given index.
+        """
+        tok = lex.LexToken()
+        tok.type = tokens[self.types[index]]
+        tok.value = self.values[index]
+        tok.lineno = self.lines[index]
+        tok.lexpos = self.positions[index]
+        tok.col = self.columns[index]
+        return tok
+
+    def token(self):
+        """
+        Return the next token, or None at the end of the buffer.
+        Matches the interface PLY expects from tokenfunc.
+        """
+        if self._cursor >= len(self.types):
+            return None
+        tok = self._make_token(self._cursor)
+        self._cursor += 1
+        return tok
+
+    def rewind(self):
+        """
+        Move the read cursor back to the first token.
+        """
+        self._cursor = 0
+
+    def __iter__(self):
+        # Iterating does not disturb the parser's read cursor.
+        for index in range(len(self.types)):
+            yield self._make_token(index)
+
+    def dump(self):
+        """
+        Format the buffered tokens for the diagnostic dump.
+        """
+        return "\n".join(str(tok) for tok in self)
+
+def tokenize(source_code, lex_obj=None):
+    """
+    Tokenize the source code once and return a TokenStream.
+    """
+    lex_obj = lex_obj or lexer
+    lex_obj.lineno = 1
+    lex_obj.input(source_code)
+    stream = TokenStream()
+    line_start = 0
+    last_pos = 0
+    for tok in lex_obj:
+        # Find the start of the current line to compute a 1-based column.
+        newline = source_code.rfind("\n", last_pos, tok.lexpos)
+        if newline != -1:
+            line_start = newline + 1
+        last_pos = tok.lexpos
+        stream.append(tok, tok.lexpos - line_start + 1)
+    return stream
+
+# Test the lexer with sample input.
+if __name__ == "__main__":
+    data = '''
+    create add(a, b) {
+        give a + b;
+    }
+    say("Result: " + add(3, 4));
+    check (a < 10) {
+        say("a is less than 10");
+    } otherwise {
+        say("a is 10 or more");
+    }
+    keep (a > 0) {
+        a = a - 1;
+    }
+    '''
+    print(tokenize(data).dump())
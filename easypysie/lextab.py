@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASK', 'ASSIGN', 'CHECK', 'COMMA', 'CREATE', 'DIVIDE', 'EQ', 'FLOAT', 'GEQ', 'GIVE', 'GT', 'IDENTIFIER', 'IS', 'KEEP', 'LBRACE', 'LEQ', 'LPAREN', 'LT', 'MINUS', 'NEQ', 'NOT', 'NUMBER', 'OR', 'OTHERWISE', 'PLUS', 'RBRACE', 'REPEAT', 'RPAREN', 'SAY', 'SEMICOLON', 'STRING', 'TIMES'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT>\\d+\\.\\d+)|(?P<t_NUMBER>\\d+)|(?P<t_STRING>\\"([^\\\\\\n]|(\\\\.))*?\\")|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_newline>\\n+)|(?P<t_OR>\\|\\|)|(?P<t_AND>&&)|(?P<t_EQ>==)|(?P<t_GEQ>>=)|(?P<t_LBRACE>\\{)|(?P<t_LEQ><=)|(?P<t_LPAREN>\\()|(?P<t_NEQ>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_ASSIGN>=)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_NOT>!)|(?P<t_SEMICOLON>;)', [None, ('t_FLOAT', 'FLOAT'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_newline', 'newline'), (None, 'OR'), (None, 'AND'), (None, 'EQ'), (None, 'GEQ'), (None, 'LBRACE'), (None, 'LEQ'), (None, 'LPAREN'), (None, 'NEQ'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'ASSIGN'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'NOT'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
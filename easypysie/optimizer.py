@@ -0,0 +1,248 @@
+# optimizer.py
+
+# IR optimization passes and the pass manager that runs them between
+# IR generation and code generation.
+
+from .ir import Op, Const, is_temp, uses, replace_uses, count_temp_uses
+from .cfg import TERMINATORS
+
+# Opcodes that compute a value from their operands without side effects.
+# DIV is left out because removing or folding it could hide a division by zero.
+PURE_OPS = frozenset({
+    Op.COPY, Op.ADD, Op.SUB, Op.MUL, Op.CONCAT, Op.ADD_ANY,
+    Op.EQ, Op.NE, Op.LT, Op.GT, Op.LE, Op.GE,
+    Op.AND, Op.OR, Op.NOT,
+})
+
+# Python evaluation of foldable opcodes on constant operands.
+FOLDERS = {
+    Op.ADD: lambda a, b: a + b,
+    Op.SUB: lambda a, b: a - b,
+    Op.MUL: lambda a, b: a * b,
+    Op.DIV: lambda a, b: a / b,
+    Op.CONCAT: lambda a, b: str(a) + str(b),
+    Op.ADD_ANY: lambda a, b: str(a) + str(b) if isinstance(a, str) or isinstance(b, str) else a + b,
+    Op.EQ: lambda a, b: a == b,
+    Op.NE: lambda a, b: a != b,
+    Op.LT: lambda a, b: a < b,
+    Op.GT: lambda a, b: a > b,
+    Op.LE: lambda a, b: a <= b,
+    Op.GE: lambda a, b: a >= b,
+    Op.AND: lambda a, b: a and b,
+    Op.OR: lambda a, b: a or b,
+}
+
+def split_blocks(ir_code):
+    """
+    Return the basic blocks of the IR as (start, end) index ranges, in program order.
+    These are the CFG's leaf blocks: a block starts at a label or a function and
+    ends after a terminator. No CFG is built, as the passes only need the ranges.
+    """
+    blocks = []
+    block_start = 0
+    for i, instr in enumerate(ir_code):
+        op = instr.op
+        if (op == Op.LABEL or op == Op.FUNC) and i > block_start:
+            blocks.append((block_start, i))
+            block_start = i
+        if op in TERMINATORS:
+            blocks.append((block_start, i + 1))
+            block_start = i + 1
+    if block_start < len(ir_code):
+        blocks.append((block_start, len(ir_code)))
+    return blocks
+
+def constant_folding(ir_code):
+    """
+    Propagate constants within each basic block and evaluate operations whose
+    operands are all constant.
+    """
+    for start, end in split_blocks(ir_code):
+        known = {}
+        for instr in ir_code[start:end]:
+            replace_uses(instr, known)
+            op = instr.op
+            if op in FOLDERS and type(instr.a) is Const and type(instr.b) is Const:
+                if op == Op.DIV and not instr.b.value:
+                    pass  # Leave the division by zero to fail at runtime.
+                else:
+                    instr.op, instr.a, instr.b = Op.COPY, Const(FOLDERS[op](instr.a.value, instr.b.value)), None
+            elif op == Op.NOT and type(instr.a) is Const:
+                instr.op, instr.a = Op.COPY, Const(not instr.a.value)
+            dest = instr.dest
+            if dest is not None:
+                # Any earlier fact about the destination is now stale.
+                known.pop(dest, None)
+                if instr.op == Op.COPY and type(instr.a) is Const:
+                    known[dest] = instr.a
+    # A counted loop's trip count is fixed on entry, so a constant count also holds at its latch.
+    trip_counts = {instr.dest: instr.a for instr in ir_code if instr.op == Op.REPEAT and type(instr.a) is Const}
+    for instr in ir_code:
+        if instr.op == Op.LOOP and instr.dest in trip_counts:
+            instr.a = trip_counts[instr.dest]
+    return ir_code
+
+def copy_propagation(ir_code):
+    """
+    Within each basic block, read copied values from their source and fold
+    `tN = <expr>; x = tN` into `x = <expr>` when tN has no other use.
+    """
+    temp_uses = count_temp_uses(ir_code)
+    result = []
+    for start, end in split_blocks(ir_code):
+        copies = {}
+        # The names copied from each source, so a redefinition only visits its own copies.
+        copied_from = {}
+        block_start = len(result)
+        for instr in ir_code[start:end]:
+            replace_uses(instr, copies)
+            previous = result[-1] if len(result) > block_start else None
+            if (instr.op == Op.COPY and is_temp(instr.a) and temp_uses.get(instr.a) == 1
+                    and previous is not None and previous.dest == instr.a):
+                # Retarget the producing instruction and drop the copy.
+                previous.dest = instr.dest
+                temp_uses[instr.a] = 0
+                instr = previous
+                result.pop()
+            dest = instr.dest
+            if dest is not None:
+                # Forget copies that read or write the redefined name.
+                source = copies.pop(dest, None)
+                if source is not None:
+                    copied_from[source].discard(dest)
+                for name in copied_from.pop(dest, ()):
+                    del copies[name]
+                if instr.op == Op.COPY and instr.a != dest:
+                    copies[dest] = instr.a
+                    copied_from.setdefault(instr.a, set()).add(dest)
+            result.append(instr)
+    return result
+
+def dead_temp_elimination(ir_code):
+    """
+    Remove side-effect free instructions whose temporary result is never read.
+    """
+    while True:
+        temp_uses = count_temp_uses(ir_code)
+        result = [instr for instr in ir_code
+                  if not (instr.op in PURE_OPS and is_temp(instr.dest) and not temp_uses.get(instr.dest))]
+        if len(result) == len(ir_code):
+            return result
+        ir_code = result
+
+def dead_store_elimination(ir_code):
+    """
+    Within each basic block, remove side-effect free stores that are
+    overwritten before they are read. Calls end the search because a
+    function may read a global variable.
+    """
+    dead = set()
+    for start, end in split_blocks(ir_code):
+        pending = {}
+        for index in range(start, end):
+            instr = ir_code[index]
+            if instr.op == Op.CALL:
+                pending.clear()
+            for operand in uses(instr):
+                pending.pop(operand, None)
+            dest = instr.dest
+            if dest is not None:
+                if dest in pending:
+                    dead.add(pending[dest])
+                if instr.op in PURE_OPS:
+                    pending[dest] = index
+                else:
+                    pending.pop(dest, None)
+    return [instr for index, instr in enumerate(ir_code) if index not in dead]
+
+def common_subexpression_elimination(ir_code):
+    """
+    Within each basic block, reuse the result of an identical earlier computation.
+    """
+    for start, end in split_blocks(ir_code):
+        available = {}
+        # The expressions each operand is read by or holds, so a redefinition only visits its own.
+        related = {}
+
+        def forget(key):
+            holder = available.pop(key)
+            for operand in (holder, *key[1:]):
+                keys = related.get(operand)
+                if keys is not None:
+                    keys.discard(key)
+
+        for instr in ir_code[start:end]:
+            op = instr.op
+            key = None
+            if op in PURE_OPS and op != Op.COPY:
+                key = (op, instr.a, instr.b)
+                if key in available:
+                    instr.op, instr.a, instr.b = Op.COPY, available[key], None
+            dest = instr.dest
+            if dest is not None:
+                # Drop expressions that read or are held by the redefined name.
+                for stale in related.pop(dest, ()):
+                    if stale in available:
+                        forget(stale)
+                if key is not None and instr.op != Op.COPY and dest not in key[1:]:
+                    available[key] = dest
+                    for operand in (dest, *key[1:]):
+                        if operand is not None:
+                            related.setdefault(operand, set()).add(key)
+    return ir_code
+
+# Passes run at each optimization level.
+PIPELINES = {
+    0: [],
+    1: [constant_folding, copy_propagation, dead_temp_elimination],
+    2: [constant_folding, copy_propagation, common_subexpression_elimination,
+        copy_propagation, dead_store_elimination, dead_temp_elimination],
+}
+
+class PassStats:
+    """
+    Statistics for one pass run.
+    """
+    __slots__ = ('name', 'before', 'after')
+
+    def __init__(self, name, before, after):
+        self.name = name
+        self.before = before
+        self.after = after
+
+    @property
+    def removed(self):
+        return self.before - self.after
+
+    def __str__(self):
+        return f"{self.name}: {self.before} -> {self.after} instructions ({self.removed} removed)"
+
+class PassManager:
+    """
+    Runs the optimization pipeline for a given level (0-2) and keeps per-pass statistics.
+    """
+    def __init__(self, level=1, passes=None):
+        if passes is None:
+            if level not in PIPELINES:
+                raise ValueError(f"Unsupported optimization level: {level}")
+            passes = PIPELINES[level]
+        self.level = level
+        self.passes = list(passes)
+        self.stats = []
+
+    def run(self, ir_code):
+        """
+        Run every pass in order and return the optimized IR.
+        """
+        for optimization_pass in self.passes:
+            before = len(ir_code)
+            ir_code = optimization_pass(ir_code)
+            self.stats.append(PassStats(optimization_pass.__name__, before, len(ir_code)))
+        return ir_code
+
+def optimize(ir_code, level=1):
+    """
+    Optimize the IR at the given level. Returns (optimized IR, list of PassStats).
+    """
+    manager = PassManager(level)
+    return manager.run(ir_code), manager.stats
@@ -1,6 +1,10 @@
 #parser.py
+import copy
+import os
+import sys
+import ply.lex as lex
 import ply.yacc as yacc
-from lexer import tokens
+from .lexer import tokens
 
 # Define operator precedence and associativity.
 precedence = (
@@ -14,10 +18,33 @@ precedence = (
 # Dictionary for variable storage, if needed.
 names = {}
 
+# Terminal symbols, to tell tokens from already reduced nodes in a production.
+TOKEN_TYPES = frozenset(tokens)
+
+def mark(p, node):
+    """
+    Record the source span of a newly built AST node and return the node.
+    Spans are kept in the parser's spans table (when the session installed one),
+    keyed by id() of the node, as (line, column, end line).
+    """
+    spans = getattr(p.parser, 'spans', None)
+    if spans is not None:
+        first, last = p.slice[1], p.slice[-1]
+        if first.type in TOKEN_TYPES:
+            line, column = first.lineno, getattr(first, 'col', 0)
+        else:
+            line, column, _ = spans.get(id(first.value), (0, 0, 0))
+        if last.type in TOKEN_TYPES:
+            end_line = last.lineno
+        else:
+            end_line = spans.get(id(last.value), (0, 0, line))[2]
+        spans[id(node)] = (line, column, end_line)
+    return node
+
 # Grammar rule for the program (list of statements).
 def p_program(p):
     '''program : statement_list'''
-    p[0] = ('program', p[1])
+    p[0] = mark(p, ('program', p[1]))
 
 # Grammar rule for a list of statements.
 def p_statement_list(p):
@@ -44,60 +71,60 @@ def p_statement(p):
 # Grammar rule for variable assignment.
 def p_assignment_statement(p):
     '''assignment_statement : IDENTIFIER IS expression SEMICOLON'''
-    p[0] = ('assign', p[1], p[3])  # is → assignment
+    p[0] = mark(p, ('assign', p[1], p[3]))  # is → assignment
 
 # Grammar rule for assignment expressions (used in loops).
 def p_assignment_expression(p):
     'assignment_expression : IDENTIFIER ASSIGN expression'
-    p[0] = ('assign', p[1], p[3])
+    p[0] = mark(p, ('assign', p[1], p[3]))
 
 # Grammar rule for expression statements.
 def p_expression_statement(p):
     'expression_statement : expression SEMICOLON'
-    p[0] = ('expr', p[1])
+    p[0] = mark(p, ('expr', p[1]))
 
 # Grammar rule for print statements.
 def p_print_statement(p):
     'print_statement : SAY LPAREN expression RPAREN SEMICOLON'
-    p[0] = ('print', p[3])  # say → print
+    p[0] = mark(p, ('print', p[3]))  # say → print
 
 # Grammar rule for input statements.
 def p_input_statement(p):
     '''input_statement : IDENTIFIER IS ASK LPAREN RPAREN SEMICOLON
                        | IDENTIFIER IS ASK LPAREN expression RPAREN SEMICOLON'''
     if len(p) == 7:
-        p[0] = ('input', p[1], None)  # No prompt
+        p[0] = mark(p, ('input', p[1], None))  # No prompt
     else:
-        p[0] = ('input', p[1], p[5])  # With prompt
+        p[0] = mark(p, ('input', p[1], p[5]))  # With prompt
 
 # Grammar rule for if-else statements.
 def p_if_statement(p):
     '''if_statement : CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE
                     | CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE OTHERWISE LBRACE statement_list RBRACE'''
     if len(p) == 8:
-        p[0] = ('if', p[3], p[6])  # check → if
+        p[0] = mark(p, ('if', p[3], p[6]))  # check → if
     else:
-        p[0] = ('ifelse', p[3], p[6], p[10])  # otherwise → else
+        p[0] = mark(p, ('ifelse', p[3], p[6], p[10]))  # otherwise → else
 
 # Grammar rule for while loops.
 def p_while_statement(p):
     'while_statement : KEEP LPAREN expression RPAREN LBRACE statement_list RBRACE'
-    p[0] = ('while', p[3], p[6])  # keep → while
+    p[0] = mark(p, ('while', p[3], p[6]))  # keep → while
 
 # Grammar rule for function declarations.
 def p_function_declaration(p):
     'function_declaration : CREATE IDENTIFIER LPAREN parameter_list RPAREN LBRACE statement_list RBRACE'
-    p[0] = ('function', p[2], p[4], p[7])  # create → function
+    p[0] = mark(p, ('function', p[2], p[4], p[7]))  # create → function
 
 # Grammar rule for return statements.
 def p_return_statement(p):
     'return_statement : GIVE expression SEMICOLON'
-    p[0] = ('return', p[2])  # give → return
+    p[0] = mark(p, ('return', p[2]))  # give → return
 
 # Grammar rule for repeat loops.
 def p_repeat_statement(p):
     'repeat_statement : REPEAT expression LBRACE statement_list RBRACE'
-    p[0] = ('repeat', p[2], p[4])  # repeat → for
+    p[0] = mark(p, ('repeat', p[2], p[4]))  # repeat → for
 
 # Grammar rule for parameter lists in function declarations.
 def p_parameter_list(p):
@@ -128,7 +155,7 @@ def p_argument_list(p):
 # Grammar rule for function calls.
 def p_expression_function_call(p):
     'expression : IDENTIFIER LPAREN argument_list RPAREN'
-    p[0] = ('call', p[1], p[3])
+    p[0] = mark(p, ('call', p[1], p[3]))
 
 # Grammar rule for binary operations.
 def p_expression_binop(p):
@@ -142,18 +169,18 @@ def p_expression_binop(p):
                   | expression GT expression
                   | expression LEQ expression
                   | expression GEQ expression'''
-    p[0] = ('binop', p[2], p[1], p[3])  # plus → addition
+    p[0] = mark(p, ('binop', p[2], p[1], p[3]))  # plus → addition
 
 # Grammar rule for logical operations.
 def p_expression_logic(p):
     '''expression : expression AND expression
                   | expression OR expression'''
-    p[0] = ('logic', p[2], p[1], p[3])
+    p[0] = mark(p, ('logic', p[2], p[1], p[3]))
 
 # Grammar rule for NOT logical operation.
 def p_expression_not(p):
     'expression : NOT expression'
-    p[0] = ('not', p[2])
+    p[0] = mark(p, ('not', p[2]))
 
 # Grammar rule for grouped expressions.
 def p_expression_group(p):
@@ -163,37 +190,59 @@ def p_expression_group(p):
 # Grammar rule for number literals.
 def p_expression_number(p):
     'expression : NUMBER'
-    p[0] = ('number', p[1])
+    p[0] = mark(p, ('number', p[1]))
 
 # Grammar rule for float literals.
 def p_expression_float(p):
     'expression : FLOAT'
-    p[0] = ('float', p[1])
+    p[0] = mark(p, ('float', p[1]))
 
 # Grammar rule for string literals.
 def p_expression_string(p):
     'expression : STRING'
-    p[0] = ('string', p[1])
+    p[0] = mark(p, ('string', p[1]))
 
 # Grammar rule for variable usage.
 def p_expression_identifier(p):
     'expression : IDENTIFIER'
-    p[0] = ('var', p[1])
+    p[0] = mark(p, ('var', p[1]))
 
 # Error handling rule for syntax errors.
 def p_error(p):
+    print(syntax_error_message(p))
+
+def syntax_error_message(p):
     if p:
-        print(f"Syntax error at '{p.value}', line {p.lineno}")
-    else:
-        print("Syntax error at EOF")
+        return f"Syntax error at '{p.value}', line {p.lineno}"
+    return "Syntax error at EOF"
 
 # Rule for empty productions.
 def p_empty(p):
     'empty :'
     p[0] = None
 
-# Build the parser.
-parser = yacc.yacc()
+# Build the parser from the prebuilt LALR tables in this package's parsetab.py.
+# Nothing is written at import: no parser.out debug file, and if the grammar
+# has changed the tables are rebuilt in memory until build_tables() is run.
+parser = yacc.yacc(debug=False, write_tables=False)
+
+def build_tables():
+    """
+    Regenerate lextab.py and parsetab.py in the package directory.
+    Run it after changing a token or a grammar rule:
+    python -c "from easypysie.parser import build_tables; build_tables()"
+    """
+    from . import lexer as lexer_module
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    lex.lex(module=lexer_module).writetab("lextab", package_dir)
+    yacc.yacc(module=sys.modules[__name__], debug=False, write_tables=True, outputdir=package_dir)
+
+def new_parser():
+    """
+    Return an independent parser that shares the prebuilt LALR tables.
+    Each compilation session gets its own, so parses never share state.
+    """
+    return copy.copy(parser)
 
 # Test the parser with sample input.
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDrightNOTleftPLUSMINUSleftTIMESDIVIDEAND ASK ASSIGN CHECK COMMA CREATE DIVIDE EQ FLOAT GEQ GIVE GT IDENTIFIER IS KEEP LBRACE LEQ LPAREN LT MINUS NEQ NOT NUMBER OR OTHERWISE PLUS RBRACE REPEAT RPAREN SAY SEMICOLON STRING TIMESprogram : statement_liststatement_list : statement_list statement\n| statementstatement : assignment_statement\n| expression_statement\n| print_statement\n| if_statement\n| while_statement\n| repeat_statement\n| function_declaration\n| return_statement\n| input_statementassignment_statement : IDENTIFIER IS expression SEMICOLONassignment_expression : IDENTIFIER ASSIGN expressionexpression_statement : expression SEMICOLONprint_statement : SAY LPAREN expression RPAREN SEMICOLONinput_statement : IDENTIFIER IS ASK LPAREN RPAREN SEMICOLON\n| IDENTIFIER IS ASK LPAREN expression RPAREN SEMICOLONif_statement : CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE\n| CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE OTHERWISE LBRACE statement_list RBRACEwhile_statement : KEEP LPAREN expression RPAREN LBRACE statement_list RBRACEfunction_declaration : CREATE IDENTIFIER LPAREN parameter_list RPAREN LBRACE statement_list RBRACEreturn_statement : GIVE expression SEMICOLONrepeat_statement : REPEAT expression LBRACE statement_list RBRACEparameter_list : parameter_list COMMA IDENTIFIER\n| IDENTIFIER\n| emptyargument_list : argument_list COMMA expression\n| expression\n| emptyexpression : IDENTIFIER LPAREN argument_list RPARENexpression : expression PLUS expression\n| expression MINUS expression\n| expression TIMES expression\n| expression DIVIDE expression\n| expression EQ expression\n| expression NEQ expression\n| expression LT expression\n| expression GT expression\n| expression LEQ expression\n| expression GEQ expressionexpression : expression AND expression\n| expression OR expressionexpression : NOT expressionexpression : LPAREN expression RPARENexpression : NUMBERexpression : FLOATexpression : STRINGexpression : IDENTIFIERempty :'
+_lr_signature = 'leftORleftANDrightNOTleftPLUSMINUSleftTIMESDIVIDEAND ASK ASSIGN CHECK COMMA CREATE DIVIDE EQ FLOAT GEQ GIVE GT IDENTIFIER IS KEEP LBRACE LEQ LPAREN LT MINUS NEQ NOT NUMBER OR OTHERWISE PLUS RBRACE REPEAT RPAREN SAY SEMICOLON STRING TIMESprogram : statement_liststatement_list : statement_list statement\n                      | statementstatement : assignment_statement\n                 | expression_statement\n                 | print_statement\n                 | if_statement\n                 | while_statement\n                 | repeat_statement\n                 | function_declaration\n                 | return_statement\n                 | input_statementassignment_statement : IDENTIFIER IS expression SEMICOLONassignment_expression : IDENTIFIER ASSIGN expressionexpression_statement : expression SEMICOLONprint_statement : SAY LPAREN expression RPAREN SEMICOLONinput_statement : IDENTIFIER IS ASK LPAREN RPAREN SEMICOLON\n                       | IDENTIFIER IS ASK LPAREN expression RPAREN SEMICOLONif_statement : CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE\n                    | CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE OTHERWISE LBRACE statement_list RBRACEwhile_statement : KEEP LPAREN expression RPAREN LBRACE statement_list RBRACEfunction_declaration : CREATE IDENTIFIER LPAREN parameter_list RPAREN LBRACE statement_list RBRACEreturn_statement : GIVE expression SEMICOLONrepeat_statement : REPEAT expression LBRACE statement_list RBRACEparameter_list : parameter_list COMMA IDENTIFIER\n                      | IDENTIFIER\n                      | emptyargument_list : argument_list COMMA expression\n                     | expression\n                     | emptyexpression : IDENTIFIER LPAREN argument_list RPARENexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression EQ expression\n                  | expression NEQ expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression LEQ expression\n                  | expression GEQ expressionexpression : expression AND expression\n                  | expression OR expressionexpression : NOT expressionexpression : LPAREN expression RPARENexpression : NUMBERexpression : FLOATexpression : STRINGexpression : IDENTIFIERempty :'
     
 _lr_action_items = {'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,16,19,20,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,72,73,74,75,76,78,82,89,90,91,92,94,95,97,98,99,101,102,103,104,106,107,108,109,],[13,13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,44,44,48,44,44,-2,44,44,-15,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,13,83,-23,-13,44,44,13,-16,13,13,-24,100,-17,13,13,13,-18,-19,-21,13,-22,13,13,-20,]),'SAY':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[15,15,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,15,-23,-13,15,-16,15,15,-24,-17,15,15,15,-18,-19,-21,15,-22,15,15,-20,]),'CHECK':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[17,17,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,17,-23,-13,17,-16,17,17,-24,-17,17,17,17,-18,-19,-21,17,-22,17,17,-20,]),'KEEP':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[18,18,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,18,-23,-13,18,-16,18,18,-24,-17,18,18,18,-18,-19,-21,18,-22,18,18,-20,]),'REPEAT':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[19,19,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,19,-23,-13,19,-16,19,19,-24,-17,19,19,19,-18,-19,-21,19,-22,19,19,-20,]),'CREATE':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[20,20,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,20,-23,-13,20,-16,20,20,-24,-17,20,20,20,-18,-19,-21,20,-22,20,20,-20,]),'GIVE':([0,2,3,4,5,6,7,8,9,10,11,12,26,29,72,74,75,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[21,21,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,21,-23,-13,21,-16,21,21,-24,-17,21,21,21,-18,-19,-21,21,-22,21,21,-20,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,16,19,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,72,74,75,76,78,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[22,22,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,22,22,22,22,-2,22,22,-15,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-23,-13,22,22,22,-16,22,22,-24,-17,22,22,22,-18,-19,-21,22,-22,22,22,-20,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,16,17,18,19,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,48,52,72,74,75,76,78,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[16,16,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,28,42,16,45,46,16,16,16,-2,16,16,-15,16,16,16,16,16,16,16,16,16,16,16,16,16,28,16,16,73,76,16,-23,-13,16,16,16,-16,16,16,-24,-17,16,16,16,-18,-19,-21,16,-22,16,16,-20,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,16,19,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,72,74,75,76,78,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[23,23,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,23,23,23,23,-2,23,23,-15,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-23,-13,23,23,23,-16,23,23,-24,-17,23,23,23,-18,-19,-21,23,-22,23,23,-20,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,16,19,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,72,74,75,76,78,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[24,24,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,24,24,24,24,-2,24,24,-15,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-23,-13,24,24,24,-16,24,24,-24,-17,24,24,24,-18,-19,-21,24,-22,24,24,-20,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,16,19,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,72,74,75,76,78,82,89,90,91,92,95,97,98,99,101,102,103,104,106,107,108,109,],[25,25,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,25,25,25,25,-2,25,25,-15,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-23,-13,25,25,25,-16,25,25,-24,-17,25,25,25,-18,-19,-21,25,-22,25,25,-20,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,26,29,74,75,89,92,95,101,102,103,106,109,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,-23,-13,-16,-24,-17,-18,-19,-21,-22,-20,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,26,29,74,75,82,89,92,95,97,98,101,102,103,104,106,108,109,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-2,-15,-23,-13,92,-16,-24,-17,102,103,-18,-19,-21,106,-22,109,-20,]),'IS':([13,],[27,]),'SEMICOLON':([13,14,23,24,25,44,49,50,51,56,57,58,59,60,61,62,63,64,65,66,67,69,77,79,86,96,],[-49,29,-46,-47,-48,-49,74,-44,75,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-45,-31,89,95,101,]),'PLUS':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,30,-46,-47,-48,30,-49,30,30,30,30,30,-32,-33,-34,-35,30,30,30,30,30,30,30,30,30,-45,30,30,-31,30,30,]),'MINUS':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,31,-46,-47,-48,31,-49,31,31,31,31,31,-32,-33,-34,-35,31,31,31,31,31,31,31,31,31,-45,31,31,-31,31,31,]),'TIMES':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,32,-46,-47,-48,32,-49,32,32,32,32,32,32,32,-34,-35,32,32,32,32,32,32,32,32,32,-45,32,32,-31,32,32,]),'DIVIDE':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,33,-46,-47,-48,33,-49,33,33,33,33,33,33,33,-34,-35,33,33,33,33,33,33,33,33,33,-45,33,33,-31,33,33,]),'EQ':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,34,-46,-47,-48,34,-49,34,34,-44,34,34,-32,-33,-34,-35,34,34,34,34,34,34,-42,-43,34,-45,34,34,-31,34,34,]),'NEQ':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,35,-46,-47,-48,35,-49,35,35,-44,35,35,-32,-33,-34,-35,35,35,35,35,35,35,-42,-43,35,-45,35,35,-31,35,35,]),'LT':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,36,-46,-47,-48,36,-49,36,36,-44,36,36,-32,-33,-34,-35,36,36,36,36,36,36,-42,-43,36,-45,36,36,-31,36,36,]),'GT':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,37,-46,-47,-48,37,-49,37,37,-44,37,37,-32,-33,-34,-35,37,37,37,37,37,37,-42,-43,37,-45,37,37,-31,37,37,]),'LEQ':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,38,-46,-47,-48,38,-49,38,38,-44,38,38,-32,-33,-34,-35,38,38,38,38,38,38,-42,-43,38,-45,38,38,-31,38,38,]),'GEQ':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,39,-46,-47,-48,39,-49,39,39,-44,39,39,-32,-33,-34,-35,39,39,39,39,39,39,-42,-43,39,-45,39,39,-31,39,39,]),'AND':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,40,-46,-47,-48,40,-49,40,40,-44,40,40,-32,-33,-34,-35,40,40,40,40,40,40,-42,40,40,-45,40,40,-31,40,40,]),'OR':([13,14,23,24,25,43,44,47,49,50,51,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,87,88,],[-49,41,-46,-47,-48,41,-49,41,41,-44,41,41,-32,-33,-34,-35,41,41,41,41,41,41,-42,-43,41,-45,41,41,-31,41,41,]),'RPAREN':([23,24,25,28,43,44,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,76,77,83,84,85,87,88,100,],[-46,-47,-48,-50,69,-49,-44,77,-29,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,79,-45,80,81,-50,86,-31,-26,93,-27,96,-28,-25,]),'LBRACE':([23,24,25,44,47,50,56,57,58,59,60,61,62,63,64,65,66,67,69,77,80,81,93,105,],[-46,-47,-48,-49,72,-44,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-45,-31,90,91,99,107,]),'COMMA':([23,24,25,28,44,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,69,73,77,83,84,85,88,100,],[-46,-47,-48,-50,-49,-44,78,-29,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-45,-50,-31,-26,94,-27,-28,-25,]),'ASK':([27,],[52,]),'OTHERWISE':([102,],[105,]),}
 
@@ -27,54 +27,54 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',19),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',23),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',24),
-  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',31),
-  ('statement -> expression_statement','statement',1,'p_statement','parser.py',32),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',33),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',34),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',35),
-  ('statement -> repeat_statement','statement',1,'p_statement','parser.py',36),
-  ('statement -> function_declaration','statement',1,'p_statement','parser.py',37),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',38),
-  ('statement -> input_statement','statement',1,'p_statement','parser.py',39),
-  ('assignment_statement -> IDENTIFIER IS expression SEMICOLON','assignment_statement',4,'p_assignment_statement','parser.py',43),
-  ('assignment_expression -> IDENTIFIER ASSIGN expression','assignment_expression',3,'p_assignment_expression','parser.py',48),
-  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',52),
-  ('print_statement -> SAY LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','parser.py',56),
-  ('input_statement -> IDENTIFIER IS ASK LPAREN RPAREN SEMICOLON','input_statement',6,'p_input_statement','parser.py',60),
-  ('input_statement -> IDENTIFIER IS ASK LPAREN expression RPAREN SEMICOLON','input_statement',7,'p_input_statement','parser.py',61),
-  ('if_statement -> CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE','if_statement',7,'p_if_statement','parser.py',68),
-  ('if_statement -> CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE OTHERWISE LBRACE statement_list RBRACE','if_statement',11,'p_if_statement','parser.py',69),
-  ('while_statement -> KEEP LPAREN expression RPAREN LBRACE statement_list RBRACE','while_statement',7,'p_while_statement','parser.py',76),
-  ('function_declaration -> CREATE IDENTIFIER LPAREN parameter_list RPAREN LBRACE statement_list RBRACE','function_declaration',8,'p_function_declaration','parser.py',81),
-  ('return_statement -> GIVE expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',85),
-  ('repeat_statement -> REPEAT expression LBRACE statement_list RBRACE','repeat_statement',5,'p_repeat_statement','parser.py',89),
-  ('parameter_list -> parameter_list COMMA IDENTIFIER','parameter_list',3,'p_parameter_list','parser.py',93),
-  ('parameter_list -> IDENTIFIER','parameter_list',1,'p_parameter_list','parser.py',94),
-  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',95),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',105),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',106),
-  ('argument_list -> empty','argument_list',1,'p_argument_list','parser.py',107),
-  ('expression -> IDENTIFIER LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','parser.py',117),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',121),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',122),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','parser.py',123),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','parser.py',124),
-  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',125),
-  ('expression -> expression NEQ expression','expression',3,'p_expression_binop','parser.py',126),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',127),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',128),
-  ('expression -> expression LEQ expression','expression',3,'p_expression_binop','parser.py',129),
-  ('expression -> expression GEQ expression','expression',3,'p_expression_binop','parser.py',130),
-  ('expression -> expression AND expression','expression',3,'p_expression_logic','parser.py',134),
-  ('expression -> expression OR expression','expression',3,'p_expression_logic','parser.py',135),
-  ('expression -> NOT expression','expression',2,'p_expression_not','parser.py',139),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',143),
-  ('expression -> NUMBER','expression',1,'p_expression_number','parser.py',147),
-  ('expression -> FLOAT','expression',1,'p_expression_float','parser.py',151),
-  ('expression -> STRING','expression',1,'p_expression_string','parser.py',155),
-  ('expression -> IDENTIFIER','expression',1,'p_expression_identifier','parser.py',159),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',169),
+  ('program -> statement_list','program',1,'p_program','parser.py',23),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',28),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',29),
+  ('statement -> assignment_statement','statement',1,'p_statement','parser.py',37),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',38),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',39),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',40),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',41),
+  ('statement -> repeat_statement','statement',1,'p_statement','parser.py',42),
+  ('statement -> function_declaration','statement',1,'p_statement','parser.py',43),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',44),
+  ('statement -> input_statement','statement',1,'p_statement','parser.py',45),
+  ('assignment_statement -> IDENTIFIER IS expression SEMICOLON','assignment_statement',4,'p_assignment_statement','parser.py',50),
+  ('assignment_expression -> IDENTIFIER ASSIGN expression','assignment_expression',3,'p_assignment_expression','parser.py',55),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',60),
+  ('print_statement -> SAY LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','parser.py',65),
+  ('input_statement -> IDENTIFIER IS ASK LPAREN RPAREN SEMICOLON','input_statement',6,'p_input_statement','parser.py',70),
+  ('input_statement -> IDENTIFIER IS ASK LPAREN expression RPAREN SEMICOLON','input_statement',7,'p_input_statement','parser.py',71),
+  ('if_statement -> CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE','if_statement',7,'p_if_statement','parser.py',79),
+  ('if_statement -> CHECK LPAREN expression RPAREN LBRACE statement_list RBRACE OTHERWISE LBRACE statement_list RBRACE','if_statement',11,'p_if_statement','parser.py',80),
+  ('while_statement -> KEEP LPAREN expression RPAREN LBRACE statement_list RBRACE','while_statement',7,'p_while_statement','parser.py',88),
+  ('function_declaration -> CREATE IDENTIFIER LPAREN parameter_list RPAREN LBRACE statement_list RBRACE','function_declaration',8,'p_function_declaration','parser.py',93),
+  ('return_statement -> GIVE expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',98),
+  ('repeat_statement -> REPEAT expression LBRACE statement_list RBRACE','repeat_statement',5,'p_repeat_statement','parser.py',103),
+  ('parameter_list -> parameter_list COMMA IDENTIFIER','parameter_list',3,'p_parameter_list','parser.py',108),
+  ('parameter_list -> IDENTIFIER','parameter_list',1,'p_parameter_list','parser.py',109),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',110),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',121),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',122),
+  ('argument_list -> empty','argument_list',1,'p_argument_list','parser.py',123),
+  ('expression -> IDENTIFIER LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','parser.py',134),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',139),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',140),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','parser.py',141),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','parser.py',142),
+  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',143),
+  ('expression -> expression NEQ expression','expression',3,'p_expression_binop','parser.py',144),
+  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',145),
+  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',146),
+  ('expression -> expression LEQ expression','expression',3,'p_expression_binop','parser.py',147),
+  ('expression -> expression GEQ expression','expression',3,'p_expression_binop','parser.py',148),
+  ('expression -> expression AND expression','expression',3,'p_expression_logic','parser.py',153),
+  ('expression -> expression OR expression','expression',3,'p_expression_logic','parser.py',154),
+  ('expression -> NOT expression','expression',2,'p_expression_not','parser.py',159),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',164),
+  ('expression -> NUMBER','expression',1,'p_expression_number','parser.py',169),
+  ('expression -> FLOAT','expression',1,'p_expression_float','parser.py',174),
+  ('expression -> STRING','expression',1,'p_expression_string','parser.py',179),
+  ('expression -> IDENTIFIER','expression',1,'p_expression_identifier','parser.py',184),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',196),
 ]
@@ -0,0 +1,241 @@
+# profiler.py
+
+# Line-level profiler for programs running on the Python target. It counts
+# how often every EasyPysie source line runs and how much time is spent on
+# it, and how often every `create` function is called with its inclusive and
+# exclusive time. Events are only enabled on the program's own code objects:
+# through sys.monitoring local events on Python 3.12+, or a sys.settrace hook
+# that declines to trace any other frame on older interpreters. The per-event
+# work is a couple of list updates indexed by generated line; generated lines
+# are folded into source lines with the program's SourceMap afterwards.
+
+import sys
+import threading
+from time import perf_counter
+from types import CodeType
+from .source_map import GENERATED_FILENAME, SourceMap
+
+# Code names of the generated top-level code, which is not reported as a function.
+TOP_LEVEL = frozenset({"<module>", "__main__"})
+
+def program_code_objects(code):
+    """
+    Return a code object and every code object nested in it.
+    """
+    codes = [code]
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            codes.extend(program_code_objects(const))
+    return codes
+
+class Profiler:
+    """
+    Collects a line and function profile of one program run (see runctx()).
+    lines maps each source line to [hits, seconds]: how often the statement on it ran
+    and the time spent on the line itself, up to the next line event. functions maps
+    each program function to [calls, inclusive seconds, exclusive seconds]; time in
+    recursive calls counts once towards the inclusive time. seconds is the wall
+    time of the whole run.
+    """
+    def __init__(self, source_map=None, use_monitoring=None):
+        self.source_map = source_map or SourceMap()
+        # sys.monitoring is only available from Python 3.12.
+        self.use_monitoring = hasattr(sys, "monitoring") if use_monitoring is None else use_monitoring
+        self.lines = {}
+        self.functions = {}
+        self.seconds = 0.0
+
+    def runctx(self, code, globals):
+        """
+        Execute a generated code object (or Python source) in globals under the profiler.
+        """
+        if isinstance(code, str):
+            code = compile(code, GENERATED_FILENAME, "exec")
+        codes = program_code_objects(code)
+        size = max([len(self.source_map), *(line for c in codes for _, _, line in c.co_lines() if line)]) + 1
+        # Hits and time of every generated line, indexed by line number.
+        hits = [0] * size
+        times = [0.0] * size
+        # One [function name, start time, time in callees] record per active program function.
+        stack = []
+        depth = {}
+        functions = self.functions
+        # The generated line running now and when it started.
+        clock = [0, 0.0]
+        # With sys.monitoring the same code object may also be running on another thread; those events are ignored.
+        thread = threading.get_ident()
+        get_ident = threading.get_ident
+
+        # The handlers take sys.monitoring's callback arguments; the settrace back end passes the same.
+
+        def on_line(code, line):
+            if get_ident() != thread:
+                return
+            now = perf_counter()
+            times[clock[0]] += now - clock[1]
+            hits[line] += 1
+            clock[0] = line
+            clock[1] = now
+
+        def on_start(code, offset):
+            name = code.co_name
+            if name in TOP_LEVEL or get_ident() != thread:
+                return
+            now = perf_counter()
+            stats = functions.get(name)
+            if stats is None:
+                stats = functions[name] = [0, 0.0, 0.0]
+            stats[0] += 1
+            depth[name] = depth.get(name, 0) + 1
+            stack.append([name, now, 0.0])
+
+        def on_return(code, offset, value):
+            if code.co_name in TOP_LEVEL or get_ident() != thread:
+                return
+            close_function()
+
+        def close_function():
+            now = perf_counter()
+            name, start, child = stack.pop()
+            inclusive = now - start
+            stats = functions[name]
+            depth[name] -= 1
+            if depth[name] == 0:
+                stats[1] += inclusive
+            stats[2] += inclusive - child
+            if stack:
+                stack[-1][2] += inclusive
+
+        monitoring = self.use_monitoring and self._start_monitoring(codes, on_line, on_start, on_return)
+        if not monitoring:
+            previous = sys.gettrace()
+            sys.settrace(self._tracer(set(codes), on_line, on_start, on_return))
+        start = clock[1] = perf_counter()
+        try:
+            exec(code, globals)
+        finally:
+            end = perf_counter()
+            if monitoring:
+                self._stop_monitoring(codes)
+            else:
+                sys.settrace(previous)
+            times[clock[0]] += end - clock[1]
+            # Functions an error unwound through never returned; close them now.
+            while stack:
+                close_function()
+            self.seconds += end - start
+            self._fold(hits, times)
+
+    def _fold(self, hits, times):
+        """
+        Add the per-generated-line counts into self.lines. A statement may span several
+        generated lines; it ran as often as the most frequently run of them.
+        """
+        lines = self.source_map.lines
+        for generated, count in enumerate(hits):
+            line = lines[generated - 1] if 0 < generated <= len(lines) else 0
+            if not line or (not count and not times[generated]):
+                continue
+            stats = self.lines.get(line)
+            if stats is None:
+                stats = self.lines[line] = [0, 0.0]
+            stats[0] = max(stats[0], count)
+            stats[1] += times[generated]
+
+    # sys.settrace back end: only frames of the program get a local trace function.
+
+    @staticmethod
+    def _tracer(codes, on_line, on_start, on_return):
+        def trace_local(frame, event, arg):
+            if event == "line":
+                on_line(frame.f_code, frame.f_lineno)
+            elif event == "return":
+                on_return(frame.f_code, 0, arg)
+            return trace_local
+
+        def trace_call(frame, event, arg):
+            if event != "call" or frame.f_code not in codes:
+                return None
+            on_start(frame.f_code, 0)
+            return trace_local
+        return trace_call
+
+    # sys.monitoring back end: local events on the program's code objects only.
+
+    def _start_monitoring(self, codes, on_line, on_start, on_return):
+        """
+        Enable the monitoring events. Returns False if another profiler holds the tool id.
+        """
+        monitoring = sys.monitoring
+        events = monitoring.events
+        tool = monitoring.PROFILER_ID
+        try:
+            monitoring.use_tool_id(tool, "easypysie")
+        except ValueError:
+            return False
+        monitoring.register_callback(tool, events.LINE, on_line)
+        monitoring.register_callback(tool, events.PY_START, on_start)
+        monitoring.register_callback(tool, events.PY_RETURN, on_return)
+        for code in codes:
+            monitoring.set_local_events(tool, code, events.PY_START | events.LINE | events.PY_RETURN)
+        return True
+
+    def _stop_monitoring(self, codes):
+        monitoring = sys.monitoring
+        tool = monitoring.PROFILER_ID
+        for code in codes:
+            monitoring.set_local_events(tool, code, 0)
+        for event in (monitoring.events.PY_START, monitoring.events.LINE, monitoring.events.PY_RETURN):
+            monitoring.register_callback(tool, event, None)
+        monitoring.free_tool_id(tool)
+
+    # Reports
+
+    def heat(self):
+        """
+        Return the time of every profiled source line as a fraction of the slowest one.
+        """
+        slowest = max((seconds for _, seconds in self.lines.values()), default=0.0)
+        if slowest <= 0:
+            return {line: 0.0 for line in self.lines}
+        return {line: seconds / slowest for line, (_, seconds) in self.lines.items()}
+
+    def as_dict(self):
+        """
+        A JSON-serializable profile: lines and functions sorted by time, slowest first.
+        """
+        return {
+            "seconds": self.seconds,
+            "lines": [{"line": line, "hits": hits, "seconds": seconds}
+                      for line, (hits, seconds) in sorted(self.lines.items(), key=lambda item: -item[1][1])],
+            "functions": [{"name": name, "calls": calls, "inclusive": inclusive, "exclusive": exclusive}
+                          for name, (calls, inclusive, exclusive)
+                          in sorted(self.functions.items(), key=lambda item: -item[1][2])],
+        }
+
+    def report(self, source_code=None, limit=None):
+        """
+        Format the profile as text: every executed line in source order (with its
+        source text when source_code is given), then the functions, slowest first.
+        limit keeps only that many of the slowest lines.
+        """
+        source_lines = source_code.splitlines() if source_code is not None else []
+        total = self.seconds or 1.0
+        lines = sorted(self.lines.items())
+        if limit is not None:
+            lines = sorted(sorted(lines, key=lambda item: -item[1][1])[:limit])
+        report = [f"{'Line':>6s} {'Hits':>10s} {'Time (ms)':>12s} {'%':>6s}  Source"]
+        for line, (hits, seconds) in lines:
+            text = source_lines[line - 1].strip() if line <= len(source_lines) else ""
+            report.append(f"{line:6d} {hits:10d} {seconds * 1000:12.3f} {seconds / total * 100:5.1f}%  {text}")
+        if self.functions:
+            report.append("")
+            report.append(f"{'Function':20s} {'Calls':>10s} {'Inclusive (ms)':>15s} {'Exclusive (ms)':>15s}")
+            for name, (calls, inclusive, exclusive) in sorted(self.functions.items(), key=lambda item: -item[1][2]):
+                report.append(f"{name:20s} {calls:10d} {inclusive * 1000:15.3f} {exclusive * 1000:15.3f}")
+        report.append("")
+        report.append(f"Total: {self.seconds * 1000:.3f} ms")
+        return "\n".join(report)
+
+    def __repr__(self):
+        return f"<Profiler {len(self.lines)} lines {len(self.functions)} functions {self.seconds * 1000:.1f} ms>"
@@ -0,0 +1,164 @@
+# result.py
+
+# Structured outcome of one compile: every artifact the pipeline produced, the
+# diagnostics it reported, and the wall time and net memory allocations of
+# each phase. Dumping artifacts is left to an optional trace hook, so the
+# pipeline itself is silent; console_trace() reproduces the classic dumps.
+
+import sys
+import time
+from contextlib import contextmanager
+
+# Pipeline phases, in the order they run.
+PHASES = ("cache", "lex", "parse", "semantic", "ir", "optimize", "codegen", "exec")
+
+# Prefix of the output of a program that compiled and ran successfully.
+SUCCESS_PREFIX = "Compilation succeeded!"
+
+class PhaseStats:
+    """
+    Wall time of one phase in seconds, and the net number of memory blocks
+    it left allocated (sys.getallocatedblocks() after minus before).
+    """
+    __slots__ = ('name', 'seconds', 'blocks')
+
+    def __init__(self, name, seconds, blocks):
+        self.name = name
+        self.seconds = seconds
+        self.blocks = blocks
+
+    def __repr__(self):
+        return f"{self.name:9s} {self.seconds * 1000:9.3f} ms {self.blocks:+9d} blocks"
+
+class CompileResult:
+    """
+    Everything one compile produced. Artifacts a phase did not reach stay None.
+    output is the text shown to the user (str(result) returns it); ok is True when
+    the program compiled and ran without error.
+    """
+    def __init__(self, source_code, target, opt_level):
+        self.source_code = source_code
+        self.target = target
+        self.opt_level = opt_level
+        self.cache_hit = False
+        self.tokens = None
+        # Number of tokens in the source, also known on a cache hit (where tokens stays None).
+        self.token_count = None
+        self.ast = None
+        # Source span of every AST node, keyed by id() of the node (see parser.mark()).
+        self.spans = None
+        self.ir = None
+        self.frames = None
+        self.pass_stats = None
+        self.allocation_stats = None
+        self.program = None
+        self.code = None
+        self.code_object = None
+        self.source_map = None
+        self.profile = None
+        # The sandbox's RunResult when the program ran in a SandboxPool.
+        self.run = None
+        self.output = None
+        self.diagnostics = []
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a phase and count its allocations into self.phases.
+        """
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = PhaseStats(name, time.perf_counter() - start, sys.getallocatedblocks() - blocks)
+
+    @property
+    def ok(self):
+        return self.output is not None and self.output.startswith(SUCCESS_PREFIX)
+
+    @property
+    def seconds(self):
+        """
+        Total wall time of all phases.
+        """
+        return sum(stats.seconds for stats in self.phases.values())
+
+    def summary(self):
+        """
+        One line per phase with its time and allocations, then the total.
+        """
+        lines = [repr(self.phases[name]) for name in PHASES if name in self.phases]
+        lines.append(f"{'total':9s} {self.seconds * 1000:9.3f} ms")
+        return "\n".join(lines)
+
+    def as_dict(self):
+        """
+        A JSON-serializable summary for metrics and monitoring.
+        """
+        return {
+            "target": self.target,
+            "opt_level": self.opt_level,
+            "ok": self.ok,
+            "cache_hit": self.cache_hit,
+            "tokens": self.token_count,
+            "ir_instructions": len(self.ir) if self.ir is not None else None,
+            "code_chars": len(self.code) if self.code is not None else None,
+            "diagnostics": list(self.diagnostics),
+            "phases": {name: {"seconds": stats.seconds, "blocks": stats.blocks} for name, stats in self.phases.items()},
+            "seconds": self.seconds,
+            "profile": self.profile.as_dict() if self.profile is not None else None,
+            "run_status": self.run.status if self.run is not None else None,
+        }
+
+    def __str__(self):
+        return self.output if self.output is not None else ""
+
+    def __repr__(self):
+        return f"<CompileResult {self.target} {'ok' if self.ok else 'failed'} {self.seconds * 1000:.1f} ms>"
+
+# Headings of the trace events printed by console_trace().
+TRACE_HEADINGS = {
+    "cache": "🔹 Compile Cache Hit:",
+    "tokens": "🔹 Lexical Analysis:",
+    "ast": "🔹 Parsing Succeeded:",
+    "semantic": "✅ Semantic Analysis Passed!",
+    "ir": "🔹 Intermediate Representation (IR):",
+    "frames": "🔹 Frames:",
+    "optimize": "🔹 Optimization:",
+    "allocation": "🔹 Register Allocation:",
+    "python": "🔹 Generated Python Code:",
+    "assembly": "🔹 Generated Assembly Code:",
+    "vm": "🔹 VM Program:",
+    "emulator": "🔹 Emulator Report:",
+    "profile": "🔹 Profile:",
+    "diagnostic": "❌",
+    "result": "🔹 Phases:",
+}
+
+def console_trace(verbosity=2, show_tokens=True, file=None):
+    """
+    Return a trace hook that prints pipeline events. Verbosity 1 prints only the
+    diagnostics, the profile and the per-phase summary; verbosity 2 prints every artifact as well
+    (the token dump only with show_tokens). The tokens event carries the TokenStream
+    itself, so it is only formatted when it is printed.
+    """
+    def trace(event, artifact):
+        stream = file or sys.stdout
+        if event == "diagnostic":
+            print(f"\n{TRACE_HEADINGS[event]} {artifact}", file=stream)
+        elif event == "result":
+            print(f"\n{TRACE_HEADINGS[event]}\n{artifact.summary()}", file=stream)
+        elif event == "profile":
+            print(f"\n{TRACE_HEADINGS[event]}\n{artifact}", file=stream)
+        elif verbosity >= 2 and (event != "tokens" or show_tokens):
+            print(f"\n{TRACE_HEADINGS.get(event, event)}", file=stream)
+            if event == "tokens":
+                print(artifact.dump(), file=stream)
+            elif isinstance(artifact, (list, tuple)):
+                for item in artifact:
+                    print(item, file=stream)
+            elif artifact is not None:
+                print(artifact, file=stream)
+    return trace
@@ -0,0 +1,223 @@
+# runtime_io.py
+
+# Input and output of running programs. An OutputSink stands in for the
+# program's print(): it keeps the most recent output in a ring buffer with a
+# fixed character cap, counts exactly what it had to drop, and streams the
+# output in chunks to any number of consumers (the GUI, a file, a socket)
+# while the program is still running. InputProviders stand in for its
+# input(): a Tk dialog, stdin, scripted answers or a callback.
+
+import sys
+import time
+from collections import deque
+
+# Characters of output kept for the final result.
+DEFAULT_MAX_CHARS = 1024 * 1024
+
+# Output is handed to consumers once this many characters are pending,
+# or once this many seconds have passed since the last chunk.
+DEFAULT_CHUNK_CHARS = 8192
+DEFAULT_FLUSH_SECONDS = 0.05
+
+class OutputSink:
+    """
+    A bounded, streaming replacement for a program's print().
+    Only the last max_chars characters are kept; `dropped` counts the characters
+    discarded before them and getvalue() starts with a truncation notice when any were.
+    Every consumer is called with each chunk of text, in order, as the program runs.
+    """
+    def __init__(self, max_chars=DEFAULT_MAX_CHARS, consumers=(),
+                 chunk_chars=DEFAULT_CHUNK_CHARS, flush_seconds=DEFAULT_FLUSH_SECONDS):
+        self.max_chars = max_chars
+        self.consumers = list(consumers)
+        self.chunk_chars = chunk_chars
+        self.flush_seconds = flush_seconds
+        # The ring buffer: joined chunks, oldest first, holding at most max_chars characters.
+        self.chunks = deque()
+        self.size = 0
+        self.dropped = 0
+        self.written = 0
+        self.lines = 0
+        # Writes not yet joined into a chunk.
+        self.pending = []
+        self.pending_chars = 0
+        self.last_flush = time.monotonic()
+
+    def print(self, *args, sep=" ", end="\n", flush=False):
+        """
+        The program's print(): format like the builtin and write to the sink.
+        """
+        self.write((str(args[0]) if len(args) == 1 else sep.join(map(str, args))) + end)
+        if flush:
+            self.flush()
+
+    def write(self, text):
+        self.pending.append(text)
+        self.pending_chars += len(text)
+        if self.pending_chars >= self.chunk_chars:
+            self.flush()
+        elif self.consumers and time.monotonic() - self.last_flush >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """
+        Join the pending writes into a chunk, add it to the ring buffer and hand it to the consumers.
+        """
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        chunk = "".join(self.pending)
+        self.pending.clear()
+        self.pending_chars = 0
+        self.written += len(chunk)
+        self.lines += chunk.count("\n")
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        self.trim()
+        for consumer in self.consumers:
+            consumer(chunk)
+
+    def trim(self):
+        """
+        Drop the oldest output until the ring buffer is within max_chars.
+        """
+        while self.size > self.max_chars:
+            excess = self.size - self.max_chars
+            oldest = self.chunks.popleft()
+            if len(oldest) > excess:
+                self.chunks.appendleft(oldest[excess:])
+                cut = excess
+            else:
+                cut = len(oldest)
+            self.size -= cut
+            self.dropped += cut
+
+    @property
+    def truncated(self):
+        return self.dropped > 0
+
+    def getvalue(self):
+        """
+        Return the retained output, preceded by a notice if earlier output was dropped.
+        """
+        self.flush()
+        text = "".join(self.chunks)
+        if self.dropped:
+            return f"[... {self.dropped} earlier characters of output truncated ...]\n{text}"
+        return text
+
+    def close(self):
+        """
+        Hand any pending output to the consumers. Called when the program ends.
+        """
+        self.flush()
+
+    def __repr__(self):
+        return (f"<OutputSink {self.lines} lines {self.written} chars written, "
+                f"{self.size} kept, {self.dropped} dropped>")
+
+def file_consumer(file):
+    """
+    A consumer that streams output chunks to an open text file.
+    """
+    def consume(chunk):
+        file.write(chunk)
+        file.flush()
+    return consume
+
+def socket_consumer(sock, encoding="utf-8"):
+    """
+    A consumer that streams output chunks to a connected socket.
+    """
+    def consume(chunk):
+        sock.sendall(chunk.encode(encoding))
+    return consume
+
+class InputProvider:
+    """
+    Answers a program's ask() calls. A provider is called like input(): with the
+    prompt, returning the answer as a string. Any such callable can be used in its place.
+    """
+    def __call__(self, prompt=""):
+        raise NotImplementedError
+
+class DialogInput(InputProvider):
+    """
+    Asks with a Tk dialog. All dialogs share one hidden root window, created on
+    first use (or the given parent window). Must be called on the Tk thread.
+    """
+    def __init__(self, parent=None):
+        self.parent = parent
+
+    def __call__(self, prompt=""):
+        # Imported here so headless and batch runs never load Tk.
+        import tkinter as tk
+        from tkinter import simpledialog
+        if self.parent is None:
+            self.parent = tk.Tk()
+            self.parent.withdraw()  # Hide the root window
+        answer = simpledialog.askstring(title="Input Required", prompt=prompt, parent=self.parent)
+        return answer if answer is not None else ""
+
+class StdinInput(InputProvider):
+    """
+    Reads one line per answer from a text stream (sys.stdin by default).
+    The prompt goes to sys.stderr so it never mixes with the program's output.
+    At end of input the answer is an empty string.
+    """
+    def __init__(self, stream=None, prompt_stream=None):
+        self.stream = stream
+        self.prompt_stream = prompt_stream
+
+    def __call__(self, prompt=""):
+        if prompt:
+            prompt_stream = self.prompt_stream or sys.stderr
+            prompt_stream.write(str(prompt))
+            prompt_stream.flush()
+        return (self.stream or sys.stdin).readline().rstrip("\r\n")
+
+class ScriptedInput(InputProvider):
+    """
+    Answers from a fixed list, in order, and records the prompts it was asked.
+    Once the answers run out it returns `default`, or raises EOFError (as input()
+    does) when strict is set.
+    """
+    def __init__(self, answers, default="", strict=False):
+        self.answers = [str(answer) for answer in answers]
+        self.default = default
+        self.strict = strict
+        self.position = 0
+        self.prompts = []
+
+    @classmethod
+    def from_file(cls, path, **options):
+        """
+        Read the answers from a text file, one per line.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(file.read().splitlines(), **options)
+
+    def __call__(self, prompt=""):
+        self.prompts.append(prompt)
+        if self.position < len(self.answers):
+            self.position += 1
+            return self.answers[self.position - 1]
+        if self.strict:
+            raise EOFError("No more scripted input")
+        return self.default
+
+    @property
+    def remaining(self):
+        return len(self.answers) - self.position
+
+class CallbackInput(InputProvider):
+    """
+    Delegates every prompt to a function, e.g. one that asks another thread or a network client.
+    Answers are converted to strings; None becomes an empty string.
+    """
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, prompt=""):
+        answer = self.function(prompt)
+        return str(answer) if answer is not None else ""
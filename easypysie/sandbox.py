@@ -0,0 +1,269 @@
+# sandbox.py
+
+# Runs compiled programs in a pool of pre-forked worker processes that are
+# reused across jobs. Every job gets a CPU-time limit (RLIMIT_CPU), a
+# wall-clock timeout, a memory cap (RLIMIT_AS) and an output-size cap, and
+# comes back as a structured RunResult. A program that hangs or runs out of
+# memory only costs its own worker, which is replaced.
+
+import marshal
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .source_map import GENERATED_FILENAME, generated_line
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: limits other than the wall clock are skipped.
+    resource = None
+
+# Job outcomes.
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+CPU_LIMIT = "cpu_limit"
+MEMORY_LIMIT = "memory_limit"
+OUTPUT_LIMIT = "output_limit"
+CRASHED = "crashed"
+
+class RunResult:
+    """
+    The outcome of one sandboxed run.
+    status is one of ok, error, timeout, cpu_limit, memory_limit, output_limit or crashed;
+    peak_rss is the worker's peak resident set size in kilobytes at the end of the job
+    (None if unknown). The kernel only keeps a lifetime peak, so when the job did not
+    raise it, peak_rss is a peak left by an earlier job on the same worker and only an
+    upper bound for this one; rss_inherited is then True.
+    line is the generated Python line that was running when the job failed (None if unknown);
+    prompts are the prompts of the program's input() calls, in order.
+    """
+    __slots__ = ('status', 'stdout', 'error', 'elapsed', 'peak_rss', 'line', 'rss_inherited', 'prompts')
+
+    def __init__(self, status, stdout="", error=None, elapsed=0.0, peak_rss=None, line=None, rss_inherited=False,
+                 prompts=()):
+        self.status = status
+        self.stdout = stdout
+        self.error = error
+        self.elapsed = elapsed
+        self.peak_rss = peak_rss
+        self.line = line
+        self.rss_inherited = rss_inherited
+        self.prompts = prompts
+
+    @property
+    def ok(self):
+        return self.status == OK
+
+    def __repr__(self):
+        rss = f"<={self.peak_rss}" if self.rss_inherited else self.peak_rss
+        return (f"<RunResult {self.status} {self.elapsed * 1000:.1f} ms rss={rss} KB "
+                f"{len(self.stdout)} chars{f' error={self.error!r}' if self.error else ''}>")
+
+class CPULimitExceeded(Exception):
+    """
+    Raised inside a worker when a job uses up its CPU time.
+    """
+
+class OutputLimitExceeded(Exception):
+    """
+    Raised inside a worker when a job prints more than its output cap.
+    """
+
+def _raise_cpu_limit(signum, frame):
+    raise CPULimitExceeded("CPU time limit exceeded")
+
+def _peak_rss():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _run_job(code_bytes, inputs, cpu_seconds, output_chars):
+    """
+    Execute one marshalled code object inside a worker. Returns the result fields as a tuple.
+    """
+    output = []
+    written = [0]
+
+    def program_print(*args, sep=" ", end="\n", **kwargs):
+        text = sep.join(str(arg) for arg in args) + end
+        written[0] += len(text)
+        if written[0] > output_chars:
+            output.append(text[:max(0, output_chars - (written[0] - len(text)))])
+            raise OutputLimitExceeded(f"Output exceeded {output_chars} characters")
+        output.append(text)
+
+    answers = iter(inputs)
+    prompts = []
+
+    def program_input(prompt=""):
+        prompts.append(str(prompt))
+        return next(answers, "")
+
+    if resource is not None and cpu_seconds is not None:
+        # RLIMIT_CPU counts the whole process in whole seconds, so the limit is moved
+        # forward for every job, rounding up so a job never gets less than cpu_seconds.
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+    rss_before = _peak_rss()
+    start = time.perf_counter()
+    status, error, failure = OK, None, None
+    try:
+        exec(marshal.loads(code_bytes), {"print": program_print, "input": program_input})
+    except CPULimitExceeded as e:
+        status, error, failure = CPU_LIMIT, str(e), e
+    except MemoryError as e:
+        status, error, failure = MEMORY_LIMIT, "Memory limit exceeded", e
+    except OutputLimitExceeded as e:
+        status, error, failure = OUTPUT_LIMIT, str(e), e
+    except Exception as e:
+        status, error, failure = ERROR, f"{type(e).__name__}: {e}", e
+    elapsed = time.perf_counter() - start
+    # Only the generated line travels back; the job's SourceMap maps it to the source.
+    line = generated_line(failure.__traceback__) if failure is not None else None
+    peak_rss = _peak_rss()
+    # An unchanged lifetime peak was reached before this job started.
+    inherited = peak_rss is not None and peak_rss <= rss_before
+    return status, "".join(output), error, elapsed, peak_rss, line, inherited, prompts
+
+def _worker_main(connection, memory_bytes):
+    """
+    Worker process loop: apply the memory cap once, then run jobs until told to stop.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if resource is not None:
+        signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+        if memory_bytes is not None:
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        connection.send(_run_job(*job))
+
+class _Worker:
+    """
+    One pre-forked worker process and the parent's end of its pipe.
+    """
+    def __init__(self, context, memory_bytes):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection, memory_bytes), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def stop(self, kill=False):
+        try:
+            if kill:
+                self.process.kill()
+            else:
+                self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+class SandboxPool:
+    """
+    A pool of reusable worker processes for running compiled programs.
+    Limits: cpu_seconds of CPU time and wall_seconds of real time per job,
+    memory_bytes of address space per worker, output_chars characters of output per job.
+    Jobs can be run synchronously with run() or in parallel with submit()/map().
+    """
+    def __init__(self, workers=None, cpu_seconds=5, wall_seconds=10,
+                 memory_bytes=512 * 1024 * 1024, output_chars=64 * 1024):
+        self.size = workers or os.cpu_count() or 1
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_bytes = memory_bytes
+        self.output_chars = output_chars
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        self.closed = False
+        self.workers_started = 0
+        for _ in range(self.size):
+            self.idle.put(self._start_worker())
+        self.executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="sandbox")
+
+    def _start_worker(self):
+        with self.lock:
+            self.workers_started += 1
+        return _Worker(self.context, self.memory_bytes)
+
+    def run(self, code, inputs=()):
+        """
+        Run a compiled code object (or Python source) in a worker and return its RunResult.
+        inputs are the answers returned by the program's input() calls, in order.
+        """
+        if self.closed:
+            raise RuntimeError("SandboxPool is closed")
+        if isinstance(code, str):
+            code = compile(code, GENERATED_FILENAME, "exec")
+        job = (marshal.dumps(code), list(inputs), self.cpu_seconds, self.output_chars)
+        worker = self.idle.get()
+        start = time.perf_counter()
+        try:
+            worker.connection.send(job)
+            if worker.connection.poll(self.wall_seconds):
+                result = RunResult(*worker.connection.recv())
+            else:
+                # Hung or blocked: kill the worker and replace it.
+                worker.stop(kill=True)
+                worker = self._start_worker()
+                result = RunResult(TIMEOUT, "", f"Wall-clock limit of {self.wall_seconds} s exceeded",
+                                   time.perf_counter() - start)
+        except (EOFError, OSError) as e:
+            # The worker died, e.g. killed by the kernel for exceeding its limits.
+            worker.stop(kill=True)
+            result = RunResult(CRASHED, "", f"Worker exited with code {worker.process.exitcode}: {e}",
+                               time.perf_counter() - start)
+            worker = self._start_worker()
+        finally:
+            self.idle.put(worker)
+        return result
+
+    def submit(self, code, inputs=()):
+        """
+        Schedule a run on the pool. Returns a concurrent.futures.Future of its RunResult.
+        """
+        return self.executor.submit(self.run, code, inputs)
+
+    def map(self, codes):
+        """
+        Run many programs in parallel and return their RunResults in order.
+        """
+        return [future.result() for future in [self.submit(code) for code in codes]]
+
+    def close(self):
+        """
+        Stop every worker.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.executor.shutdown(wait=True)
+        for _ in range(self.size):
+            self.idle.get().stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
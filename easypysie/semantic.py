@@ -0,0 +1,498 @@
+# semantic.py
+
+from .ir import is_temp_name
+
+class Frame:
+    """
+    Slot layout of one scope: the global scope or one function.
+    Parameters come first, then the other names in order of first assignment,
+    then the IR temporaries generated for the scope.
+    """
+    __slots__ = ('name', 'params', 'slots', 'temps')
+
+    def __init__(self, name, params=()):
+        self.name = name
+        self.params = list(params)
+        # Slot index of every named variable.
+        self.slots = {}
+        # Dense index of every IR temporary, counted after the named slots.
+        self.temps = {}
+        for param in self.params:
+            self.add(param)
+
+    def add(self, name):
+        """
+        Give a name a slot if it has none yet, and return the slot.
+        """
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.slots)
+        return slot
+
+    def add_temp(self, temp):
+        """
+        Give an IR temporary the next slot after the named slots.
+        """
+        self.temps[temp] = len(self.temps)
+
+    def slot(self, operand):
+        """
+        Return the slot of a variable name or an IR temporary.
+        """
+        if type(operand) is int:
+            return len(self.slots) + self.temps[operand]
+        return self.slots[operand]
+
+    @property
+    def size(self):
+        return len(self.slots) + len(self.temps)
+
+    def __str__(self):
+        locals_count = len(self.slots) - len(self.params)
+        return (f"{self.name}: {len(self.params)} params, {locals_count} locals, "
+                f"{len(self.temps)} temps -> frame size {self.size}")
+
+class SemanticAnalyzer:
+    """
+    Holds the symbol and function tables for one compilation.
+    Each compile gets its own analyzer, so separate programs never share state.
+    """
+    def __init__(self):
+        # Symbol table for variable types.
+        self.symbol_table = {}
+        # Function table for function definitions.
+        self.function_table = {}
+        # Inferred return types keyed by (function name, argument types).
+        self.call_cache = {}
+        # Result types of binary operations keyed by id() of the AST node.
+        # A node seen with different types (e.g. in a function called with
+        # different argument types) is recorded as 'mixed'.
+        self.node_types = {}
+        # Every type each variable name is given anywhere in the program, and the
+        # '+' nodes whose recorded type selects a typed instruction (see fix_types()).
+        self.name_types = {}
+        self.plus_nodes = {}
+        # Slot layout of each scope: None for the global scope, else the function name.
+        self.frames = {}
+        # (scope, slot) of every variable read, assignment and input, keyed by id() of the AST node.
+        self.slots = {}
+
+    def record_type(self, node, node_type):
+        """
+        Attach an inferred type to an AST node.
+        """
+        key = id(node)
+        previous = self.node_types.get(key)
+        if previous is None:
+            self.node_types[key] = node_type
+        elif previous != node_type:
+            self.node_types[key] = 'mixed'
+
+    def set_global_type(self, name, var_type):
+        """
+        Record the type of a global variable. Function bodies may read globals, so
+        when a global changes type every cached call analysis is dropped.
+        """
+        previous = self.symbol_table.get(name)
+        if previous is not None and previous != var_type:
+            self.call_cache.clear()
+        self.symbol_table[name] = var_type
+
+    def note_type(self, name, var_type):
+        """
+        Remember a type a variable is given, in any scope.
+        """
+        types = self.name_types.get(name)
+        if types is None:
+            types = self.name_types[name] = set()
+        types.add(var_type)
+
+    def fix_types(self):
+        """
+        Analysis visits every statement once, so the type recorded for a '+' only holds
+        for the whole run if the variables it reads never change type (a loop may rebind
+        one after the '+' was analyzed). Each '+' that reads a variable given several
+        types, or calls a function while any variable is, is marked 'mixed'.
+        """
+        retyped = {name for name, types in self.name_types.items() if len(types) > 1}
+        if not retyped:
+            return
+        for key, node in self.plus_nodes.items():
+            if reads_any(node, retyped):
+                self.node_types[key] = 'mixed'
+
+    def analyze(self, node, local_scope=None):
+        """
+        Perform semantic analysis on the given AST node and return its type.
+        The result types of binary operations are recorded in node_types.
+        """
+        node_type = self.check(node, local_scope)
+        if node[0] == 'binop':
+            self.record_type(node, node_type)
+            if node[1] == '+':
+                self.plus_nodes[id(node)] = node
+        return node_type
+
+    def resolve(self, node, scope=None, assigned=None):
+        """
+        Resolve every variable to a slot in its scope's Frame.
+        In a function, parameters and assigned names are locals and every other
+        name refers to the global scope, as in the generated Python.
+        """
+        node_type = node[0]
+        if node_type == 'program':
+            self.frames[None] = Frame("<global>")
+            for stmt in node[1]:
+                self.resolve(stmt, None, None)
+        elif node_type in ('assign', 'input'):
+            self.slots[id(node)] = (scope, self.frames[scope].add(node[1]))
+            if node[2] is not None:
+                self.resolve(node[2], scope, assigned)
+        elif node_type == 'var':
+            var_scope = scope if assigned is not None and node[1] in assigned else None
+            self.slots[id(node)] = (var_scope, self.frames[var_scope].add(node[1]))
+        elif node_type == 'function':
+            frame = self.frames[node[1]] = Frame(node[1], node[2])
+            names = set(node[2])
+            for name in assigned_names(node[3]):
+                frame.add(name)
+                names.add(name)
+            for stmt in node[3]:
+                self.resolve(stmt, node[1], names)
+        elif node_type in ('binop', 'logic'):
+            self.resolve(node[2], scope, assigned)
+            self.resolve(node[3], scope, assigned)
+        elif node_type in ('not', 'print', 'return', 'expr'):
+            self.resolve(node[1], scope, assigned)
+        elif node_type == 'call':
+            for arg in node[2]:
+                self.resolve(arg, scope, assigned)
+        elif node_type in ('ifelse', 'while', 'repeat'):
+            self.resolve(node[1], scope, assigned)
+            for block in node[2:]:
+                for stmt in block:
+                    self.resolve(stmt, scope, assigned)
+
+    def check(self, node, local_scope=None):
+        """
+        Perform semantic analysis on the given AST node.
+        Ensures type correctness and validates variable/function usage.
+        """
+        # Helper function to look up a variable in local or global scope.
+        def lookup(var):
+            """
+            Look up a variable in the local scope first, then global scope.
+            Raises an error if the variable is not found.
+            """
+            if local_scope and var in local_scope:
+                return local_scope[var]
+            elif var in self.symbol_table:
+                return self.symbol_table[var]
+            else:
+                raise NameError(f"Oops! You forgot to create the variable '{var}' before using it.")
+
+        node_type = node[0]
+
+        # Handle the program node (list of statements).
+        if node_type == 'program':
+            """
+            Process a program node, which contains a list of statements.
+            """
+            for stmt in node[1]:
+                self.analyze(stmt, local_scope)
+            if local_scope is None:
+                self.fix_types()
+                self.resolve(node)
+            return None
+
+        # Handle variable assignment.
+        elif node_type == 'assign':
+            """
+            Process an assignment node, assigning a value to a variable.
+            """
+            var_name = check_name(node[1])
+            expr_type = self.analyze(node[2], local_scope)
+            self.note_type(var_name, expr_type)
+            if local_scope is not None:
+                local_scope[var_name] = expr_type
+            else:
+                self.set_global_type(var_name, expr_type)
+            return expr_type
+
+        # Handle binary operations (e.g., +, -, *, /).
+        elif node_type == 'binop':
+            """
+            Process a binary operation node, ensuring type correctness.
+            """
+            operator = node[1]
+            left_type = self.analyze(node[2], local_scope)
+            right_type = self.analyze(node[3], local_scope)
+
+            # A recursive call's result is not known yet; take the type from the other side.
+            if 'unknown' in (left_type, right_type):
+                if operator in ('==', '!=', '<', '>', '<=', '>=', '&&', '||'):
+                    return 'bool'
+                other_type = right_type if left_type == 'unknown' else left_type
+                allowed = ('int', 'float', 'unknown', 'string') if operator == '+' else ('int', 'float', 'unknown')
+                if other_type not in allowed:
+                    raise TypeError(f"Oops! You can only use numbers with '{operator}'. Got types {left_type} and {right_type}.")
+                return other_type
+
+            if operator == '+':  # Handle addition or string concatenation
+                if left_type == "string" or right_type == "string":
+                    if left_type not in ("string", "int", "float") or right_type not in ("string", "int", "float"):
+                        raise TypeError(f"Oops! You can only use numbers or strings with '{operator}'.")
+                    return "string"
+                elif left_type in ('int', 'float') and right_type in ('int', 'float'):
+                    return 'float' if 'float' in (left_type, right_type) else 'int'
+                else:
+                    raise TypeError(f"Oops! You can only use numbers or strings with '{operator}'.")
+            elif operator in ('-', '*', '/'):
+                if left_type not in ('int', 'float') or right_type not in ('int', 'float'):
+                    raise TypeError(f"Oops! You can only use numbers with '{operator}'. Got types {left_type} and {right_type}.")
+                return 'float' if left_type == 'float' or right_type == 'float' else 'int'
+            elif operator in ('==', '!=', '<', '>', '<=', '>='):
+                if left_type != right_type:
+                    raise TypeError(f"Comparison '{operator}' requires operands of the same type")
+                return 'bool'
+            elif operator in ('&&', '||'):
+                if left_type != 'bool' or right_type != 'bool':
+                    raise TypeError(f"Logical operator '{operator}' requires boolean operands")
+                return 'bool'
+            else:
+                raise NotImplementedError(f"Unknown operator: {operator}")
+
+        # Handle logical operations (e.g., &&, ||).
+        elif node_type == 'logic':
+            """
+            Process a logical operation node, ensuring boolean operands.
+            """
+            operator = node[1]
+            left_type = self.analyze(node[2], local_scope)
+            right_type = self.analyze(node[3], local_scope)
+            if operator in ('&&', '||'):
+                if left_type != 'bool' or right_type != 'bool':
+                    raise TypeError(f"Logical operator '{operator}' requires boolean operands, got {left_type} and {right_type}")
+                return 'bool'
+
+        # Handle number literals.
+        elif node_type == 'number':
+            """
+            Process a number literal node, returning its type as 'int'.
+            """
+            return 'int'  # Assuming number literals are integers
+
+        # Handle float literals.
+        elif node_type == 'float':
+            """
+            Process a float literal node, returning its type as 'float'.
+            """
+            return 'float'
+
+        # Handle string literals.
+        elif node_type == 'string':
+            """
+            Process a string literal node, returning its type as 'string'.
+            """
+            return 'string'
+
+        # Handle variable usage.
+        elif node_type == 'var':
+            """
+            Process a variable node, looking up its type in the symbol table.
+            """
+            var_name = node[1]
+            return lookup(var_name)
+
+        # Handle expressions.
+        elif node_type == 'expr':
+            """
+            Process an expression node, evaluating its type.
+            """
+            return self.analyze(node[1], local_scope)
+
+        # Handle print statements.
+        elif node_type == 'print':
+            """
+            Process a print statement node, ensuring the value can be printed.
+            """
+            expr_type = self.analyze(node[1], local_scope)
+            if expr_type not in ('int', 'float', 'string', 'bool', 'unknown'):
+                raise TypeError(f"Cannot print value of type {expr_type}")
+            return None
+
+        # Handle NOT logical operation.
+        elif node_type == 'not':
+            """
+            Process a NOT operation node, ensuring the operand is boolean.
+            """
+            expr_type = self.analyze(node[1], local_scope)
+            if expr_type != 'bool':
+                raise TypeError(f"NOT operation requires boolean, got {expr_type}")
+            return 'bool'
+    
+        # Handle if-else statements.
+        elif node_type == 'ifelse':
+            """
+            Process an if-else statement node, validating the condition and statements.
+            """
+            condition_type = self.analyze(node[1], local_scope)
+            if condition_type not in ('int', 'bool'):
+                raise Exception("Condition in 'check' must evaluate to an integer or boolean.")
+            for stmt in node[2]:
+                self.analyze(stmt, local_scope)
+            if len(node) > 3:
+                for stmt in node[3]:
+                    self.analyze(stmt, local_scope)
+            return None
+
+        # Handle input statements.
+        elif node_type == 'input':
+            """
+            Process an input statement node, assigning a string type to the variable.
+            """
+            var_name = check_name(node[1])
+            self.note_type(var_name, 'string')
+            if local_scope is not None:
+                local_scope[var_name] = 'string'
+            else:
+                self.set_global_type(var_name, 'string')
+            return 'string'
+    
+        # Handle while loops.
+        elif node_type == 'while':
+            """
+            Process a while loop node, validating the condition and loop body.
+            """
+            condition_type = self.analyze(node[1], local_scope)
+            if condition_type not in ('bool', 'int'):
+                raise TypeError("Condition in 'keep' must evaluate to a boolean or integer.")
+            for stmt in node[2]:
+                self.analyze(stmt, local_scope)
+            return None
+
+        # Handle function declarations.
+        elif node_type == 'function':
+            """
+            Process a function declaration node, storing its definition in the function table.
+            """
+            func_name = check_name(node[1])
+            params = [check_name(param) for param in node[2]]
+            body = node[3]
+            # The body is only checked when called; its names are checked here too.
+            for name in assigned_names(body):
+                check_name(name)
+            if func_name in self.function_table:
+                raise NameError(f"Oops! The function '{func_name}' is already defined.")
+            self.function_table[func_name] = {
+                "params": params,
+                "body": body
+            }
+            return None
+
+        # Handle function calls.
+        elif node_type == 'call':
+            """
+            Process a function call node, validating arguments and checking the function body.
+            Results are cached per argument types until a global changes type (see
+            set_global_type()); a recursive call yields 'unknown'.
+            """
+            func_name = node[1]
+            args = node[2]
+            if func_name not in self.function_table:
+                raise NameError(f"Oops! You tried to call the function '{func_name}', but it is not defined.")
+            func_def = self.function_table[func_name]
+            if len(args) != len(func_def["params"]):
+                raise TypeError(f"Oops! The function '{func_name}' expects {len(func_def['params'])} arguments, but got {len(args)}.")
+            arg_types = tuple(self.analyze(arg, local_scope) for arg in args)
+            # Each body is analyzed at most once per distinct argument-type tuple.
+            signature = (func_name, arg_types)
+            if signature in self.call_cache:
+                # Either a finished result, or 'unknown' while a recursive call is still being analyzed.
+                return self.call_cache[signature]
+            self.call_cache[signature] = 'unknown'
+            local_call_scope = {}
+            for param, arg_type in zip(func_def["params"], arg_types):
+                local_call_scope[param] = arg_type
+                self.note_type(param, arg_type)
+            ret_type = None
+            for stmt in func_def["body"]:
+                # If a return statement is found, capture its type.
+                if stmt[0] == 'return':
+                    ret_type = self.analyze(stmt, local_call_scope)
+                    break
+                else:
+                    self.analyze(stmt, local_call_scope)
+            if ret_type is None:
+                ret_type = 'void'
+            self.call_cache[signature] = ret_type
+            return ret_type
+
+        # Handle return statements.
+        elif node_type == 'return':
+            """
+            Process a return statement node, evaluating the return value type.
+            """
+            expr_type = self.analyze(node[1], local_scope)
+            return expr_type
+    
+        # Handle repeat loops.
+        elif node_type == 'repeat':
+            """
+            Process a repeat loop node, ensuring the count is an integer.
+            """
+            count_type = self.analyze(node[1], local_scope)
+            if count_type != 'int':
+                raise TypeError(f"Repeat count must be an integer, got {count_type}")
+            for stmt in node[2]:
+                self.analyze(stmt, local_scope)
+            return None
+
+        # Raise an error for unsupported node types.
+        else:
+            raise NotImplementedError(f"Semantic analysis not implemented for node type: {node_type}")
+
+def check_name(name):
+    """
+    Return a name the program defines, unless it is reserved for compiler temporaries.
+    """
+    if is_temp_name(name):
+        raise NameError(f"Oops! The name '{name}' is kept for the compiler's own use. Please pick another name.")
+    return name
+
+def reads_any(node, names):
+    """
+    Return True if an expression reads one of the names, or calls a function
+    (whose result may depend on them).
+    """
+    kind = node[0]
+    if kind == 'var':
+        return node[1] in names
+    if kind == 'call':
+        return True
+    if kind in ('binop', 'logic'):
+        return reads_any(node[2], names) or reads_any(node[3], names)
+    if kind == 'not':
+        return reads_any(node[1], names)
+    return False
+
+def assigned_names(statements):
+    """
+    Return the names assigned by a block, in order of first assignment.
+    Nested blocks are included; nested function bodies are not.
+    """
+    names = []
+    for stmt in statements:
+        kind = stmt[0]
+        if kind in ('assign', 'input') and stmt[1] not in names:
+            names.append(stmt[1])
+        elif kind in ('ifelse', 'while', 'repeat'):
+            for block in stmt[2:]:
+                names.extend(name for name in assigned_names(block) if name not in names)
+    return names
+
+def semantic_analysis(node, local_scope=None):
+    """
+    Perform semantic analysis on the given AST node with a fresh analyzer.
+    """
+    return SemanticAnalyzer().analyze(node, local_scope)
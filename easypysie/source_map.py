@@ -0,0 +1,70 @@
+# source_map.py
+
+# Source maps from generated Python back to EasyPysie source lines. The parser
+# records a (line, column, end line) span for every AST node it builds, the IR
+# generator copies the span of each statement onto the instructions it emits,
+# and the code generator pairs every generated Python line with the source line
+# of the instruction it came from. The table is one unsigned int per generated
+# line and is only consulted after the fact, so running the program costs nothing extra.
+
+from array import array
+
+# File name of generated Python code objects; frames with this name are running program code.
+GENERATED_FILENAME = "<easypysie>"
+
+class SourceMap:
+    """
+    The EasyPysie source line of every generated Python line. lines[0] belongs to
+    generated line 1; 0 marks a line with no source counterpart (e.g. `def __main__():`).
+    """
+    __slots__ = ('lines',)
+
+    def __init__(self, lines=()):
+        self.lines = lines if isinstance(lines, array) else array('I', lines)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def source_line(self, generated_line):
+        """
+        Return the source line of a 1-based generated Python line, or None if it has none.
+        """
+        if 0 < generated_line <= len(self.lines):
+            return self.lines[generated_line - 1] or None
+        return None
+
+    def error_line(self, error):
+        """
+        Return the source line an exception raised by the program came from, or None.
+        """
+        line = generated_line(error.__traceback__)
+        return self.source_line(line) if line is not None else None
+
+    def to_bytes(self):
+        return self.lines.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        lines = array('I')
+        lines.frombytes(data)
+        return cls(lines)
+
+    def __repr__(self):
+        return f"<SourceMap {len(self.lines)} lines>"
+
+def generated_line(tb):
+    """
+    Return the generated Python line of the innermost program frame in a traceback, or None.
+    """
+    line = None
+    while tb is not None:
+        if tb.tb_frame.f_code.co_filename == GENERATED_FILENAME:
+            line = tb.tb_lineno
+        tb = tb.tb_next
+    return line
+
+def error_location(line):
+    """
+    Format a source line for an error message: " (line N)", or "" when it is unknown.
+    """
+    return f" (line {line})" if line else ""
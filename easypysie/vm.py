@@ -0,0 +1,324 @@
+# vm.py
+
+# Register-based virtual machine that executes the typed IR directly, without
+# turning it back into Python source. Loading a program resolves every label
+# to an instruction index and every variable, temporary and constant to a slot
+# in a per-function register array; execution then dispatches on small integer
+# instruction kinds. An instruction budget stops runaway loops cleanly.
+
+import operator
+from array import array
+from .ir import Op, Const, uses
+from .cfg import TERMINATORS, match_functions
+
+# Default number of instructions a program may execute.
+DEFAULT_BUDGET = 10_000_000
+
+# Instruction kinds of the decoded program, roughly in order of frequency.
+BINARY, COPY, TICK, IF_FALSE, GOTO, LOOP, REPEAT, CALL, RETURN, NOT, PRINT, INPUT, GLOAD, END = range(14)
+
+# Dispatch table: the Python operation behind each binary opcode.
+BINARY_FUNCTIONS = {
+    Op.ADD: operator.add,
+    Op.SUB: operator.sub,
+    Op.MUL: operator.mul,
+    Op.DIV: operator.truediv,
+    Op.CONCAT: lambda a, b: str(a) + str(b),
+    Op.ADD_ANY: lambda a, b: str(a) + str(b) if isinstance(a, str) or isinstance(b, str) else a + b,
+    Op.EQ: operator.eq,
+    Op.NE: operator.ne,
+    Op.LT: operator.lt,
+    Op.GT: operator.gt,
+    Op.LE: operator.le,
+    Op.GE: operator.ge,
+    Op.AND: lambda a, b: a and b,
+    Op.OR: lambda a, b: a or b,
+}
+
+class InstructionBudgetExceeded(RuntimeError):
+    """
+    Raised when a program executes more instructions than its budget allows.
+    """
+
+class Function:
+    """
+    A loaded function: decoded instructions plus the register template a call starts from.
+    Constants are preloaded into their slots in the template. lines holds the source
+    line of every decoded instruction (0 if unknown), for error reports.
+    """
+    __slots__ = ('name', 'params', 'code', 'lines', 'template', 'slots')
+
+    def __init__(self, name, params):
+        self.name = name
+        self.params = params
+        self.code = []
+        self.lines = array('I')
+        self.template = []
+        # Slot index of every variable, temporary and constant.
+        self.slots = {}
+
+    def slot(self, operand):
+        """
+        Return the register slot for an operand, allocating it on first use.
+        """
+        index = self.slots.get(operand)
+        if index is None:
+            index = self.slots[operand] = len(self.template)
+            self.template.append(operand.value if type(operand) is Const else None)
+        return index
+
+    def __repr__(self):
+        return f"<Function {self.name}({', '.join(self.params)}) {len(self.code)} instrs {len(self.template)} slots>"
+
+class Program:
+    """
+    A loaded program: the top-level code (run in the global frame) and its functions by name.
+    """
+    def __init__(self, main, functions):
+        self.main = main
+        self.functions = functions
+
+    def __len__(self):
+        return len(self.main.code) + sum(len(function.code) for function in self.functions.values())
+
+def load_program(ir_code, frames=None):
+    """
+    Decode the IR into a Program. Every function, including nested ones, is
+    loaded as a program-level function. With the frames resolved by the
+    semantic pass, each register array starts with exactly that frame's
+    layout (variables, then temporaries) and constants follow it.
+    """
+    function_ends = match_functions(ir_code)
+    # Instructions of each region: the top level first, then every function.
+    regions = {None: []}
+    owners = [None]
+    for instr in ir_code:
+        if instr.op == Op.FUNC:
+            owners.append(instr.a)
+            regions[instr.a] = [instr]
+            continue
+        regions[owners[-1]].append(instr)
+        if instr.op == Op.END_FUNC:
+            owners.pop()
+
+    frames = frames or {}
+    main = Function("__main__", [])
+    preallocate(main, frames.get(None))
+    load_code(main, regions.pop(None), None)
+    functions = {}
+    for name, instrs in regions.items():
+        function = functions[name] = Function(name, list(instrs[0].args))
+        preallocate(function, frames.get(name))
+        load_code(function, instrs[1:], main)
+    return Program(main, functions)
+
+def preallocate(function, frame):
+    """
+    Lay out a function's registers in the order of its resolved Frame, if there is one.
+    """
+    if frame is None:
+        return
+    for name in frame.slots:
+        function.slot(name)
+    for temp in frame.temps:
+        function.slot(temp)
+
+def load_code(function, instrs, main):
+    """
+    Decode a function body (or the top-level code when main is None) into function.code.
+    """
+    code = function.code
+    for param in function.params:
+        function.slot(param)
+
+    if main is not None:
+        # A function cannot assign a global (assignment makes the name local) and no
+        # top-level code runs during a call, so globals are read once on entry.
+        assigned = set(function.params)
+        assigned.update(instr.dest for instr in instrs if type(instr.dest) is str)
+        global_names = []
+        for instr in instrs:
+            for operand in uses(instr):
+                if type(operand) is str and operand not in assigned and operand not in global_names:
+                    global_names.append(operand)
+        for name in global_names:
+            code.append((GLOAD, function.slot(name), main.slot(name), None, None))
+            function.lines.append(0)
+
+    # Decode, starting every straight-line run with a TICK that charges the budget.
+    # A TICK is attributed to the first instruction of its run.
+    decoded = []
+    lines = function.lines
+    labels = {}
+    leader = True
+    for instr in instrs:
+        if instr.op == Op.LABEL:
+            labels[instr.a] = len(code) + len(decoded)
+            leader = True
+            continue
+        if leader:
+            decoded.append([TICK, 0, None, None, None])
+            lines.append(instr.line)
+            leader = False
+        decoded.append(decode(instr, function.slot))
+        lines.append(instr.line)
+        if instr.op in TERMINATORS:
+            leader = True
+    decoded.append([END, None, None, None, None])
+    lines.append(0)
+
+    # Resolve labels to instruction indices and count the instructions of each run.
+    tick = None
+    for entry in decoded:
+        kind = entry[0]
+        if kind == TICK:
+            tick = entry
+        elif tick is not None:
+            tick[1] += 1
+        if kind in (IF_FALSE, REPEAT, LOOP):
+            entry[3] = labels[entry[3]]
+        elif kind == GOTO:
+            entry[2] = labels[entry[2]]
+    code.extend(tuple(entry) for entry in decoded)
+
+def decode(instr, slot):
+    """
+    Decode one IR instruction into [kind, dest, a, b, extra] with operands as slot indices.
+    Label operands are left as label ids and resolved afterwards.
+    """
+    op = instr.op
+    if op in BINARY_FUNCTIONS:
+        return [BINARY, slot(instr.dest), slot(instr.a), slot(instr.b), BINARY_FUNCTIONS[op]]
+    elif op == Op.COPY:
+        return [COPY, slot(instr.dest), slot(instr.a), None, None]
+    elif op == Op.IF_FALSE:
+        return [IF_FALSE, None, slot(instr.a), instr.b, None]
+    elif op == Op.GOTO:
+        return [GOTO, None, instr.a, None, None]
+    elif op == Op.REPEAT:
+        return [REPEAT, slot(instr.dest), slot(instr.a), instr.b, None]
+    elif op == Op.LOOP:
+        return [LOOP, slot(instr.dest), slot(instr.a), instr.b, None]
+    elif op == Op.CALL:
+        return [CALL, slot(instr.dest), instr.a, None, tuple(slot(arg) for arg in instr.args)]
+    elif op == Op.RETURN:
+        return [RETURN, None, slot(instr.a), None, None]
+    elif op == Op.END_FUNC:
+        return [END, None, None, None, None]
+    elif op == Op.NOT:
+        return [NOT, slot(instr.dest), slot(instr.a), None, None]
+    elif op == Op.PRINT:
+        return [PRINT, None, slot(instr.a), None, None]
+    elif op == Op.INPUT:
+        return [INPUT, slot(instr.dest), slot(instr.a), None, None]
+    raise ValueError(f"The VM cannot execute IR opcode: {op}")
+
+class VirtualMachine:
+    """
+    Executes a loaded Program. print_function and input_function stand in for
+    the program's say() and ask(); budget bounds the number of instructions run.
+    """
+    def __init__(self, program, budget=DEFAULT_BUDGET, print_function=print, input_function=input):
+        self.program = program
+        self.budget = budget
+        self.remaining = budget
+        self.print_function = print_function
+        self.input_function = input_function
+        self.globals = None
+        # Source line of the instruction that raised, set when an error leaves the program.
+        self.error_line = None
+
+    @property
+    def executed(self):
+        """
+        Number of instructions executed so far.
+        """
+        return self.budget - self.remaining
+
+    def run(self):
+        """
+        Run the top-level code. Returns the global registers.
+        """
+        main = self.program.main
+        self.globals = list(main.template)
+        self.execute(main, self.globals)
+        return self.globals
+
+    def call(self, name, args):
+        """
+        Call a program function with already evaluated arguments.
+        """
+        function = self.program.functions.get(name)
+        if function is None:
+            raise NameError(f"name '{name}' is not defined")
+        if len(args) != len(function.params):
+            raise TypeError(f"{name}() takes {len(function.params)} arguments but {len(args)} were given")
+        regs = list(function.template)
+        regs[:len(args)] = args
+        return self.execute(function, regs)
+
+    def execute(self, function, regs):
+        """
+        The interpreter loop: run one function activation over its register array.
+        """
+        code = function.code
+        global_regs = self.globals
+        remaining = self.remaining
+        pc = 0
+        try:
+            while True:
+                kind, dest, a, b, extra = code[pc]
+                pc += 1
+                if kind == BINARY:
+                    regs[dest] = extra(regs[a], regs[b])
+                elif kind == COPY:
+                    regs[dest] = regs[a]
+                elif kind == TICK:
+                    remaining -= dest
+                    if remaining < 0:
+                        raise InstructionBudgetExceeded(f"Program exceeded its budget of {self.budget} instructions")
+                elif kind == IF_FALSE:
+                    if not regs[a]:
+                        pc = b
+                elif kind == GOTO:
+                    pc = a
+                elif kind == LOOP:
+                    count = regs[dest] + 1
+                    regs[dest] = count
+                    if count < regs[a]:
+                        pc = b
+                elif kind == REPEAT:
+                    regs[dest] = 0
+                    if not 0 < regs[a]:
+                        pc = b
+                elif kind == CALL:
+                    self.remaining = remaining
+                    regs[dest] = self.call(a, [regs[arg] for arg in extra])
+                    remaining = self.remaining
+                elif kind == RETURN:
+                    return regs[a]
+                elif kind == NOT:
+                    regs[dest] = not regs[a]
+                elif kind == PRINT:
+                    self.print_function(regs[a])
+                elif kind == INPUT:
+                    regs[dest] = self.input_function(regs[a])
+                elif kind == GLOAD:
+                    regs[dest] = global_regs[a]
+                else:
+                    return None
+        except Exception:
+            # The innermost activation records the line; callers see it already set.
+            if self.error_line is None:
+                self.error_line = function.lines[pc - 1] or None
+            raise
+        finally:
+            self.remaining = remaining
+
+def run_ir(ir_code, budget=DEFAULT_BUDGET, print_function=print, input_function=input):
+    """
+    Load and run IR in a fresh VirtualMachine. Returns the machine.
+    """
+    machine = VirtualMachine(load_program(ir_code), budget, print_function, input_function)
+    machine.run()
+    return machine